@@ -1,4 +1,4 @@
-from flask import Flask, render_template
+from flask import Flask, render_template, request
 
 from flask_cors import CORS
 from flask_talisman import Talisman
@@ -14,8 +14,14 @@ from infra.environment import (
 )
 from infra.database import db
 from infra.db_config import config_by_name
+from infra.db_router import check_sqlite_pragmas, close_all_sessions
+from infra.json_provider import FastJSONProvider
+from infra.logging import logger
+from infra.query_stats import finish_request_query_stats, start_request_query_stats
 
 app = Flask(__name__)
+# orjson backed jsonify/request.get_json, stdlib json when orjson is missing.
+app.json = FastJSONProvider(app)
 
 CORS(app)
 csrf = CSRFProtect()
@@ -48,6 +54,21 @@ def get_users():
 # app.config.from_object(Config)
 
 
+@app.before_request
+def start_query_stats():
+    start_request_query_stats()
+
+
+@app.after_request
+def add_query_stats(response):
+    return finish_request_query_stats(request, response)
+
+
+@app.teardown_appcontext
+def remove_db_sessions(exception=None):
+    close_all_sessions()
+
+
 @app.route("/")
 @app.route("/index")
 def index():
@@ -68,9 +89,21 @@ with app.app_context():
 
     from web.blueprints.entity_routes import entity_route
     from web.blueprints.authentication_routes import auth_route
+    from web.blueprints.monitoring_routes import monitoring_route
 
     app.register_blueprint(entity_route, url_prefix="/api")
     app.register_blueprint(auth_route, url_prefix="/authenticate")
+    app.register_blueprint(monitoring_route, url_prefix="/monitoring")
+
+    from infra.migrations import get_pending_revisions
+
+    pending_revisions = get_pending_revisions(db.engine)
+    if pending_revisions:
+        logger.warning(
+            f"Pending schema migrations {pending_revisions}, run "
+            "`python -m infra.migrations upgrade` from the code directory"
+        )
+    check_sqlite_pragmas()
     # app.register_blueprint(entity_route, url_prefix="/dashboard")
     # app.register_blueprint(entity_route, url_prefix="/admin")
 
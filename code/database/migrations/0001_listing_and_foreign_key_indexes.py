@@ -0,0 +1,79 @@
+description = "Listing and foreign key indexes"
+
+# Entity table -> primary key column.
+ENTITY_TABLES = {
+    "user": "user_id",
+    "address_book": "address_book_id",
+    "cart": "cart_id",
+    "order": "order_id",
+    "review": "review_id",
+    "audit_log": "audit_log_id",
+    "order_item": "order_item_id",
+    "payment": "payment_id",
+    "shipping": "shipping_id",
+    "coupon": "coupon_id",
+    "cart_item": "cart_item_id",
+    "product_inventory": "product_inventory_id",
+    "product_image": "product_image_id",
+    "product": "product_id",
+    "category": "category_id",
+    "brand": "brand_id",
+}
+FOREIGN_KEY_COLUMNS = {
+    "address_book": ["user_id"],
+    "cart": ["user_id"],
+    "order": ["user_id", "shipping_address_id", "billing_address_id"],
+    "review": ["user_id", "product_id"],
+    "audit_log": ["user_id"],
+    "order_item": ["order_id", "product_id"],
+    "payment": ["order_id"],
+    "shipping": ["order_id"],
+    "cart_item": ["cart_id", "product_id"],
+    "product_inventory": ["product_id"],
+    "product_image": ["product_id"],
+    "product": ["brand_id", "category_id"],
+    "category": ["parent_category_id"],
+}
+
+
+def _get_indexes(migrator):
+    indexes = []
+    for table_name, column_names in FOREIGN_KEY_COLUMNS.items():
+        for column_name in column_names:
+            indexes.append(
+                (table_name, f"ix_{table_name}_{column_name}", [column_name], None)
+            )
+    for table_name, id_column_name in ENTITY_TABLES.items():
+        if migrator.supports_partial_indexes:
+            indexes.append(
+                (
+                    table_name,
+                    f"ix_{table_name}_live_created_at",
+                    ["created_at", id_column_name],
+                    "deleted_by IS NULL",
+                )
+            )
+        else:
+            indexes.append(
+                (
+                    table_name,
+                    f"ix_{table_name}_deleted_by_created_at",
+                    ["deleted_by", "created_at", id_column_name],
+                    None,
+                )
+            )
+    indexes.append(
+        ("audit_log", "ix_audit_log_entity", ["entity_type", "entity_id"], None)
+    )
+    return indexes
+
+
+def up(migrator):
+    for table_name, index_name, column_names, where in _get_indexes(migrator):
+        migrator.create_index(table_name, index_name, column_names, where=where)
+
+
+def down(migrator):
+    # On MySQL drop_index keeps the foreign key indexes InnoDB still needs.
+    for table_name, index_name, _, _ in reversed(_get_indexes(migrator)):
+        migrator.drop_index(table_name, index_name)
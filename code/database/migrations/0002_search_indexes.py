@@ -0,0 +1,90 @@
+from sqlalchemy import inspect
+
+description = "Full-text search indexes"
+
+# Entity table -> (primary key column, searchable columns), the search_columns
+# of the models when this migration was written.
+SEARCH_TABLES = {
+    "user": ("user_id", ["username", "name", "email", "contact_number"]),
+    "address_book": (
+        "address_book_id",
+        ["address_line1", "address_line2", "city", "state", "country", "zip_code"],
+    ),
+    "audit_log": ("audit_log_id", ["entity_type", "entity_id", "action"]),
+    "brand": ("brand_id", ["name", "description"]),
+    "category": ("category_id", ["name", "slug", "description"]),
+    "coupon": ("coupon_id", ["code"]),
+    "order": ("order_id", ["order_number", "payment_status", "order_status"]),
+    "payment": ("payment_id", ["payment_method", "payment_reference", "status"]),
+    "product": ("product_id", ["name", "slug", "description", "sku"]),
+    "product_image": ("product_image_id", ["alt_text", "image_url"]),
+    "product_inventory": ("product_inventory_id", ["warehouse_location"]),
+    "review": ("review_id", ["comment"]),
+    "shipping": ("shipping_id", ["courier_name", "tracking_number", "status"]),
+}
+
+
+def up(migrator):
+    for table_name, (id_column_name, search_columns) in SEARCH_TABLES.items():
+        if migrator.dialect_name == "sqlite":
+            _create_sqlite_search_index(
+                migrator, table_name, id_column_name, search_columns
+            )
+        elif migrator.dialect_name == "mysql":
+            index_name = f"ft_{table_name}_search"
+            if not migrator.has_index(table_name, index_name):
+                # InnoDB builds FULLTEXT indexes in place but not with LOCK=NONE.
+                migrator.execute(
+                    f"ALTER TABLE {migrator.quote(table_name)} ADD FULLTEXT INDEX "
+                    f"{migrator.quote(index_name)} ("
+                    + ", ".join(migrator.quote(column) for column in search_columns)
+                    + ")"
+                )
+
+
+def down(migrator):
+    for table_name in reversed(list(SEARCH_TABLES)):
+        if migrator.dialect_name == "sqlite":
+            migrator.execute(f'DROP TABLE IF EXISTS "{table_name}_fts"')
+            migrator.execute(f'DROP TABLE IF EXISTS "{table_name}_fts_keys"')
+        elif migrator.dialect_name == "mysql":
+            migrator.drop_index(table_name, f"ft_{table_name}_search")
+
+
+def _create_sqlite_search_index(migrator, table_name, id_column_name, search_columns):
+    # An fts5 table holding search_key and the searchable columns, its rows
+    # stored under the fts_rowid of <table>_fts_keys so writes find them by
+    # rowid. Tables of an earlier layout are dropped and built again.
+    search_table = f"{table_name}_fts"
+    key_table = f"{table_name}_fts_keys"
+    if migrator.has_table(search_table) and migrator.has_table(key_table):
+        fts_columns = [
+            column["name"] for column in inspect(migrator.engine).get_columns(search_table)
+        ]
+        if fts_columns == ["search_key", *search_columns]:
+            return
+    migrator.execute(f'DROP TABLE IF EXISTS "{search_table}"')
+    migrator.execute(f'DROP TABLE IF EXISTS "{key_table}"')
+    indexed_columns = ", ".join(f'"{column}"' for column in search_columns)
+    migrator.execute(
+        f'CREATE VIRTUAL TABLE "{search_table}" USING fts5('
+        f"search_key UNINDEXED, {indexed_columns}, "
+        "tokenize = 'unicode61', prefix = '2 3')"
+    )
+    migrator.execute(
+        f'CREATE TABLE "{key_table}" (fts_rowid INTEGER PRIMARY KEY, '
+        "search_key VARCHAR(255) NOT NULL UNIQUE)"
+    )
+    migrator.execute(
+        f'INSERT INTO "{key_table}" (search_key) '
+        f'SELECT "{id_column_name}" FROM "{table_name}"'
+    )
+    source_columns = ", ".join(
+        f"""COALESCE(CAST(entity."{column}" AS TEXT), '')""" for column in search_columns
+    )
+    migrator.execute(
+        f'INSERT INTO "{search_table}" (rowid, search_key, {indexed_columns}) '
+        f"SELECT search_key.fts_rowid, search_key.search_key, {source_columns} "
+        f'FROM "{table_name}" AS entity JOIN "{key_table}" AS search_key '
+        f'ON search_key.search_key = entity."{id_column_name}"'
+    )
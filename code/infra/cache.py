@@ -0,0 +1,170 @@
+import fnmatch
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from infra.logging import logger
+
+
+class TTLCache:
+    """Thread safe in-process LRU cache whose entries expire after `ttl` seconds.
+
+    Args:
+        maxsize (int): entries kept, the least recently used one is evicted.
+        ttl (float): seconds an entry stays valid, 0 or less disables caching.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key, self._MISSING)
+            if entry is not self._MISSING:
+                value, expires_at = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class RedisCache:
+    """Cache on a Redis compatible client, shared by every process using it.
+
+    Values are pickled, keys are prefixed with `prefix`. Only get, set (with
+    px), delete and scan_iter are used, so InMemoryRedis can stand in for a
+    server.
+
+    Args:
+        client: redis.Redis like client.
+        ttl (float): seconds an entry stays valid, 0 or less disables caching.
+        prefix (str): namespace of the keys.
+    """
+
+    def __init__(self, client, ttl, prefix="cache:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        raw_value = self.client.get(f"{self.prefix}{key}")
+        with self._lock:
+            if raw_value is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return pickle.loads(raw_value)
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self.client.set(
+            f"{self.prefix}{key}", pickle.dumps(value), px=int(ttl * 1000)
+        )
+
+    def delete(self, key):
+        self.client.delete(f"{self.prefix}{key}")
+
+    def clear(self):
+        for key in self.client.scan_iter(match=f"{self.prefix}*"):
+            self.client.delete(key)
+
+    def stats(self):
+        return {"ttl": self.ttl, "hits": self.hits, "misses": self.misses}
+
+
+class InMemoryRedis:
+    """Local stand-in for the part of the Redis client RedisCache uses."""
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            value, expires_at = self._values.get(name, (None, None))
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._values[name]
+                return None
+            return value
+
+    def set(self, name, value, ex=None, px=None):
+        expires_at = None
+        if ex is not None:
+            expires_at = time.monotonic() + ex
+        elif px is not None:
+            expires_at = time.monotonic() + px / 1000
+        with self._lock:
+            self._values[name] = (value, expires_at)
+        return True
+
+    def delete(self, *names):
+        with self._lock:
+            return sum(self._values.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match="*"):
+        with self._lock:
+            names = list(self._values)
+        return (name for name in names if fnmatch.fnmatchcase(name, match))
+
+
+def create_cache(backend, maxsize, ttl, redis_url=None, prefix="cache:"):
+    """Build the cache of a backend name: "memory" (TTLCache), "redis" or
+    "local_redis" (RedisCache on InMemoryRedis). Falls back to memory when
+    the redis package is not installed.
+    """
+    if backend == "local_redis":
+        return RedisCache(InMemoryRedis(), ttl, prefix)
+    if backend == "redis":
+        try:
+            import redis
+        except ImportError:
+            logger.warning("redis is not installed, using the in-process cache")
+        else:
+            return RedisCache(redis.Redis.from_url(redis_url), ttl, prefix)
+    return TTLCache(maxsize, ttl)
@@ -1,12 +1,31 @@
 from flask_sqlalchemy import SQLAlchemy
 
+from infra.db_router import get_engine_by_url
+from infra.query_stats import instrument_engine
+
+
+class RouterSQLAlchemy(SQLAlchemy):
+    """Flask-SQLAlchemy sharing the engines (and pools) of infra/db_router.py.
+
+    Without it `db.session` and the router sessions would hold two separate
+    connection pools to the same database.
+    """
+
+    def _make_engine(self, bind_key, options, app):
+        engine = get_engine_by_url(options["url"])
+        if engine is not None:
+            return engine
+        engine = super()._make_engine(bind_key, options, app)
+        instrument_engine(engine)
+        return engine
+
 
 # SQLite supports only one db file instance for all tables. Otherwise we need to create multiple connection like 
 # users_db = SQLAlchemy()
 # products_db = SQLAlchemy()
 
 
-db = SQLAlchemy()
+db = RouterSQLAlchemy()
 
 
 '''
@@ -0,0 +1,85 @@
+import decimal
+import uuid
+from datetime import date, datetime, time, timezone
+
+from flask.json.provider import DefaultJSONProvider
+
+from infra.environment import JSON_DATETIME_FORMAT
+
+try:
+    import orjson
+except ImportError:  # Flask's stdlib json provider is used instead.
+    orjson = None
+
+ORJSON_OPTIONS = 0
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    if JSON_DATETIME_FORMAT == "iso":
+        ORJSON_OPTIONS |= orjson.OPT_NAIVE_UTC
+    else:
+        # Dates go to _default, which writes HTTP dates.
+        ORJSON_OPTIONS |= orjson.OPT_PASSTHROUGH_DATETIME
+
+
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+
+
+def http_date(value):
+    """Same text as werkzeug.http.http_date, naive values being UTC, built
+    without going through email.utils."""
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    elif value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return (
+        f"{_WEEKDAYS[value.weekday()]}, {value.day:02d} {_MONTHS[value.month - 1]} "
+        f"{value.year:04d} {value.hour:02d}:{value.minute:02d}:{value.second:02d} GMT"
+    )
+
+
+def _default(value):
+    # Types orjson leaves to us, handled like Flask's default provider does.
+    if isinstance(value, date):
+        return http_date(value)
+    if isinstance(value, time):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    if hasattr(value, "__html__"):
+        return str(value.__html__())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider encoding with orjson when it is installed.
+
+    The output matches Flask's default provider: sorted keys, dates as HTTP
+    dates (ISO 8601 with JSON_DATETIME_FORMAT=iso, naive values being UTC),
+    Decimal and UUID as strings. Without orjson, or when called with
+    json.dumps arguments, the default stdlib provider does the work.
+    """
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS).decode(
+            "utf-8"
+        )
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(
+            obj, default=_default, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        )
+        return self._app.response_class(body, mimetype=self.mimetype)
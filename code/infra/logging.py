@@ -1,10 +1,21 @@
 
+import atexit
+import copy
 import os
+import queue
 import sys
+import threading
 from datetime import datetime, time, timedelta
 
 from loguru import logger
-from utils.constants import LOG_AUDITS, LOG_DEBUG
+from infra.environment import (
+    LOG_LEVEL,
+    LOG_PAYLOAD_MAX_LENGTH,
+    LOG_QUEUE_POLICY,
+    LOG_QUEUE_SIZE,
+    LOG_SINK_MODE,
+)
+from utils.constants import LOG_AUDITS
 
 
 # Remove all previously added handlers, including loguru's default handler.
@@ -12,10 +23,45 @@ logger.remove()
 
 # Ensure the 'logs' directory exists to store log files.
 os.makedirs("logs", exist_ok=True)
-# LOG_LEVEL = LOG_WARNING if ENVIRONMENT == ENV_PROD else LOG_DEBUG
+# LOG_LEVEL comes from the environment, DEBUG by default for development.
+# Use LOG_WARNING in production: debug messages logged with
+# logger.opt(lazy=True) are then never built.
+
+# Payload keys never written to the logs: live objects and secrets.
+LOG_OMITTED_KEYS = {"db_session", "password"}
+# Items of a list shown in a summary.
+LOG_SUMMARY_ITEMS = 3
+
+
+def summarize(value, max_length=LOG_PAYLOAD_MAX_LENGTH):
+    """Short text of a payload for log messages.
+
+    Only the first LOG_SUMMARY_ITEMS items of lists are kept, LOG_OMITTED_KEYS
+    are masked and the text is cut at max_length characters. Call it inside a
+    lazy log argument, e.g.
+    logger.opt(lazy=True).debug("Payload: {}", lambda: summarize(payload)).
+    """
+    text = repr(_shorten(value))
+    if len(text) > max_length:
+        text = f"{text[:max_length]}... ({len(text)} chars)"
+    return text
+
+
+def _shorten(value, depth=0):
+    if isinstance(value, (dict, list, tuple)) and depth > 2:
+        return f"<{type(value).__name__} of {len(value)}>"
+    if isinstance(value, dict):
+        return {
+            key: "<omitted>" if key in LOG_OMITTED_KEYS else _shorten(item, depth + 1)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        items = [_shorten(item, depth + 1) for item in value[:LOG_SUMMARY_ITEMS]]
+        if len(value) > LOG_SUMMARY_ITEMS:
+            items.append(f"... {len(value)} items")
+        return items
+    return value
 
-# LOG_LEVEL is set to LOG_DEBUG, preferred for many development environments.
-LOG_LEVEL = LOG_DEBUG
 
 
 class Rotator:
@@ -26,26 +72,110 @@ class Rotator:
         self._time_limit = now.replace(
             hour=at.hour, minute=at.minute, second=at.second
         )
+        # Size of the current file, tracked as messages are written so the
+        # file is only measured (seek) once after it is opened.
+        self._file = None
+        self._file_size = 0
 
         # If the current time is past the rotation time, schedule the next rotation for one day later.
         if now >= self._time_limit:
             self._time_limit += timedelta(days=1)
 
     def should_rotate(self, message, file):
-        file.seek(0, 2)
+        if file is not self._file:
+            file.seek(0, 2)
+            self._file = file
+            self._file_size = file.tell()
         # Rotate if file size limit exceeded or the current message's timestamp is past the time limit.
-        if file.tell() + len(message) > self._size_limit:
+        if self._file_size + len(message) > self._size_limit:
             return True
         if message.record["time"].timestamp() > self._time_limit.timestamp():
             self._time_limit += timedelta(days=1)
             return True
+        self._file_size += len(message)
         return False
-    
+
+
+class QueuedSink:
+    """Loguru sink handing formatted messages to a background writer thread.
+
+    The logging thread only puts the message on a bounded queue, the writer
+    thread writes it through the handlers of `writer`, a separate logger
+    holding the file and stdout handlers. When the queue is full the "block"
+    policy waits for room and "drop" discards the message and counts it.
+    """
+
+    def __init__(self, writer, maxsize, policy):
+        self.writer = writer
+        self.maxsize = maxsize
+        self.policy = policy
+        self.written = 0
+        self.dropped = 0
+        self._reported_drops = 0
+        self._drop_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(
+            target=self._write_messages, name="log-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def __call__(self, message):
+        item = (message.record["level"].name, str(message))
+        if self.policy != "drop":
+            self._queue.put(item)
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+
+    def _write_messages(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            level_name, text = item
+            self.writer.opt(raw=True).log(level_name, text)
+            self.written += 1
+            if self.dropped != self._reported_drops:
+                self.writer.warning(
+                    f"{self.dropped - self._reported_drops} log messages dropped, "
+                    f"log queue of {self.maxsize} is full"
+                )
+                self._reported_drops = self.dropped
+
+    def stop(self, timeout=5):
+        """Write the queued messages and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+    def stats(self):
+        return {
+            "mode": LOG_SINK_MODE,
+            "policy": self.policy,
+            "maxsize": self.maxsize,
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+        }
+
+
 # Initialize the Rotator object with a 500 MB file size limit or rotation at midnight.
 rotator = Rotator(size=5e8, at=time(0, 0, 0))
 
+# Define a new log level 'LOG_AUDITS' with distinct settings for auditing logs.
+logger.level(LOG_AUDITS, no=33, color="<blue>")
+
+# In queued mode the file and stdout handlers live on an independent copy of
+# the logger fed by the writer thread; `logger` only formats and enqueues.
+# Queued messages are written as formatted, without terminal colors.
+writer_logger = copy.deepcopy(logger) if LOG_SINK_MODE == "queued" else logger
+
 # Configure the logger to add a specific handler for file logging with the above rotator.
-logger.add(
+writer_logger.add(
     "./logs/log_file.log",
     rotation=rotator.should_rotate,
     level=LOG_LEVEL,
@@ -53,7 +183,16 @@ logger.add(
     backtrace=True,  # if ENVIRONMENT == ENV_PROD else True,
     diagnose=True,  # if ENVIRONMENT == ENV_PROD else True,
 )
+writer_logger.add(sys.stdout, level=LOG_LEVEL)
 
-# Define a new log level 'LOG_AUDITS' with distinct settings for auditing logs.
-logger.level(LOG_AUDITS, no=33, color="<blue>")
-logger.add(sys.stdout, level=LOG_LEVEL)
\ No newline at end of file
+queued_sink = None
+if LOG_SINK_MODE == "queued":
+    queued_sink = QueuedSink(writer_logger, LOG_QUEUE_SIZE, LOG_QUEUE_POLICY)
+    logger.add(queued_sink, level=LOG_LEVEL, backtrace=True, diagnose=True)
+
+
+def get_log_sink_metrics():
+    """Queue depth, written and dropped message counts of the queued sink."""
+    if queued_sink is None:
+        return {"mode": LOG_SINK_MODE}
+    return queued_sink.stats()
@@ -0,0 +1,183 @@
+import bisect
+import threading
+import time
+import weakref
+
+from infra.environment import METRICS_ENABLED, METRICS_LATENCY_BUCKETS
+
+
+class _MetricsShard:
+    """Request metrics recorded by one thread.
+
+    Only the owning thread writes a shard, so recording takes no lock. Scrapes
+    copy the dicts with list(), which the GIL runs as one step.
+    """
+
+    def __init__(self, bucket_count):
+        self.bucket_count = bucket_count
+        # labels -> [observations per bucket (+Inf last), sum, count]
+        self.latencies = {}
+        # (labels, status code) -> requests
+        self.statuses = {}
+        # labels -> requests being served
+        self.in_flight = {}
+
+    def observe(self, labels, status_code, duration, bucket_index):
+        latency = self.latencies.get(labels)
+        if latency is None:
+            latency = self.latencies[labels] = [[0] * self.bucket_count, 0.0, 0]
+        latency[0][bucket_index] += 1
+        latency[1] += duration
+        latency[2] += 1
+        status_key = (labels, status_code)
+        self.statuses[status_key] = self.statuses.get(status_key, 0) + 1
+
+    def merge(self, shard):
+        for labels, (buckets, total, count) in list(shard.latencies.items()):
+            latency = self.latencies.get(labels)
+            if latency is None:
+                latency = self.latencies[labels] = [[0] * self.bucket_count, 0.0, 0]
+            for bucket_index, observations in enumerate(buckets):
+                latency[0][bucket_index] += observations
+            latency[1] += total
+            latency[2] += count
+        for status_key, requests in list(shard.statuses.items()):
+            self.statuses[status_key] = self.statuses.get(status_key, 0) + requests
+        for labels, requests in list(shard.in_flight.items()):
+            self.in_flight[labels] = self.in_flight.get(labels, 0) + requests
+
+
+class RequestMetrics:
+    """Latency histograms, status code counts and in-flight gauges of the
+    requests, keyed by a tuple of (label name, value) pairs.
+
+    Each thread records in its own shard, scrapes merge them. Shards of
+    finished threads are folded into one when new threads register, so the
+    thread per request servers do not grow the registry.
+
+    Args:
+        buckets (list): upper bounds of the latency buckets, in seconds.
+    """
+
+    # Shards kept before the ones of finished threads are folded.
+    MAX_SHARDS = 64
+
+    def __init__(self, buckets=METRICS_LATENCY_BUCKETS):
+        self.buckets = list(buckets)
+        self._local = threading.local()
+        self._shards = []
+        self._retired = _MetricsShard(len(self.buckets) + 1)
+        self._lock = threading.Lock()
+
+    def _get_shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _MetricsShard(len(self.buckets) + 1)
+            with self._lock:
+                if len(self._shards) >= self.MAX_SHARDS:
+                    self._fold_finished_shards()
+                self._shards.append((weakref.ref(threading.current_thread()), shard))
+        return shard
+
+    def _fold_finished_shards(self):
+        live_shards = []
+        for thread_ref, shard in self._shards:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                live_shards.append((thread_ref, shard))
+            else:
+                self._retired.merge(shard)
+        self._shards = live_shards
+
+    def start_request(self, labels):
+        in_flight = self._get_shard().in_flight
+        in_flight[labels] = in_flight.get(labels, 0) + 1
+
+    def finish_request(self, labels, status_code, duration):
+        shard = self._get_shard()
+        shard.in_flight[labels] = shard.in_flight.get(labels, 0) - 1
+        shard.observe(
+            labels, status_code, duration, bisect.bisect_left(self.buckets, duration)
+        )
+
+    def collect(self):
+        """Merge of every shard, a shard itself."""
+        collected = _MetricsShard(len(self.buckets) + 1)
+        with self._lock:
+            collected.merge(self._retired)
+            for _, shard in self._shards:
+                collected.merge(shard)
+        return collected
+
+    def render(self):
+        """Metrics in the Prometheus text exposition format."""
+        collected = self.collect()
+        lines = [
+            "# HELP http_request_duration_seconds Latency of the requests.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for labels, (buckets, total, count) in sorted(collected.latencies.items()):
+            cumulative = 0
+            for upper_bound, observations in zip(
+                [*map(_format_value, self.buckets), "+Inf"], buckets
+            ):
+                cumulative += observations
+                lines.append(
+                    f"http_request_duration_seconds_bucket"
+                    f"{_format_labels(labels, le=upper_bound)} {cumulative}"
+                )
+            lines.append(
+                f"http_request_duration_seconds_sum{_format_labels(labels)} "
+                f"{_format_value(total)}"
+            )
+            lines.append(
+                f"http_request_duration_seconds_count{_format_labels(labels)} {count}"
+            )
+        lines += [
+            "# HELP http_requests_total Requests served by status code.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (labels, status_code), requests in sorted(collected.statuses.items()):
+            lines.append(
+                f"http_requests_total{_format_labels(labels, status=status_code)} "
+                f"{requests}"
+            )
+        lines += [
+            "# HELP http_requests_in_flight Requests being served.",
+            "# TYPE http_requests_in_flight gauge",
+        ]
+        for labels, requests in sorted(collected.in_flight.items()):
+            lines.append(f"http_requests_in_flight{_format_labels(labels)} {requests}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value):
+    return repr(float(value))
+
+
+def _format_labels(labels, **extra_labels):
+    label_pairs = [*labels, *extra_labels.items()]
+    return "{" + ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in label_pairs
+    ) + "}"
+
+
+def _escape_label_value(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+request_metrics = RequestMetrics() if METRICS_ENABLED else None
+
+
+def start_request_metrics(labels):
+    """Count the request as in flight, returns its start time."""
+    if request_metrics is not None:
+        request_metrics.start_request(labels)
+    return time.perf_counter()
+
+
+def finish_request_metrics(labels, status_code, started_at):
+    if request_metrics is not None:
+        request_metrics.finish_request(
+            labels, status_code, time.perf_counter() - started_at
+        )
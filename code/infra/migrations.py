@@ -0,0 +1,466 @@
+import argparse
+import importlib.util
+import re
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    MetaData,
+    String,
+    Table,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateColumn
+
+from infra.db_router import PARTIAL_INDEX_DIALECTS, get_engine
+from infra.environment import (
+    MIGRATION_BATCH_PAUSE_MS,
+    MIGRATION_BATCH_SIZE,
+    MIGRATIONS_PATH,
+)
+from infra.logging import logger
+from utils.utility import get_current_time
+
+
+# Migration files of MIGRATIONS_PATH: <revision>_<name>.py defining
+# description, up(migrator) and down(migrator).
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d+)_(\w+)\.py$")
+
+migration_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("revision", String(32), primary_key=True),
+    Column("description", String(255), nullable=True),
+    Column("applied_at", DateTime, nullable=False),
+    Column("duration_ms", Float, nullable=True),
+)
+
+
+class Migration:
+    """A migration file loaded from MIGRATIONS_PATH."""
+
+    def __init__(self, path):
+        match = MIGRATION_FILE_PATTERN.match(path.name)
+        self.path = path
+        self.revision = match.group(1)
+        self.name = match.group(2)
+        spec = importlib.util.spec_from_file_location(
+            f"migrations.m{self.revision}_{self.name}", path
+        )
+        self.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.module)
+        self.description = getattr(self.module, "description", self.name)
+
+    def up(self, migrator):
+        self.module.up(migrator)
+
+    def down(self, migrator):
+        self.module.down(migrator)
+
+
+class Migrator:
+    """Schema operations given to the ``up`` and ``down`` functions.
+
+    Every operation skips what already exists, so a failed migration can be
+    run again. They avoid long write locks where the backend allows it: MySQL
+    changes use online DDL (ALGORITHM=INSTANT/INPLACE, LOCK=NONE), postgresql
+    builds indexes CONCURRENTLY and backfills update small batches of rows.
+    SQLite has no online index build, CREATE INDEX blocks writers (not WAL
+    readers) while it runs and they wait up to SQLITE_BUSY_TIMEOUT.
+
+    Args:
+        engine (Engine): database to change.
+        batch_size (int): rows updated per transaction by `backfill`.
+        batch_pause (float): seconds slept between two backfill batches.
+    """
+
+    def __init__(
+        self,
+        engine,
+        batch_size=MIGRATION_BATCH_SIZE,
+        batch_pause=MIGRATION_BATCH_PAUSE_MS / 1000,
+    ):
+        self.engine = engine
+        self.dialect_name = engine.dialect.name
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+
+    @property
+    def supports_partial_indexes(self):
+        return self.dialect_name in PARTIAL_INDEX_DIALECTS
+
+    def quote(self, name):
+        return self.engine.dialect.identifier_preparer.quote(name)
+
+    def execute(self, statement, **params):
+        with self.engine.begin() as connection:
+            return connection.execute(text(statement), params)
+
+    def has_table(self, table_name):
+        return inspect(self.engine).has_table(table_name)
+
+    def has_column(self, table_name, column_name):
+        return any(
+            column["name"] == column_name
+            for column in inspect(self.engine).get_columns(table_name)
+        )
+
+    def has_index(self, table_name, index_name):
+        return any(
+            index["name"] == index_name
+            for index in inspect(self.engine).get_indexes(table_name)
+        )
+
+    def add_column(self, table_name, column):
+        """Add a column (sqlalchemy Column). Give it a constant server_default
+        or no default: SQLite and MySQL then add it without copying the table,
+        fill existing rows with `backfill` afterwards."""
+        if self.has_column(table_name, column.name):
+            logger.info(f"Column {table_name}.{column.name} exists, skipped")
+            return
+        column_ddl = CreateColumn(column).compile(dialect=self.engine.dialect)
+        statement = f"ALTER TABLE {self.quote(table_name)} ADD COLUMN {column_ddl}"
+        if self.dialect_name == "mysql":
+            self._alter_mysql_online(statement, instant=True)
+        else:
+            self.execute(statement)
+        logger.info(f"Added column {table_name}.{column.name}")
+
+    def drop_column(self, table_name, column_name):
+        if not self.has_column(table_name, column_name):
+            return
+        statement = (
+            f"ALTER TABLE {self.quote(table_name)} DROP COLUMN {self.quote(column_name)}"
+        )
+        if self.dialect_name == "mysql":
+            self._alter_mysql_online(statement, instant=True)
+        else:
+            self.execute(statement)
+        logger.info(f"Dropped column {table_name}.{column_name}")
+
+    def create_index(self, table_name, index_name, columns, unique=False, where=None):
+        """Create an index unless it exists.
+
+        Args:
+            columns (list): indexed column names, in order.
+            where (str): criteria of a partial index, e.g. "deleted_by IS NULL".
+                Ignored by backends without partial indexes, the index then
+                covers every row.
+        """
+        if self.has_index(table_name, index_name):
+            logger.info(f"Index {index_name} exists, skipped")
+            return
+        started_at = time.perf_counter()
+        unique_ddl = "UNIQUE " if unique else ""
+        column_ddl = ", ".join(self.quote(column) for column in columns)
+        if self.dialect_name == "mysql":
+            self._alter_mysql_online(
+                f"ALTER TABLE {self.quote(table_name)} "
+                f"ADD {unique_ddl}INDEX {self.quote(index_name)} ({column_ddl})"
+            )
+        else:
+            concurrently = "CONCURRENTLY " if self.dialect_name == "postgresql" else ""
+            statement = (
+                f"CREATE {unique_ddl}INDEX {concurrently}{self.quote(index_name)} "
+                f"ON {self.quote(table_name)} ({column_ddl})"
+            )
+            if where and self.supports_partial_indexes:
+                statement = f"{statement} WHERE {where}"
+            if concurrently:
+                # CONCURRENTLY cannot run inside a transaction.
+                with self.engine.connect().execution_options(
+                    isolation_level="AUTOCOMMIT"
+                ) as connection:
+                    connection.execute(text(statement))
+            else:
+                self.execute(statement)
+        logger.info(
+            f"Created index {index_name} on {table_name} in "
+            f"{(time.perf_counter() - started_at) * 1000:.1f} ms"
+        )
+
+    def backs_foreign_key(self, table_name, index_name):
+        """Whether the index is the only one a foreign key of the table can
+        use: its leading columns are the constrained columns and neither the
+        primary key nor another index starts with them."""
+        inspector = inspect(self.engine)
+        indexes = {
+            index["name"]: index["column_names"]
+            for index in inspector.get_indexes(table_name)
+        }
+        index_columns = indexes.pop(index_name, [])
+        other_columns = [
+            *indexes.values(),
+            inspector.get_pk_constraint(table_name)["constrained_columns"],
+        ]
+        for foreign_key in inspector.get_foreign_keys(table_name):
+            key_columns = foreign_key["constrained_columns"]
+            if index_columns[: len(key_columns)] == key_columns and not any(
+                columns[: len(key_columns)] == key_columns for columns in other_columns
+            ):
+                return True
+        return False
+
+    def drop_index(self, table_name, index_name):
+        if not self.has_index(table_name, index_name):
+            return
+        if self.dialect_name == "mysql" and self.backs_foreign_key(
+            table_name, index_name
+        ):
+            # InnoDB refuses to drop the index a foreign key needs, e.g. those
+            # create_all built with the tables.
+            logger.info(f"Index {index_name} backs a foreign key, kept")
+            return
+        if self.dialect_name == "mysql":
+            self._alter_mysql_online(
+                f"ALTER TABLE {self.quote(table_name)} DROP INDEX {self.quote(index_name)}"
+            )
+        else:
+            self.execute(f"DROP INDEX {self.quote(index_name)}")
+        logger.info(f"Dropped index {index_name}")
+
+    def backfill(self, table_name, values, where):
+        """Update the rows matching `where` in batches of batch_size rows,
+        each batch in its own transaction.
+
+        Args:
+            values (dict): column name -> value set on the rows.
+            where (str): criteria of the rows left to update. The update must
+                make rows stop matching it, e.g. "weight IS NULL".
+
+        Returns:
+            int: rows updated.
+        """
+        assignments = ", ".join(
+            f"{self.quote(column_name)} = :value_{position}"
+            for position, column_name in enumerate(values)
+        )
+        params = {
+            f"value_{position}": value for position, value in enumerate(values.values())
+        }
+        quoted_table = self.quote(table_name)
+        if self.dialect_name == "mysql":
+            statement = (
+                f"UPDATE {quoted_table} SET {assignments} WHERE {where} "
+                f"LIMIT {int(self.batch_size)}"
+            )
+        else:
+            id_column = self.quote(
+                inspect(self.engine).get_pk_constraint(table_name)["constrained_columns"][0]
+            )
+            statement = (
+                f"UPDATE {quoted_table} SET {assignments} WHERE {id_column} IN "
+                f"(SELECT {id_column} FROM {quoted_table} WHERE {where} "
+                f"LIMIT {int(self.batch_size)})"
+            )
+        updated_rows = 0
+        while True:
+            batch_rows = self.execute(statement, **params).rowcount
+            updated_rows += batch_rows
+            if batch_rows < self.batch_size:
+                break
+            time.sleep(self.batch_pause)
+        logger.info(f"Backfilled {updated_rows} {table_name} rows")
+        return updated_rows
+
+    def _alter_mysql_online(self, statement, instant=False):
+        # INSTANT only changes metadata (MySQL 8.0+), INPLACE with LOCK=NONE
+        # rebuilds while reads and writes go on.
+        if instant:
+            try:
+                self.execute(f"{statement}, ALGORITHM=INSTANT")
+                return
+            except DBAPIError as ex:
+                logger.info(f"ALGORITHM=INSTANT not supported, using INPLACE: {ex}")
+        self.execute(f"{statement}, ALGORITHM=INPLACE, LOCK=NONE")
+
+
+# region migration runner
+
+
+def load_migrations(path=MIGRATIONS_PATH):
+    """Migrations of path ordered by revision."""
+    migrations = [
+        Migration(file_path)
+        for file_path in Path(path).glob("*.py")
+        if MIGRATION_FILE_PATTERN.match(file_path.name)
+    ]
+    migrations.sort(key=lambda migration: int(migration.revision))
+    revisions = [migration.revision for migration in migrations]
+    if len(set(revisions)) != len(revisions):
+        raise ValueError(f"Duplicate migration revisions in {path}")
+    return migrations
+
+
+def get_applied_revisions(engine):
+    """Applied revision -> applied_at, creating the history table if needed."""
+    migration_metadata.create_all(engine, tables=[schema_migrations])
+    with engine.connect() as connection:
+        return {
+            row.revision: row.applied_at
+            for row in connection.execute(
+                select(schema_migrations.c.revision, schema_migrations.c.applied_at)
+            )
+        }
+
+
+def get_pending_revisions(engine, path=MIGRATIONS_PATH):
+    applied_revisions = get_applied_revisions(engine)
+    return [
+        migration.revision
+        for migration in load_migrations(path)
+        if migration.revision not in applied_revisions
+    ]
+
+
+def upgrade(engine, target=None, path=MIGRATIONS_PATH):
+    """Apply the pending migrations up to target (all when None), in order.
+
+    Returns:
+        list: revisions applied.
+    """
+    applied_revisions = get_applied_revisions(engine)
+    migrator = Migrator(engine)
+    upgraded_revisions = []
+    for migration in load_migrations(path):
+        if target is not None and int(migration.revision) > int(target):
+            break
+        if migration.revision in applied_revisions:
+            continue
+        logger.info(f"Applying migration {migration.revision}: {migration.description}")
+        started_at = time.perf_counter()
+        migration.up(migrator)
+        with engine.begin() as connection:
+            connection.execute(
+                schema_migrations.insert().values(
+                    revision=migration.revision,
+                    description=migration.description,
+                    applied_at=get_current_time(),
+                    duration_ms=round((time.perf_counter() - started_at) * 1000, 3),
+                )
+            )
+        upgraded_revisions.append(migration.revision)
+    logger.info(f"Migrations applied: {upgraded_revisions or 'none'}")
+    return upgraded_revisions
+
+
+def downgrade(engine, target=None, path=MIGRATIONS_PATH):
+    """Revert the applied migrations above target, the last one when None.
+
+    Returns:
+        list: revisions reverted, latest first.
+    """
+    applied_revisions = get_applied_revisions(engine)
+    applied_migrations = [
+        migration
+        for migration in load_migrations(path)
+        if migration.revision in applied_revisions
+    ]
+    if target is None:
+        migrations_to_revert = applied_migrations[-1:]
+    else:
+        migrations_to_revert = [
+            migration
+            for migration in applied_migrations
+            if int(migration.revision) > int(target)
+        ]
+    migrator = Migrator(engine)
+    reverted_revisions = []
+    for migration in reversed(migrations_to_revert):
+        logger.info(f"Reverting migration {migration.revision}: {migration.description}")
+        migration.down(migrator)
+        with engine.begin() as connection:
+            connection.execute(
+                schema_migrations.delete().where(
+                    schema_migrations.c.revision == migration.revision
+                )
+            )
+        reverted_revisions.append(migration.revision)
+    logger.info(f"Migrations reverted: {reverted_revisions or 'none'}")
+    return reverted_revisions
+
+
+def get_status(engine, path=MIGRATIONS_PATH):
+    """(revision, description, applied_at or None) of every migration."""
+    applied_revisions = get_applied_revisions(engine)
+    return [
+        (
+            migration.revision,
+            migration.description,
+            applied_revisions.get(migration.revision),
+        )
+        for migration in load_migrations(path)
+    ]
+
+
+MIGRATION_TEMPLATE = '''description = "{description}"
+
+
+def up(migrator):
+    pass
+
+
+def down(migrator):
+    pass
+'''
+
+
+def create_migration(name, path=MIGRATIONS_PATH):
+    """Write an empty migration file with the next revision number."""
+    migrations = load_migrations(path)
+    revision = int(migrations[-1].revision) + 1 if migrations else 1
+    file_path = Path(path) / f"{revision:04d}_{name}.py"
+    file_path.write_text(
+        MIGRATION_TEMPLATE.format(description=name.replace("_", " ").capitalize())
+    )
+    return file_path
+
+
+# endregion
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m infra.migrations",
+        description="Versioned schema migrations, run from the code directory.",
+    )
+    parser.add_argument(
+        "--db", default="sqlite", help="engine key of infra/db_router.py"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="list migrations and when they were applied")
+    upgrade_parser = commands.add_parser("upgrade", help="apply pending migrations")
+    upgrade_parser.add_argument("--target", help="last revision to apply")
+    downgrade_parser = commands.add_parser(
+        "downgrade", help="revert migrations, the last one by default"
+    )
+    downgrade_parser.add_argument("--target", help="revision to go back to")
+    new_parser = commands.add_parser("new", help="create an empty migration")
+    new_parser.add_argument("name", help="snake_case name of the migration")
+    args = parser.parse_args(argv)
+
+    if args.command == "new":
+        print(create_migration(args.name))
+        return 0
+
+    engine = get_engine(args.db)
+    if args.command == "status":
+        for revision, description, applied_at in get_status(engine):
+            print(f"{revision}  {str(applied_at or 'pending'):<26}  {description}")
+    elif args.command == "upgrade":
+        upgrade(engine, args.target)
+    elif args.command == "downgrade":
+        downgrade(engine, args.target)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
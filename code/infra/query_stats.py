@@ -0,0 +1,166 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from functools import lru_cache
+
+from sqlalchemy import event
+
+from infra.environment import (
+    QUERY_COUNT_WARNING,
+    QUERY_REPEAT_WARNING,
+    QUERY_STATS_ENABLED,
+    QUERY_TIME_WARNING_MS,
+    SERVER_TIMING_ENABLED,
+)
+from infra.logging import logger
+
+
+# Stats of the request being served, None outside requests.
+_request_query_stats = ContextVar("request_query_stats", default=None)
+
+# Literals and IN lists replaced in statement fingerprints.
+_STRING_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+# Repeated statement shapes written in a warning, and characters kept of
+# each end of a long one.
+_REPEATED_STATEMENTS_LOGGED = 3
+_STATEMENT_END_LENGTH = 120
+
+
+class RequestQueryStats:
+    """Statements issued while serving one request."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.statement_count = 0
+        self.db_time = 0.0
+        self.fingerprints = Counter()
+
+    def record(self, statement, duration):
+        self.statement_count += 1
+        self.db_time += duration
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def get_repeated_statements(self, min_count=QUERY_REPEAT_WARNING):
+        """(fingerprint, count) of the statement shapes run min_count times
+        or more, most repeated first."""
+        return [
+            (statement, count)
+            for statement, count in self.fingerprints.most_common()
+            if count >= min_count
+        ]
+
+    def stats(self):
+        return {
+            "statements": self.statement_count,
+            "db_ms": round(self.db_time * 1000, 3),
+            "total_ms": round((time.perf_counter() - self.started_at) * 1000, 3),
+            "repeated_statements": self.get_repeated_statements(),
+        }
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement):
+    """Shape of a statement: literals and IN lists replaced, whitespace
+    collapsed, so the queries of an N+1 loop share one fingerprint."""
+    statement = _STRING_LITERAL_PATTERN.sub("?", statement)
+    statement = _NUMBER_LITERAL_PATTERN.sub("?", statement)
+    statement = _IN_LIST_PATTERN.sub("(?...)", statement)
+    return _WHITESPACE_PATTERN.sub(" ", statement).strip()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_query_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    request_stats = _request_query_stats.get()
+    started_at = conn.info.get("query_started_at")
+    if request_stats is None or not started_at:
+        return
+    request_stats.record(statement, time.perf_counter() - started_at.pop())
+
+
+def _handle_error(exception_context):
+    # A failing statement never reaches after_cursor_execute, its start time
+    # is popped here so the next statement of the connection is timed right.
+    request_stats = _request_query_stats.get()
+    connection = exception_context.connection
+    if (
+        request_stats is None
+        or connection is None
+        or exception_context.execution_context is None
+    ):
+        return
+    started_at = connection.info.get("query_started_at")
+    if started_at:
+        request_stats.record(
+            exception_context.statement or "", time.perf_counter() - started_at.pop()
+        )
+
+
+def instrument_engine(engine):
+    """Count and time the statements an engine runs for the current request."""
+    if not QUERY_STATS_ENABLED or event.contains(
+        engine, "before_cursor_execute", _before_cursor_execute
+    ):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def start_request_query_stats():
+    if QUERY_STATS_ENABLED:
+        _request_query_stats.set(RequestQueryStats())
+
+
+def finish_request_query_stats(request, response):
+    """Add the Server-Timing header of the request and warn about requests
+    running too many, too slow or repeated statements.
+
+    Statements of a streamed body run after the response is returned and are
+    not counted.
+    """
+    request_stats = _request_query_stats.get()
+    if request_stats is None:
+        return response
+    _request_query_stats.set(None)
+    stats = request_stats.stats()
+    if SERVER_TIMING_ENABLED:
+        response.headers.add(
+            "Server-Timing",
+            f'db;dur={stats["db_ms"]};desc="{stats["statements"]} statements"',
+        )
+        response.headers.add("Server-Timing", f"app;dur={stats['total_ms']}")
+    if (
+        stats["statements"] > QUERY_COUNT_WARNING
+        or stats["db_ms"] > QUERY_TIME_WARNING_MS
+        or stats["repeated_statements"]
+    ):
+        repeated_statements = "; ".join(
+            f"{count}x {_shorten_statement(statement)}"
+            for statement, count in stats["repeated_statements"][
+                :_REPEATED_STATEMENTS_LOGGED
+            ]
+        )
+        logger.warning(
+            f"{request.method} {request.path} ran {stats['statements']} statements "
+            f"in {stats['db_ms']} ms"
+            + (f", repeated: {repeated_statements}" if repeated_statements else "")
+        )
+    return response
+
+
+def _shorten_statement(statement):
+    # Both ends: the selected table and the filter tell the N+1 loop apart.
+    if len(statement) <= 2 * _STATEMENT_END_LENGTH:
+        return statement
+    return (
+        f"{statement[:_STATEMENT_END_LENGTH]} ... "
+        f"{statement[-_STATEMENT_END_LENGTH:]}"
+    )
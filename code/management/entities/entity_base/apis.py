@@ -0,0 +1,671 @@
+from utils.constants import BULK_WRITE_CHUNK_SIZE, DEFAULT_API_RESPONSE_OBJ
+from utils.utility import (
+    generate_bad_request_response,
+    generate_entity_not_found_response,
+    generate_internal_server_error_response,
+    generate_not_acceptable_response,
+    generate_success_response,
+    extract_query_params,
+    get_current_time,
+)
+from management.entities.entity_base.export import EXPORT_FORMATS
+from management.entities.entity_base.model import resolve_session
+from management.entities.entity_base.relationships import (
+    get_reference_names,
+    get_relationships,
+    serialize_entities,
+)
+from management.entities.entity_base.pagination import (
+    is_total_estimated,
+    paginate_query,
+    paginate_query_with_total,
+)
+from management.entities.entity_base.search import apply_search_filter
+from infra.logging import logger, summarize
+
+
+class EntityApi:
+    """CRUD and listing apis of one entity, shared by every entity package.
+
+    Each `<entity>/apis.py` builds one instance from its model and exposes the
+    bound methods under the usual `create_<entity>`, `get_<entity>`, ...
+    names, so request handling, session usage and the listing hot paths
+    live in a single place.
+
+    Args:
+        entity_class (EntityModel): model of the entity, e.g. ``User``.
+    """
+
+    def __init__(self, entity_class):
+        self.entity_class = entity_class
+        self.entity_name = entity_class.__tablename__
+        self.entity_label = entity_class.__name__
+        self.plural_name = f"{self.entity_name}s"
+        self.id_column_name = entity_class.get_id_column_name()
+        self.columns_list = entity_class.get_column_names()
+
+    def create(self, content):
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.opt(lazy=True).debug(
+                "Creating {} with content: {}",
+                lambda: self.entity_name,
+                lambda: summarize(content),
+            )
+            if self.entity_name not in content:
+                response = generate_bad_request_response(
+                    f"{self.entity_label} data is required to create a {self.entity_name}."
+                )
+                return response
+            entity = self.entity_class(
+                **self._get_column_data(content[self.entity_name])
+            )
+            status, entity_data = entity.add(content.get("db_session"))
+            if not status:
+                response = generate_not_acceptable_response(
+                    f"{self.entity_label} creation failed."
+                )
+                return response
+            response = generate_success_response(
+                f"{self.entity_name} created successfully"
+            )
+            logger.opt(lazy=True).success(
+                "{} created: {}",
+                lambda: self.entity_label,
+                lambda: summarize(entity_data),
+            )
+            response[self.entity_name] = entity_data.to_dict()
+        except Exception as ex:
+            logger.exception(f"Error in create_{self.entity_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def get(self, content):
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.opt(lazy=True).debug(
+                "Fetching {} with content: {}",
+                lambda: self.entity_name,
+                lambda: summarize(content),
+            )
+            if self.id_column_name not in content:
+                response = generate_bad_request_response(
+                    f"{self.entity_label} ID is required to fetch {self.entity_name} details."
+                )
+                return response
+            params = extract_query_params(content)
+            status, fields = self._get_fields(params)
+            if not status:
+                response = generate_bad_request_response(fields)
+                return response
+            status, expand = self._get_expand(params, content)
+            if not status:
+                response = generate_bad_request_response(expand)
+                return response
+            status, entity = self.entity_class.get(
+                content, fields=fields, expand=expand
+            )
+            if not status:
+                response = generate_entity_not_found_response(self.entity_label)
+                return response
+            logger.opt(lazy=True).success(
+                "{} fetched: {}",
+                lambda: self.entity_label,
+                lambda: summarize(entity),
+            )
+            response = generate_success_response(
+                f"{self.entity_name} fetched successfully"
+            )
+            response[self.entity_name] = entity
+        except Exception as ex:
+            logger.exception(f"Error in get_{self.entity_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def export(self, content):
+        """Stream every row as NDJSON (default) or CSV, ``format=csv``.
+
+        The response carries the chunk generator under ``stream``, the route
+        sends it as a streaming response, so memory stays constant whatever
+        the size of the table. ``fields`` selects the exported columns.
+        """
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.opt(lazy=True).debug(
+                "Exporting {} with content: {}",
+                lambda: self.plural_name,
+                lambda: summarize(content),
+            )
+            params = extract_query_params(content)
+            export_format = params.get("format", "") or "ndjson"
+            if export_format not in EXPORT_FORMATS:
+                response = generate_bad_request_response(
+                    f"Export format must be one of: {', '.join(EXPORT_FORMATS)}."
+                )
+                return response
+            status, fields = self._get_fields(params)
+            if not status:
+                response = generate_bad_request_response(fields)
+                return response
+            column_names = fields or [
+                column_name
+                for column_name in self.columns_list
+                if column_name not in self.entity_class.hidden_columns
+            ]
+            mimetype, extension, write_rows = EXPORT_FORMATS[export_format]
+            batches = self.entity_class.stream_rows(content, column_names)
+            response = generate_success_response(
+                f"{self.plural_name} export started successfully"
+            )
+            response["stream"] = write_rows(batches, column_names)
+            response["mimetype"] = mimetype
+            response["filename"] = f"{self.plural_name}.{extension}"
+        except Exception as ex:
+            logger.exception(f"Error in export_{self.plural_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def get_version(self, content):
+        """Version probe of the entity `get` returns, for conditional GETs.
+        None with expanded relationships, their rows have their own versions.
+        """
+        if self.id_column_name not in content:
+            return False, None
+        status, expand = self._get_expand(extract_query_params(content), content)
+        if not status or expand:
+            return False, None
+        return self.entity_class.get_version(
+            content[self.id_column_name], content.get("db_session")
+        )
+
+    def get_all(self, content):
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.opt(lazy=True).debug(
+                "Fetching all {} with content: {}",
+                lambda: self.plural_name,
+                lambda: summarize(content),
+            )
+            params = extract_query_params(content)
+            status, fields = self._get_fields(params)
+            if not status:
+                response = generate_bad_request_response(fields)
+                return response
+            status, expand = self._get_expand(params, content)
+            if not status:
+                response = generate_bad_request_response(expand)
+                return response
+            _, entities = self.entity_class.get_all(
+                content, fields=fields, expand=expand
+            )
+            if not entities:
+                response = generate_entity_not_found_response(f"{self.entity_label}s")
+                return response
+            entities_data = self._serialize(content, entities, fields, expand)
+            logger.success(f"{self.entity_label}s fetched: {len(entities_data)}")
+            response = generate_success_response(
+                f"All {self.plural_name} fetched successfully"
+            )
+            response[self.entity_name] = entities_data
+        except Exception as ex:
+            logger.exception(f"Error in get_all_{self.plural_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def update(self, content):
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.opt(lazy=True).debug(
+                "Updating {} with content: {}",
+                lambda: self.entity_name,
+                lambda: summarize(content),
+            )
+            content[self.id_column_name] = getattr(
+                content[self.entity_name], self.id_column_name
+            )
+            status, entity = self.entity_class.get(content, require_object=True)
+            if not status:
+                response = generate_entity_not_found_response(self.entity_label)
+                return response
+            incoming_data = self._get_column_data(
+                content[self.entity_name], exclude_unset=True
+            )
+            for key, value in incoming_data.items():
+                if key == "attributes":
+                    entity.attributes = {**(entity.attributes or {}), **value}
+                else:
+                    setattr(entity, key, value)
+            entity.modified_at = content[self.entity_name].modified_at
+            status, updated_entity = entity.update(content.get("db_session"))
+            if not status:
+                response = generate_not_acceptable_response(
+                    f"{self.entity_label} update failed."
+                )
+                return response
+            logger.opt(lazy=True).success(
+                "{} updated: {}",
+                lambda: self.entity_label,
+                lambda: summarize(updated_entity),
+            )
+            response = generate_success_response(
+                f"{self.entity_name} updated successfully"
+            )
+            response[self.entity_name] = updated_entity
+        except Exception as ex:
+            logger.exception(f"Error in update_{self.entity_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def delete(self, content):
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.opt(lazy=True).debug(
+                "Deleting {} with content: {}",
+                lambda: self.entity_name,
+                lambda: summarize(content),
+            )
+            if self.id_column_name not in content:
+                response = generate_bad_request_response(
+                    f"{self.entity_label} ID is required to delete {self.entity_name}."
+                )
+                return response
+            status, entity = self.entity_class.get(content, require_object=True)
+            if not status:
+                response = generate_entity_not_found_response(self.entity_label)
+                return response
+
+            # for hard delete
+            # status = entity.delete(content.get("db_session"))
+
+            # for soft delete, deleted_by from the body or ?deleted_by= when
+            # the route runs without a logged in user, as for bulk_delete.
+            if "current_user" in content:
+                deleted_by = content["current_user"].user_id
+            else:
+                deleted_by = content.get("deleted_by") or extract_query_params(
+                    content
+                ).get("deleted_by")
+            if not deleted_by:
+                response = generate_bad_request_response(
+                    f"Logged in user or deleted_by is required to delete "
+                    f"{self.entity_name}."
+                )
+                return response
+            entity.deleted_by = deleted_by
+            entity.deleted_at = get_current_time()
+            status, deleted_entity = entity.update(content.get("db_session"))
+            if not status:
+                response = generate_not_acceptable_response(
+                    f"{self.entity_label} deletion failed."
+                )
+                return response
+            logger.opt(lazy=True).success(
+                "{} deleted: {}",
+                lambda: self.entity_label,
+                lambda: summarize(deleted_entity),
+            )
+            response = generate_success_response(
+                f"{self.entity_name} deleted successfully"
+            )
+            response[self.entity_name] = deleted_entity
+        except Exception as ex:
+            logger.exception(f"Error in delete_{self.entity_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def get_total(self, content):
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.opt(lazy=True).debug(
+                "Fetching total {} with content: {}",
+                lambda: self.plural_name,
+                lambda: summarize(content),
+            )
+            params = extract_query_params(content)
+            entity_query, _ = apply_search_filter(
+                self._get_listing_query(content), self.entity_class, params
+            )
+            total_records = entity_query.count()
+            logger.success(f"Total {self.plural_name} fetched: {total_records}")
+            response = generate_success_response(
+                f"Total {self.plural_name} fetched successfully"
+            )
+            response[f"total_{self.plural_name}"] = total_records
+        except Exception as ex:
+            logger.exception(f"Error in get_total_{self.plural_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def get_limited(self, content):
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.opt(lazy=True).debug(
+                "Fetching limited {} with content: {}",
+                lambda: self.plural_name,
+                lambda: summarize(content),
+            )
+            params = extract_query_params(content)
+            status, fields = self._get_fields(params)
+            if not status:
+                response = generate_bad_request_response(fields)
+                return response
+            status, expand = self._get_expand(params, content)
+            if not status:
+                response = generate_bad_request_response(expand)
+                return response
+            status, entities, next_cursor = paginate_query(
+                self._get_listing_query(content),
+                self.entity_class,
+                self.id_column_name,
+                params,
+                load_columns=self._get_load_columns(fields, expand),
+                expand=expand,
+                include_deleted=content.get("include_deleted", False),
+            )
+            if not status:
+                response = generate_bad_request_response("Invalid pagination cursor.")
+                return response
+            entities_data = self._serialize(content, entities, fields, expand)
+            logger.success(f"{self.entity_label}s fetched: {len(entities_data)}")
+            response = generate_success_response(
+                f"Limited {self.plural_name} fetched successfully"
+            )
+            response["records"] = entities_data
+            response["columns_list"] = fields or self.columns_list
+            response["next_cursor"] = next_cursor
+        except Exception as ex:
+            logger.exception(f"Error in get_limited_{self.plural_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def get_filtered(self, content):
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.opt(lazy=True).debug(
+                "Fetching filtered {} with content: {}",
+                lambda: self.plural_name,
+                lambda: summarize(content),
+            )
+            params = extract_query_params(content)
+            status, fields = self._get_fields(params)
+            if not status:
+                response = generate_bad_request_response(fields)
+                return response
+            status, expand = self._get_expand(params, content)
+            if not status:
+                response = generate_bad_request_response(expand)
+                return response
+            entity_query, rank_column = apply_search_filter(
+                self._get_listing_query(content), self.entity_class, params
+            )
+            status, entities, next_cursor = paginate_query(
+                entity_query,
+                self.entity_class,
+                self.id_column_name,
+                params,
+                rank_column,
+                self._get_load_columns(fields, expand),
+                expand,
+                content.get("include_deleted", False),
+            )
+            if not status:
+                response = generate_bad_request_response("Invalid pagination cursor.")
+                return response
+            entities_data = self._serialize(content, entities, fields, expand)
+            logger.success(f"{self.entity_label}s fetched: {len(entities_data)}")
+            response = generate_success_response(
+                f"Filtered {self.plural_name} fetched successfully"
+            )
+            response["records"] = entities_data
+            response["columns_list"] = fields or self.columns_list
+            response["next_cursor"] = next_cursor
+        except Exception as ex:
+            logger.exception(f"Error in get_filtered_{self.plural_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def get_paged(self, content):
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.opt(lazy=True).debug(
+                "Fetching paged {} with content: {}",
+                lambda: self.plural_name,
+                lambda: summarize(content),
+            )
+            params = extract_query_params(content)
+            status, fields = self._get_fields(params)
+            if not status:
+                response = generate_bad_request_response(fields)
+                return response
+            status, expand = self._get_expand(params, content)
+            if not status:
+                response = generate_bad_request_response(expand)
+                return response
+            entity_query, rank_column = apply_search_filter(
+                self._get_listing_query(content), self.entity_class, params
+            )
+            status, entities, next_cursor, total_records = paginate_query_with_total(
+                entity_query,
+                self.entity_class,
+                self.id_column_name,
+                params,
+                rank_column,
+                self._get_load_columns(fields, expand),
+                expand,
+                content.get("include_deleted", False),
+            )
+            if not status:
+                response = generate_bad_request_response("Invalid pagination cursor.")
+                return response
+            entities_data = self._serialize(content, entities, fields, expand)
+            logger.success(f"{self.entity_label}s fetched: {len(entities_data)}")
+            response = generate_success_response(
+                f"Paged {self.plural_name} fetched successfully"
+            )
+            response["records"] = entities_data
+            response["columns_list"] = fields or self.columns_list
+            response["next_cursor"] = next_cursor
+            response["total_records"] = total_records
+            response["is_total_estimated"] = is_total_estimated(params)
+        except Exception as ex:
+            logger.exception(f"Error in get_paged_{self.plural_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def _get_fields(self, params):
+        """Columns requested with ``fields=a,b`` in the query params, the id
+        column first.
+
+        Returns:
+            tuple: (status, fields). fields is None without the param and the
+            error message when a field is unknown.
+        """
+        requested_fields = params.get("fields", "")
+        if not requested_fields:
+            return True, None
+        fields = [self.id_column_name]
+        for field in requested_fields.split(","):
+            field = field.strip()
+            if field and field not in fields:
+                fields.append(field)
+        unknown_fields = [
+            field
+            for field in fields
+            if field not in self.columns_list
+            or field in self.entity_class.hidden_columns
+        ]
+        if unknown_fields:
+            return False, f"Unknown {self.entity_name} fields: {', '.join(unknown_fields)}"
+        return True, fields
+
+    def _get_expand(self, params, content):
+        """Relationships requested with ``expand=a,b``. Without the param the
+        ``Resolve-Relationships`` header expands the single row references
+        (e.g. the brand and category of a product).
+
+        Returns:
+            tuple: (status, expand), expand being None when nothing is
+            expanded and the error message when a relationship is unknown.
+        """
+        requested_expand = params.get("expand", "")
+        if not requested_expand:
+            if content.get("resolve_relationships"):
+                return True, get_reference_names(self.entity_class) or None
+            return True, None
+        expand = list(
+            dict.fromkeys(
+                name.strip() for name in requested_expand.split(",") if name.strip()
+            )
+        )
+        relationships = get_relationships(self.entity_class)
+        unknown_relationships = [name for name in expand if name not in relationships]
+        if unknown_relationships:
+            return (
+                False,
+                f"Unknown {self.entity_name} relationships: "
+                f"{', '.join(unknown_relationships)}",
+            )
+        return True, expand or None
+
+    def _get_load_columns(self, fields, expand=None):
+        return self.entity_class.get_load_columns(fields, expand) if fields else None
+
+    def _serialize(self, content, entities, fields, expand):
+        return serialize_entities(
+            self.entity_class,
+            entities,
+            fields,
+            expand,
+            resolve_session(content=content),
+            content.get("include_deleted", False),
+        )
+
+    def _get_listing_query(self, content):
+        entity_query = resolve_session(content=content).query(self.entity_class)
+        if not content.get("include_deleted"):
+            entity_query = entity_query.filter(self.entity_class.deleted_by.is_(None))
+        return entity_query
+
+    def bulk_create(self, content):
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.debug(
+                f"Bulk creating {len(content[self.entity_name])} {self.plural_name}"
+            )
+            rows = [
+                (index, self._get_column_data(entity_data))
+                for index, entity_data in content[self.entity_name]
+            ]
+            errors = self.entity_class.bulk_add(
+                rows, content.get("db_session"), self._get_chunk_size(content)
+            )
+            response = self._generate_bulk_response("created", content, rows, errors)
+        except Exception as ex:
+            logger.exception(f"Error in bulk_create_{self.plural_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def bulk_update(self, content):
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.debug(
+                f"Bulk updating {len(content[self.entity_name])} {self.plural_name}"
+            )
+            rows = []
+            for index, entity_data in content[self.entity_name]:
+                mapping = self._get_column_data(entity_data, exclude_unset=True)
+                mapping[self.id_column_name] = getattr(entity_data, self.id_column_name)
+                rows.append((index, mapping))
+            errors = self.entity_class.bulk_update(
+                rows, content.get("db_session"), self._get_chunk_size(content)
+            )
+            response = self._generate_bulk_response("updated", content, rows, errors)
+        except Exception as ex:
+            logger.exception(f"Error in bulk_update_{self.plural_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def bulk_delete(self, content):
+        response = DEFAULT_API_RESPONSE_OBJ.copy()
+        try:
+            logger.debug(
+                f"Bulk deleting {len(content[self.entity_name])} {self.plural_name}"
+            )
+            rows, errors = [], {}
+            for index, entity_data in content[self.entity_name]:
+                mapping = {
+                    self.id_column_name: getattr(entity_data, self.id_column_name),
+                    "deleted_by": entity_data.deleted_by,
+                    "deleted_at": entity_data.deleted_at or get_current_time(),
+                }
+                if "current_user" in content:
+                    mapping["deleted_by"] = content["current_user"].user_id
+                if not mapping["deleted_by"]:
+                    errors[index] = (
+                        f"Logged in user or deleted_by is required to delete "
+                        f"{self.entity_name}."
+                    )
+                    continue
+                rows.append((index, mapping))
+            errors.update(
+                self.entity_class.bulk_update(
+                    rows, content.get("db_session"), self._get_chunk_size(content)
+                )
+            )
+            response = self._generate_bulk_response("deleted", content, rows, errors)
+        except Exception as ex:
+            logger.exception(f"Error in bulk_delete_{self.plural_name}: {ex}")
+            response = generate_internal_server_error_response(str(ex))
+        return response
+
+    def _generate_bulk_response(self, action, content, rows, errors):
+        # Rows rejected by schema validation in the dispatcher come first.
+        results = list(content.get("rejected_records", []))
+        written_indexes = {index for index, _ in rows}
+        for index, message in errors.items():
+            if index not in written_indexes:
+                results.append({"index": index, "status": False, "msg": message})
+        for index, mapping in rows:
+            result = {
+                "index": index,
+                "status": index not in errors,
+                self.id_column_name: mapping[self.id_column_name],
+            }
+            if index in errors:
+                result["msg"] = errors[index]
+            results.append(result)
+        results.sort(key=lambda result: result["index"])
+        total_succeeded = sum(1 for result in results if result["status"])
+        total_failed = len(results) - total_succeeded
+        if not total_succeeded:
+            response = generate_not_acceptable_response(
+                self.plural_name, f"No records were {action} for"
+            )
+        else:
+            response = generate_success_response(
+                f"{total_succeeded} of {len(results)} {self.plural_name} {action} successfully"
+            )
+        logger.success(
+            f"Bulk {action} {self.plural_name}: {total_succeeded} succeeded, "
+            f"{total_failed} failed"
+        )
+        response["records"] = results
+        response["total_succeeded"] = total_succeeded
+        response["total_failed"] = total_failed
+        return response
+
+    @staticmethod
+    def _get_chunk_size(content):
+        try:
+            chunk_size = int(content.get("chunk_size", BULK_WRITE_CHUNK_SIZE))
+        except (TypeError, ValueError):
+            return BULK_WRITE_CHUNK_SIZE
+        return chunk_size if chunk_size > 0 else BULK_WRITE_CHUNK_SIZE
+
+    def _get_column_data(self, entity_data, exclude_unset=False):
+        # Schemas may carry fields that are not columns of the entity table.
+        return {
+            key: value
+            for key, value in entity_data.model_dump(exclude_unset=exclude_unset).items()
+            if key in self.columns_list
+        }
@@ -0,0 +1,131 @@
+import copy
+import os
+import threading
+
+from infra.cache import TTLCache, create_cache
+from infra.environment import (
+    ENTITY_CACHE_BACKEND,
+    ENTITY_CACHE_MEMORY_MAX_TTL,
+    ENTITY_CACHE_SIZE,
+    ENTITY_CACHE_TTL,
+    REDIS_URL,
+    WEB_CONCURRENCY,
+)
+from infra.logging import logger
+
+
+class EntityCache:
+    """Read-through cache of entity dicts, keyed by entity name and id.
+
+    EntityModel.get fills it and EntityModel.after_write drops the ids of
+    every committed write. With the memory backend each worker has its own
+    cache, writes served by another worker are only seen once the entry
+    expires; use the redis backend when running several workers.
+
+    Args:
+        backend: cache built by infra.cache.create_cache, None disables it.
+        max_ttl (float): upper bound of the entity TTLs, None for no bound.
+    """
+
+    def __init__(self, backend, max_ttl=None):
+        self.backend = backend
+        self.max_ttl = max_ttl
+        self.counters = {}
+        self._ttls = {}
+        self._lock = threading.Lock()
+
+    def get_ttl(self, entity_name):
+        if entity_name not in self._ttls:
+            ttl = float(
+                os.environ.get(f"{entity_name.upper()}_CACHE_TTL", ENTITY_CACHE_TTL)
+            )
+            if self.max_ttl is not None:
+                ttl = min(ttl, self.max_ttl)
+            self._ttls[entity_name] = ttl
+        return self._ttls[entity_name]
+
+    def get(self, entity_name, entity_id, count=True):
+        if self.backend is None or self.get_ttl(entity_name) <= 0:
+            return None
+        try:
+            entity_data = self.backend.get(f"{entity_name}:{entity_id}")
+        except Exception as ex:
+            logger.warning(f"Entity cache read failed for {entity_name}: {ex}")
+            entity_data = None
+        if count:
+            self._count(entity_name, "misses" if entity_data is None else "hits")
+        # Deep copy, callers may change the dict they get or its nested values
+        # like attributes.
+        return None if entity_data is None else copy.deepcopy(entity_data)
+
+    def set(self, entity_name, entity_id, entity_data):
+        ttl = self.get_ttl(entity_name)
+        if self.backend is None or ttl <= 0:
+            return
+        try:
+            self.backend.set(
+                f"{entity_name}:{entity_id}", copy.deepcopy(entity_data), ttl
+            )
+        except Exception as ex:
+            logger.warning(f"Entity cache write failed for {entity_name}: {ex}")
+
+    def invalidate(self, entity_name, entity_ids):
+        if self.backend is None:
+            return
+        try:
+            for entity_id in entity_ids:
+                self.backend.delete(f"{entity_name}:{entity_id}")
+        except Exception as ex:
+            logger.warning(f"Entity cache invalidation failed for {entity_name}: {ex}")
+
+    def clear(self):
+        if self.backend is not None:
+            self.backend.clear()
+
+    def _count(self, entity_name, counter_name):
+        with self._lock:
+            counters = self.counters.setdefault(entity_name, {"hits": 0, "misses": 0})
+            counters[counter_name] += 1
+
+    def stats(self):
+        """Backend stats and hits/misses per entity."""
+        if self.backend is None:
+            return {"backend": None}
+        return {
+            "backend": type(self.backend).__name__,
+            **self.backend.stats(),
+            "entities": {
+                entity_name: dict(counters)
+                for entity_name, counters in self.counters.items()
+            },
+        }
+
+
+def create_entity_cache(backend_name=ENTITY_CACHE_BACKEND, workers=WEB_CONCURRENCY):
+    """Entity cache of the configured backend.
+
+    An in-process cache (memory, or redis without the redis package) is not
+    shared by the workers: with more than one its TTLs are capped at
+    ENTITY_CACHE_MEMORY_MAX_TTL so other workers' writes show up quickly.
+    """
+    if backend_name == "none":
+        return EntityCache(None)
+    backend = create_cache(
+        backend_name,
+        ENTITY_CACHE_SIZE,
+        ENTITY_CACHE_TTL,
+        REDIS_URL,
+        prefix="entity:",
+    )
+    if not isinstance(backend, TTLCache) or workers <= 1:
+        return EntityCache(backend)
+    if ENTITY_CACHE_TTL > ENTITY_CACHE_MEMORY_MAX_TTL:
+        logger.warning(
+            f"In-process entity cache with {workers} workers, TTLs capped from "
+            f"{ENTITY_CACHE_TTL}s to {ENTITY_CACHE_MEMORY_MAX_TTL}s; set "
+            "ENTITY_CACHE_BACKEND=redis to share the cache between workers"
+        )
+    return EntityCache(backend, max_ttl=ENTITY_CACHE_MEMORY_MAX_TTL)
+
+
+entity_cache = create_entity_cache()
@@ -0,0 +1,39 @@
+import csv
+import io
+
+from flask import json
+
+
+def write_ndjson(batches, column_names):
+    """One JSON object per line, one chunk per batch of rows."""
+    for batch in batches:
+        yield "".join(
+            f"{json.dumps(dict(zip(column_names, row)))}\n" for row in batch
+        )
+
+
+def write_csv(batches, column_names):
+    """Header line, then one chunk per batch of rows. JSON columns are written
+    as JSON text."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(column_names)
+    yield buffer.getvalue()
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            [
+                json.dumps(value) if isinstance(value, (dict, list)) else value
+                for value in row
+            ]
+            for row in batch
+        )
+        yield buffer.getvalue()
+
+
+# format -> (mimetype, file extension, writer)
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson", write_ndjson),
+    "csv": ("text/csv", "csv", write_csv),
+}
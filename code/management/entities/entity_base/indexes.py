@@ -0,0 +1,43 @@
+from sqlalchemy import Index, text
+
+from infra.db_router import PARTIAL_INDEX_DIALECTS
+
+
+LIVE_ROWS_CRITERIA = "deleted_by IS NULL"
+
+
+def _supports_partial_indexes(ddl, target, bind, dialect, **kwargs):
+    return dialect.name in PARTIAL_INDEX_DIALECTS
+
+
+def _lacks_partial_indexes(ddl, target, bind, dialect, **kwargs):
+    return dialect.name not in PARTIAL_INDEX_DIALECTS
+
+
+def get_listing_indexes(table_name, id_column_name):
+    """Indexes of the listing pattern shared by every entity: rows not soft
+    deleted, ordered by (created_at, id) descending.
+
+    Backends with partial indexes get (created_at, id) over the live rows
+    only, the others a composite (deleted_by, created_at, id). Both are read
+    backwards for the descending order and serve the keyset cursor, counts
+    of the live rows use them too.
+
+    Returns:
+        tuple: indexes to put in the model ``__table_args__``.
+    """
+    return (
+        Index(
+            f"ix_{table_name}_live_created_at",
+            "created_at",
+            id_column_name,
+            sqlite_where=text(LIVE_ROWS_CRITERIA),
+            postgresql_where=text(LIVE_ROWS_CRITERIA),
+        ).ddl_if(callable_=_supports_partial_indexes),
+        Index(
+            f"ix_{table_name}_deleted_by_created_at",
+            "deleted_by",
+            "created_at",
+            id_column_name,
+        ).ddl_if(callable_=_lacks_partial_indexes),
+    )
@@ -0,0 +1,635 @@
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import load_only
+
+from infra.db_router import get_session
+from infra.logging import logger, summarize
+from management.entities.entity_base.cache import entity_cache
+from management.entities.entity_base.relationships import (
+    get_loader_options,
+    get_local_column_names,
+    serialize_entities,
+)
+from management.entities.entity_base.search import (
+    get_search_columns,
+    index_search_entries,
+    index_search_entry,
+    remove_search_entry,
+)
+from utils.constants import BULK_WRITE_CHUNK_SIZE, EXPORT_BATCH_SIZE
+
+
+class EntityModel:
+    """Generic persistence helpers shared by every entity model.
+
+    Entity models declare their columns and relationships and mix this class
+    in before ``db.Model``. Every helper accepts an optional ``db_session``
+    and otherwise uses the session selected for the request by
+    ``infra.db_router``, so all entities share the same session handling.
+    """
+
+    # Columns never returned by to_dict (e.g. password hashes).
+    hidden_columns = []
+
+    @classmethod
+    def get_entity_class(cls):
+        # Provider classes subclass the entity model, always query the base.
+        return cls.__mapper__.base_mapper.class_
+
+    @classmethod
+    def get_id_column_name(cls):
+        return inspect(cls).primary_key[0].name
+
+    @classmethod
+    def get_column_names(cls):
+        return [column.name for column in inspect(cls).columns]
+
+    @classmethod
+    def after_write(cls, entity_ids):
+        """Hook called with the ids of the rows committed by add, update,
+        delete and the bulk writes. Drops them from the entity cache,
+        overrides invalidating other caches must call it too.
+        """
+        entity_cache.invalidate(cls.__tablename__, entity_ids)
+
+    @classmethod
+    def get_load_columns(cls, fields, expand=None):
+        """Columns loaded for a projection on `fields`: the fields plus the id
+        and created_at columns listings are ordered and paged by, and the
+        columns the `expand` relationships join on."""
+        return list(
+            dict.fromkeys(
+                [
+                    cls.get_id_column_name(),
+                    "created_at",
+                    *fields,
+                    *get_local_column_names(cls, expand or []),
+                ]
+            )
+        )
+
+    def to_dict(self, fields=None):
+        return {
+            column_name: getattr(self, column_name)
+            for column_name in fields or self.get_column_names()
+            if column_name not in self.hidden_columns
+        }
+
+    def add(self, db_session=None):
+        try:
+            logger.opt(lazy=True).debug(
+                "Adding {}: {}",
+                lambda: self.__tablename__,
+                lambda: summarize(self),
+            )
+            return _add_entity(self, resolve_session(db_session))
+        except Exception as ex:
+            logger.exception(f"Error adding {self.__tablename__}: {ex}")
+            return False, None
+
+    def update(self, db_session=None):
+        try:
+            logger.opt(lazy=True).debug(
+                "Updating {}: {}",
+                lambda: self.__tablename__,
+                lambda: summarize(self),
+            )
+            return _update_entity(self, resolve_session(db_session))
+        except Exception as ex:
+            logger.exception(f"Error updating {self.__tablename__}: {ex}")
+            return False, None
+
+    def delete(self, db_session=None):
+        try:
+            logger.opt(lazy=True).debug(
+                "Deleting {}: {}",
+                lambda: self.__tablename__,
+                lambda: summarize(self),
+            )
+            return _delete_entity(self, resolve_session(db_session))
+        except Exception as ex:
+            logger.exception(f"Error deleting {self.__tablename__}: {ex}")
+            return False
+
+    @classmethod
+    def get(
+        cls, content, db_session=None, require_object=False, fields=None, expand=None
+    ):
+        """Fetch one row by id, as a dict unless require_object.
+
+        Args:
+            fields (list): columns to load and return, all when None.
+            expand (list): relationships loaded with the row and nested in
+                the dict.
+        """
+        try:
+            logger.opt(lazy=True).debug(
+                "Fetching {}: {}",
+                lambda: cls.__tablename__,
+                lambda: summarize(content),
+            )
+            return _get_entity(
+                cls.get_entity_class(),
+                content,
+                resolve_session(db_session, content),
+                require_object,
+                fields,
+                expand,
+            )
+        except Exception as ex:
+            logger.exception(f"Error fetching {cls.__tablename__}: {ex}")
+            return False, None
+
+    @classmethod
+    def get_version(cls, entity_id, db_session=None):
+        """modified_at of a not deleted row, read without loading the row.
+
+        Returns:
+            tuple: (status, modified_at), created_at for rows never modified.
+        """
+        try:
+            return _get_entity_version(
+                cls.get_entity_class(), entity_id, resolve_session(db_session)
+            )
+        except Exception as ex:
+            logger.exception(f"Error fetching {cls.__tablename__} version: {ex}")
+            return False, None
+
+    @classmethod
+    def get_all(cls, content, db_session=None, fields=None, expand=None):
+        try:
+            logger.debug(f"Fetching all {cls.__tablename__} records")
+            return _get_all_entities(
+                cls.get_entity_class(),
+                content,
+                resolve_session(db_session, content),
+                fields,
+                expand,
+            )
+        except Exception as ex:
+            logger.exception(f"Error fetching all {cls.__tablename__} records: {ex}")
+            return False, None
+
+    @classmethod
+    def stream_rows(
+        cls, content, column_names, db_session=None, batch_size=EXPORT_BATCH_SIZE
+    ):
+        """Read every row in batches without loading ORM objects.
+
+        The rows are fetched with yield_per (a server side cursor where the
+        driver has one), so memory does not grow with the table. Nothing is
+        read before the generator is iterated.
+
+        Yields:
+            list: up to batch_size row tuples, values in column_names order.
+        """
+        entity_class = cls.get_entity_class()
+        entity_query = select(
+            *[getattr(entity_class, column_name) for column_name in column_names]
+        )
+        if not content.get("include_deleted"):
+            entity_query = entity_query.where(entity_class.deleted_by.is_(None))
+        result = resolve_session(db_session, content).execute(
+            entity_query.execution_options(yield_per=batch_size)
+        )
+        try:
+            for batch in result.partitions():
+                yield [tuple(row) for row in batch]
+        except Exception as ex:
+            logger.exception(f"Error streaming {cls.__tablename__} rows: {ex}")
+            raise
+        finally:
+            result.close()
+
+    @classmethod
+    def bulk_add(cls, rows, db_session=None, chunk_size=BULK_WRITE_CHUNK_SIZE):
+        """Insert many rows with one executemany per chunk of rows.
+
+        Each chunk is committed on its own. When a chunk fails it is rolled
+        back and its rows are retried one by one, so a single bad row only
+        fails itself.
+
+        Args:
+            rows (list): (index, column mapping) pairs, index being the
+                position of the row in the request.
+            db_session (Session): session to write with.
+            chunk_size (int): rows written per transaction.
+
+        Returns:
+            dict: index -> error message for every row that was not written.
+        """
+        logger.debug(f"Bulk adding {len(rows)} {cls.__tablename__} records")
+        return _write_in_chunks(
+            cls.get_entity_class(),
+            rows,
+            resolve_session(db_session),
+            chunk_size,
+            _bulk_insert_chunk,
+        )
+
+    @classmethod
+    def bulk_update(cls, rows, db_session=None, chunk_size=BULK_WRITE_CHUNK_SIZE):
+        """Update many rows, same contract as `bulk_add`.
+
+        Mappings must carry the primary key, rows that do not exist or are
+        deleted are reported as failed. ``attributes`` is merged into the
+        stored attributes like the single row update does.
+        """
+        logger.debug(f"Bulk updating {len(rows)} {cls.__tablename__} records")
+        return _write_in_chunks(
+            cls.get_entity_class(),
+            rows,
+            resolve_session(db_session),
+            chunk_size,
+            _bulk_update_chunk,
+        )
+
+
+class EntityProvider:
+    """Attribute based lookups, mixed into the `<Entity>Provider` classes."""
+
+    @classmethod
+    def get_by_attribute(cls, attribute_name, content):
+        try:
+            logger.opt(lazy=True).debug(
+                "Fetching {} by attribute {}: {}",
+                lambda: cls.__tablename__,
+                lambda: attribute_name,
+                lambda: summarize(content),
+            )
+            return _get_entity_by_attribute(
+                cls.get_entity_class(), attribute_name, content
+            )
+        except Exception:
+            logger.exception(
+                f"Critical error in {cls.__name__}.get_by_attribute - {content}"
+            )
+            return False, None
+
+    @classmethod
+    def get_collective_data_by_attribute(cls, attribute_name, content, require_object=False):
+        try:
+            logger.opt(lazy=True).debug(
+                "Fetching collective data by attribute {}: {}",
+                lambda: attribute_name,
+                lambda: summarize(content),
+            )
+            return _get_collective_entities_by_attribute(
+                cls.get_entity_class(), attribute_name, content, require_object
+            )
+        except Exception:
+            logger.exception(
+                f"Critical error in {cls.__name__}.get_collective_data_by_attribute - {content}"
+            )
+            return False, None
+
+
+def resolve_session(db_session=None, content=None):
+    if db_session is not None:
+        return db_session
+    if content and content.get("db_session") is not None:
+        return content["db_session"]
+    return get_session()
+
+
+# region Entity Helper Functions
+
+
+def _get_entity(
+    entity_class, content, db_session, require_object, fields=None, expand=None
+):
+    try:
+        entity_name = entity_class.__tablename__
+        id_column_name = entity_class.get_id_column_name()
+        if content.get(entity_name, ""):
+            content[id_column_name] = getattr(content[entity_name], id_column_name)
+        elif content.get("entity_id", ""):
+            content[id_column_name] = content["entity_id"]
+        # Only the dicts of not deleted rows are cached, without relationships.
+        use_cache = (
+            not require_object and not content.get("include_deleted") and not expand
+        )
+        if use_cache:
+            entity_data = entity_cache.get(entity_name, content[id_column_name])
+            if entity_data is not None:
+                if fields:
+                    entity_data = {name: entity_data[name] for name in fields}
+                return True, entity_data
+        entity_query = db_session.query(entity_class).filter(
+            getattr(entity_class, id_column_name) == content[id_column_name]
+        )
+        entity_query = _apply_load_options(
+            entity_query, entity_class, content, fields, expand
+        )
+        if not content.get("include_deleted"):
+            entity_query = entity_query.filter(entity_class.deleted_by.is_(None))
+        entity = entity_query.first()
+        if not entity:
+            logger.debug(f"{entity_class.__name__} not found")
+            return False, None
+        logger.opt(lazy=True).success(
+            "{} fetched: {}",
+            lambda: entity_class.__name__,
+            lambda: summarize(entity),
+        )
+        if require_object:
+            return True, entity
+        entity_data = serialize_entities(
+            entity_class,
+            [entity],
+            fields,
+            expand,
+            db_session,
+            content.get("include_deleted"),
+        )[0]
+        # Projections are not cached, the cache holds whole rows.
+        if use_cache and not fields:
+            entity_cache.set(entity_name, content[id_column_name], entity_data)
+        return True, entity_data
+    except Exception as ex:
+        logger.exception(f"Error fetching {entity_class.__tablename__}: {ex}")
+        raise ex
+
+
+def _load_only(entity_class, fields, expand=None):
+    return load_only(
+        *[
+            getattr(entity_class, column_name)
+            for column_name in entity_class.get_load_columns(fields, expand)
+        ]
+    )
+
+
+def _apply_load_options(entity_query, entity_class, content, fields, expand):
+    if fields:
+        entity_query = entity_query.options(_load_only(entity_class, fields, expand))
+    if expand:
+        entity_query = entity_query.options(
+            *get_loader_options(
+                entity_class, entity_class, expand, content.get("include_deleted")
+            )
+        )
+    return entity_query
+
+
+def _get_entity_version(entity_class, entity_id, db_session):
+    entity_data = entity_cache.get(entity_class.__tablename__, entity_id, count=False)
+    if entity_data is not None:
+        return True, entity_data.get("modified_at") or entity_data.get("created_at")
+    version = (
+        db_session.query(entity_class.modified_at, entity_class.created_at)
+        .filter(
+            getattr(entity_class, entity_class.get_id_column_name()) == entity_id,
+            entity_class.deleted_by.is_(None),
+        )
+        .first()
+    )
+    if not version:
+        return False, None
+    return True, version.modified_at or version.created_at
+
+
+def _get_all_entities(entity_class, content, db_session, fields=None, expand=None):
+    try:
+        entity_query = _apply_load_options(
+            db_session.query(entity_class), entity_class, content, fields, expand
+        )
+        if not content.get("include_deleted"):
+            entity_query = entity_query.filter(entity_class.deleted_by.is_(None))
+        entities = entity_query.all()
+        if not entities:
+            logger.debug(f"No {entity_class.__tablename__} records found")
+            return False, None
+        logger.success(f"{entity_class.__name__} records fetched: {len(entities)}")
+        return True, entities
+    except Exception as ex:
+        logger.exception(f"Error fetching all {entity_class.__tablename__}: {ex}")
+        raise ex
+
+
+def _delete_entity(entity, db_session):
+    entity_class = entity.get_entity_class()
+    id_column_name = entity_class.get_id_column_name()
+    entity_id = getattr(entity, id_column_name)
+    try:
+        db_session.query(entity_class).filter(
+            getattr(entity_class, id_column_name) == entity_id
+        ).delete()
+        remove_search_entry(db_session, entity_class, entity_id)
+        db_session.commit()
+        entity_class.after_write([entity_id])
+        logger.success(f"{entity_class.__name__} deleted: {entity_id}")
+        return True
+    except SQLAlchemyError as ex:
+        logger.exception(f"Error deleting {entity_class.__tablename__}: {ex}")
+        db_session.rollback()
+        return False
+
+
+def _add_entity(entity, db_session):
+    try:
+        db_session.add(entity)
+        index_search_entry(db_session, entity)
+        db_session.commit()
+        db_session.refresh(entity)
+        entity.after_write([getattr(entity, entity.get_id_column_name())])
+        logger.opt(lazy=True).success(
+            "{} added: {}",
+            lambda: entity.__class__.__name__,
+            lambda: summarize(entity),
+        )
+        return True, entity
+    except SQLAlchemyError as ex:
+        logger.exception(f"Error adding {entity.__tablename__}: {ex}")
+        db_session.rollback()
+        raise ex
+
+
+def _update_entity(entity, db_session):
+    try:
+        updated_entity = db_session.merge(entity)
+        if not updated_entity:
+            logger.error(f"{entity.__class__.__name__} not updated")
+            return False, None
+        index_search_entry(db_session, updated_entity)
+        db_session.commit()
+        entity.after_write([getattr(updated_entity, entity.get_id_column_name())])
+        updated_entity_dict = updated_entity.to_dict()
+        logger.opt(lazy=True).success(
+            "{} updated: {}",
+            lambda: entity.__class__.__name__,
+            lambda: summarize(updated_entity),
+        )
+        return True, updated_entity_dict
+    except Exception as ex:
+        logger.exception(f"Error updating {entity.__tablename__}: {ex}")
+        db_session.rollback()
+        raise ex
+
+
+# endregion
+
+
+# region Bulk Write Helper Functions
+
+
+def _write_in_chunks(entity_class, rows, db_session, chunk_size, write_chunk):
+    errors = {}
+    id_column_name = entity_class.get_id_column_name()
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start : start + chunk_size]
+        try:
+            chunk_errors = write_chunk(db_session, entity_class, chunk)
+            db_session.commit()
+            errors.update(chunk_errors)
+            entity_class.after_write(
+                [
+                    mapping[id_column_name]
+                    for index, mapping in chunk
+                    if index not in chunk_errors
+                ]
+            )
+        except SQLAlchemyError as ex:
+            db_session.rollback()
+            if len(chunk) == 1:
+                logger.debug(f"{entity_class.__name__} row {chunk[0][0]} failed: {ex}")
+                errors[chunk[0][0]] = str(getattr(ex, "orig", None) or ex)
+                continue
+            logger.warning(
+                f"Bulk write of {len(chunk)} {entity_class.__tablename__} records "
+                f"failed, retrying row by row: {ex}"
+            )
+            for row in chunk:
+                errors.update(
+                    _write_in_chunks(entity_class, [row], db_session, 1, write_chunk)
+                )
+    return errors
+
+
+def _bulk_insert_chunk(db_session, entity_class, chunk):
+    mappings = [mapping for _, mapping in chunk]
+    db_session.bulk_insert_mappings(entity_class, mappings)
+    index_search_entries(db_session, entity_class, mappings)
+    return {}
+
+
+def _bulk_update_chunk(db_session, entity_class, chunk):
+    id_column_name = entity_class.get_id_column_name()
+    id_column = getattr(entity_class, id_column_name)
+    stored_columns = [id_column, entity_class.attributes] + [
+        getattr(entity_class, column) for column in get_search_columns(entity_class)
+    ]
+    stored_rows = {
+        getattr(row, id_column_name): row._asdict()
+        for row in db_session.query(*stored_columns).filter(
+            id_column.in_([mapping[id_column_name] for _, mapping in chunk]),
+            entity_class.deleted_by.is_(None),
+        )
+    }
+    errors, mappings = {}, []
+    for index, mapping in chunk:
+        stored_row = stored_rows.get(mapping[id_column_name])
+        if stored_row is None:
+            errors[index] = f"{entity_class.__name__} not found."
+            continue
+        if "attributes" in mapping:
+            mapping["attributes"] = {
+                **(stored_row["attributes"] or {}),
+                **(mapping["attributes"] or {}),
+            }
+        mappings.append(mapping)
+    if mappings:
+        db_session.bulk_update_mappings(entity_class, mappings)
+        index_search_entries(
+            db_session,
+            entity_class,
+            [
+                {**stored_rows[mapping[id_column_name]], **mapping}
+                for mapping in mappings
+            ],
+        )
+    return errors
+
+
+# endregion
+
+
+# region EntityProvider Helper Functions
+
+
+def _get_entity_by_attribute(entity_class, attribute_name, content):
+    try:
+        entity_query = (
+            resolve_session(content=content)
+            .query(entity_class)
+            .filter(
+                getattr(entity_class, attribute_name)
+                == content.get(f"{attribute_name}", "")
+            )
+        )
+        if not content.get("include_deleted", False):
+            entity_query = entity_query.filter(entity_class.deleted_by.is_(None))
+        entity = entity_query.first()
+        if not entity:
+            logger.debug(
+                f"No {entity_class.__tablename__} found with {attribute_name} "
+                f"in {content.get(f'{attribute_name}', '')}"
+            )
+            return False, None
+        logger.opt(lazy=True).success(
+            "{} fetched by attribute {}: {}",
+            lambda: entity_class.__name__,
+            lambda: attribute_name,
+            lambda: summarize(entity),
+        )
+        return True, entity
+    except Exception as ex:
+        logger.exception(
+            f"Error fetching {entity_class.__tablename__} by attribute {attribute_name}: {ex}"
+        )
+        raise ex
+
+
+def _get_collective_entities_by_attribute(
+    entity_class, attribute_name, content, require_object
+):
+    try:
+        entities = (
+            resolve_session(content=content)
+            .query(entity_class)
+            .filter(
+                getattr(entity_class, attribute_name).in_(
+                    content.get(f"{attribute_name}", [])
+                )
+            )
+            .all()
+        )
+        if require_object:
+            entities_dict = {
+                getattr(entity, attribute_name): entity for entity in entities
+            }
+        else:
+            entities_dict = {
+                getattr(entity, attribute_name): entity.to_dict() for entity in entities
+            }
+        if not entities_dict:
+            logger.debug(
+                f"No {entity_class.__tablename__} records found with {attribute_name} "
+                f"in {content.get(f'{attribute_name}', '')}"
+            )
+            return False, None
+        logger.success(
+            f"{entity_class.__name__} records fetched by attribute {attribute_name}: "
+            f"{len(entities_dict)}"
+        )
+        return True, entities_dict
+    except Exception as ex:
+        logger.exception(
+            f"Error fetching collective {entity_class.__tablename__} data by "
+            f"attribute {attribute_name}: {ex}"
+        )
+        raise ex
+
+
+# endregion
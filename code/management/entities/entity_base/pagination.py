@@ -0,0 +1,326 @@
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, desc, func, not_, or_, text
+from sqlalchemy.orm import aliased, load_only
+
+from infra.logging import logger
+from management.entities.entity_base.relationships import get_loader_options
+
+
+# region keyset (cursor) pagination
+
+
+def encode_cursor(created_at, entity_id, rank=None):
+    """Build an opaque cursor token pointing at the last record of a page.
+
+    Args:
+        created_at (datetime): created_at of the last record returned.
+        entity_id (str): primary key of the last record returned.
+        rank (float): search rank of the last record for ranked listings.
+
+    Returns:
+        str: url-safe token to be sent back as ``?cursor=<token>``.
+    """
+    position = {
+        "created_at": created_at.isoformat() if created_at else None,
+        "entity_id": entity_id,
+    }
+    if rank is not None:
+        position["rank"] = rank
+    token = base64.urlsafe_b64encode(
+        json.dumps(position, separators=(",", ":")).encode("utf-8")
+    )
+    return token.decode("utf-8").rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded_cursor = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(
+            base64.urlsafe_b64decode(padded_cursor.encode("utf-8")).decode("utf-8")
+        )
+        created_at = position.get("created_at")
+        if created_at:
+            created_at = datetime.fromisoformat(created_at)
+        return True, (created_at, position["entity_id"], position.get("rank"))
+    except (ValueError, KeyError, TypeError, AttributeError) as ex:
+        logger.debug(f"Invalid pagination cursor {cursor}: {ex}")
+        return False, None
+
+
+def paginate_query(
+    entity_query,
+    entity_class,
+    id_column_name,
+    params,
+    rank_column=None,
+    load_columns=None,
+    expand=None,
+    include_deleted=False,
+):
+    """Order a listing query by (created_at, entity_id) and fetch one page.
+
+    When ``cursor`` is present in params the page is located with a keyset
+    predicate on the ordering columns, so deep pages cost the same as the
+    first one. Records without created_at are read by a second query once the
+    dated ones run out. Otherwise the legacy ``skip`` offset is used. In both modes a
+    ``next_cursor`` is returned when more records are available.
+
+    Args:
+        entity_query (Query): filtered query on the entity.
+        entity_class (Model): entity model class.
+        id_column_name (str): name of the primary key column of the entity.
+        params (dict): query params extracted by ``extract_query_params``.
+        rank_column (ColumnElement): search rank, lower is better. When given
+            records are ordered by rank first.
+        load_columns (list): names of the only columns loaded, all when None.
+            Must include the id and created_at columns.
+        expand (list): relationships eager loaded with the page.
+        include_deleted (bool): also load soft deleted related rows.
+
+    Returns:
+        tuple: (status, records, next_cursor). status is False when the cursor
+        could not be decoded.
+    """
+    if load_columns:
+        entity_query = entity_query.options(_load_only(entity_class, load_columns))
+    if expand:
+        entity_query = entity_query.options(
+            *get_loader_options(entity_class, entity_class, expand, include_deleted)
+        )
+    if rank_column is not None:
+        entity_query = entity_query.add_columns(rank_column)
+    status, page_query, null_query = _locate_page(
+        entity_query,
+        entity_class,
+        id_column_name,
+        params,
+        rank_column,
+        null_phase=rank_column is None,
+    )
+    if not status:
+        return False, None, None
+    rows = page_query.all()
+    limit = int(params.get("limit", 10))
+    if null_query is not None and len(rows) <= limit:
+        # Records without created_at come after every dated one.
+        rows.extend(null_query.limit(limit + 1 - len(rows)).all())
+    if rank_column is not None:
+        records, ranks = [row[0] for row in rows], [row[1] for row in rows]
+    else:
+        records, ranks = rows, []
+    records, next_cursor = _trim_page(records, ranks, id_column_name, params)
+    return True, records, next_cursor
+
+
+def paginate_query_with_total(
+    entity_query,
+    entity_class,
+    id_column_name,
+    params,
+    rank_column=None,
+    load_columns=None,
+    expand=None,
+    include_deleted=False,
+):
+    """Fetch one page and the total number of matching records in one query.
+
+    The filtered query is wrapped in a subquery carrying ``COUNT(*) OVER()``,
+    and ordering, cursor and limit are applied on top of it, so the total is
+    not affected by the cursor predicate and the search filter is compiled
+    and executed once. With ``count=estimated`` in params and no search
+    filter the window is skipped and the total comes from
+    ``estimate_total_records`` instead.
+
+    Returns:
+        tuple: (status, records, next_cursor, total_records).
+    """
+    if is_total_estimated(params):
+        status, records, next_cursor = paginate_query(
+            entity_query,
+            entity_class,
+            id_column_name,
+            params,
+            rank_column,
+            load_columns,
+            expand,
+            include_deleted,
+        )
+        if not status:
+            return False, None, None, None
+        total_records = estimate_total_records(entity_query.session, entity_class)
+        return True, records, next_cursor, total_records
+
+    window_columns = [func.count().over().label("total_records")]
+    if rank_column is not None:
+        window_columns.append(rank_column.label("search_rank"))
+    if load_columns:
+        # Only the projected columns go through the subquery.
+        counted_query = entity_query.with_entities(
+            *[getattr(entity_class, column_name) for column_name in load_columns],
+            *window_columns,
+        )
+    else:
+        counted_query = entity_query.add_columns(*window_columns)
+    counted_records = counted_query.subquery("counted_records")
+    counted_entity = aliased(entity_class, counted_records)
+    counted_rank = counted_records.c.search_rank if rank_column is not None else None
+
+    page_query = entity_query.session.query(
+        counted_entity, counted_records.c.total_records
+    )
+    if load_columns:
+        page_query = page_query.options(_load_only(counted_entity, load_columns))
+    if expand:
+        page_query = page_query.options(
+            *get_loader_options(counted_entity, entity_class, expand, include_deleted)
+        )
+    if counted_rank is not None:
+        page_query = page_query.add_columns(counted_rank)
+    status, page_query, _ = _locate_page(
+        page_query, counted_entity, id_column_name, params, counted_rank
+    )
+    if not status:
+        return False, None, None, None
+    rows = page_query.all()
+    records = [row[0] for row in rows]
+    ranks = [row[2] for row in rows] if counted_rank is not None else []
+    if rows:
+        total_records = rows[0][1]
+    elif params.get("cursor", "") or int(params.get("skip", 0)):
+        # Past the last page the window has no row to report the total on.
+        total_records = entity_query.order_by(None).count()
+    else:
+        total_records = 0
+    records, next_cursor = _trim_page(records, ranks, id_column_name, params)
+    return True, records, next_cursor, total_records
+
+
+def _load_only(entity, load_columns):
+    return load_only(
+        *[getattr(entity, column_name) for column_name in load_columns]
+    )
+
+
+def is_total_estimated(params):
+    # The estimate is of the whole table, a search filter needs the exact count.
+    return params.get("count", "") == "estimated" and not params.get(
+        "search_string", ""
+    )
+
+
+def _locate_page(
+    entity_query, entity_class, id_column_name, params, rank_column, null_phase=False
+):
+    """Apply ordering, cursor predicate and limit to a listing query.
+
+    Dated records sort before the ones without created_at. With
+    ``null_phase`` the cursor predicate is a range on (created_at, id) the
+    listing index can seek, and the undated records are left to the returned
+    null query, to be read once the dated ones run out. Otherwise one
+    predicate covers both, which ranked and windowed queries need but which
+    has to scan the index.
+
+    Returns:
+        tuple: (status, page_query, null_query), null_query is None when no
+        null phase follows the page.
+    """
+    limit = int(params.get("limit", 10))
+    cursor = params.get("cursor", "")
+    id_column = getattr(entity_class, id_column_name)
+    created_at_column = entity_class.created_at
+    null_query = None
+
+    if rank_column is not None:
+        entity_query = entity_query.order_by(rank_column)
+    entity_query = entity_query.order_by(desc(created_at_column), desc(id_column))
+    if cursor:
+        status, position = decode_cursor(cursor)
+        if not status:
+            return False, None, None
+        created_at, entity_id, rank = position
+        if created_at is None:
+            # NULL created_at sorts last in descending order on sqlite and mysql.
+            keyset_criteria = and_(created_at_column.is_(None), id_column < entity_id)
+        elif null_phase:
+            keyset_criteria = and_(
+                created_at_column <= created_at,
+                not_(and_(created_at_column == created_at, id_column >= entity_id)),
+            )
+            if _is_nullable(created_at_column):
+                null_query = entity_query.filter(created_at_column.is_(None))
+        else:
+            keyset_criteria = or_(
+                created_at_column < created_at,
+                and_(created_at_column == created_at, id_column < entity_id),
+                created_at_column.is_(None),
+            )
+        if rank_column is not None and rank is not None:
+            keyset_criteria = or_(
+                rank_column > rank, and_(rank_column == rank, keyset_criteria)
+            )
+        entity_query = entity_query.filter(keyset_criteria)
+    else:
+        entity_query = entity_query.offset(int(params.get("skip", 0)))
+    return True, entity_query.limit(limit + 1), null_query
+
+
+def _is_nullable(column):
+    return any(
+        getattr(column_element, "nullable", True)
+        for column_element in column.property.columns
+    )
+
+
+def _trim_page(records, ranks, id_column_name, params):
+    limit = int(params.get("limit", 10))
+    next_cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        last_record = records[-1]
+        next_cursor = encode_cursor(
+            last_record.created_at,
+            getattr(last_record, id_column_name),
+            ranks[limit - 1] if ranks else None,
+        )
+    return records, next_cursor
+
+
+def estimate_total_records(db_session, entity_class):
+    """Cheap row count of an entity table that ignores any filter.
+
+    Meant for very large tables where an exact COUNT(*) is too slow: mysql
+    reports the InnoDB statistics estimate, sqlite the ANALYZE statistics or,
+    when the table was never analyzed, its highest rowid.
+    """
+    table_name = entity_class.__tablename__
+    dialect_name = db_session.get_bind().dialect.name
+    if dialect_name == "mysql":
+        return db_session.execute(
+            text(
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = :table_name"
+            ),
+            {"table_name": table_name},
+        ).scalar()
+    if dialect_name == "sqlite":
+        has_statistics = db_session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        ).first()
+        if has_statistics:
+            statistics = db_session.execute(
+                text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table_name LIMIT 1"),
+                {"table_name": table_name},
+            ).scalar()
+            if statistics:
+                return int(statistics.split()[0])
+        return (
+            db_session.execute(text(f'SELECT MAX(rowid) FROM "{table_name}"')).scalar()
+            or 0
+        )
+    return db_session.query(entity_class).count()
+
+
+# endregion
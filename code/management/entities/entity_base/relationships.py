@@ -0,0 +1,151 @@
+from collections import defaultdict
+
+from sqlalchemy import tuple_
+from sqlalchemy.inspection import inspect
+from sqlalchemy.orm import joinedload, selectinload
+
+
+# region relationship expansion
+
+
+def get_relationships(entity_class):
+    """Relationships of an entity by name, backrefs included."""
+    return {
+        relationship.key: relationship
+        for relationship in inspect(entity_class).relationships
+    }
+
+
+def get_reference_names(entity_class):
+    """Relationships to a single row (many-to-one and one-to-one), the ones
+    the ``Resolve-Relationships`` header expands when ``expand`` is not given.
+    """
+    return [
+        name
+        for name, relationship in get_relationships(entity_class).items()
+        if not relationship.uselist and relationship.lazy != "dynamic"
+    ]
+
+
+def get_local_column_names(entity_class, expand):
+    """Columns of the entity the expanded relationships join on. They must be
+    loaded with a projection, and go through the paged listing subquery."""
+    relationships = get_relationships(entity_class)
+    return list(
+        dict.fromkeys(
+            local_column.key
+            for name in expand
+            for local_column, _ in relationships[name].local_remote_pairs
+        )
+    )
+
+
+def get_loader_options(entity, entity_class, expand, include_deleted=False):
+    """Eager loader options of the expanded relationships.
+
+    Single rows are joined into the entity query (joinedload), collections
+    are read with one ``IN`` query per relationship (selectinload), so a page
+    costs one query plus one per expanded collection whatever its size.
+    ``lazy="dynamic"`` relationships cannot be eager loaded, they are read in
+    batch by `load_dynamic_relationships` once the page is known.
+
+    Args:
+        entity: entity class or aliased entity the query selects.
+        entity_class (EntityModel): mapped class of the entity.
+        expand (list): names of the relationships to load.
+        include_deleted (bool): also load soft deleted related rows.
+    """
+    relationships = get_relationships(entity_class)
+    loader_options = []
+    for name in expand:
+        relationship = relationships[name]
+        if relationship.lazy == "dynamic":
+            continue
+        attribute = getattr(entity, name)
+        if not include_deleted:
+            attribute = attribute.and_(relationship.mapper.class_.deleted_by.is_(None))
+        if relationship.uselist:
+            loader_options.append(selectinload(attribute))
+        else:
+            loader_options.append(joinedload(attribute))
+    return loader_options
+
+
+def load_dynamic_relationships(
+    entity_class, entities, expand, db_session, include_deleted=False
+):
+    """Read the expanded ``lazy="dynamic"`` relationships of a page of
+    entities with one ``IN`` query per relationship.
+
+    Returns:
+        dict: relationship name -> {local column values: [related rows]}.
+    """
+    relationships = get_relationships(entity_class)
+    loaded_relationships = {}
+    for name in expand:
+        relationship = relationships[name]
+        if relationship.lazy != "dynamic" or not entities:
+            continue
+        related_class = relationship.mapper.class_
+        local_columns = [local for local, _ in relationship.local_remote_pairs]
+        remote_columns = [
+            getattr(related_class, remote.key)
+            for _, remote in relationship.local_remote_pairs
+        ]
+        keys = {
+            tuple(getattr(entity, column.key) for column in local_columns)
+            for entity in entities
+        }
+        related_query = db_session.query(related_class).filter(
+            tuple_(*remote_columns).in_(list(keys))
+            if len(remote_columns) > 1
+            else remote_columns[0].in_([key[0] for key in keys])
+        )
+        if not include_deleted:
+            related_query = related_query.filter(related_class.deleted_by.is_(None))
+        related_rows = defaultdict(list)
+        for related in related_query:
+            related_rows[
+                tuple(getattr(related, column.key) for column in remote_columns)
+            ].append(related)
+        loaded_relationships[name] = related_rows
+    return loaded_relationships
+
+
+def serialize_entities(
+    entity_class, entities, fields=None, expand=None, db_session=None,
+    include_deleted=False,
+):
+    """Dicts of a page of entities, each expanded relationship nested under
+    its name: a dict or None for single rows, a list for collections."""
+    if not expand:
+        return [entity.to_dict(fields) for entity in entities]
+    relationships = get_relationships(entity_class)
+    dynamic_relationships = load_dynamic_relationships(
+        entity_class, entities, expand, db_session, include_deleted
+    )
+    entities_data = []
+    for entity in entities:
+        entity_data = entity.to_dict(fields)
+        for name in expand:
+            if name in dynamic_relationships:
+                local_columns = [
+                    local for local, _ in relationships[name].local_remote_pairs
+                ]
+                related = dynamic_relationships[name].get(
+                    tuple(getattr(entity, column.key) for column in local_columns),
+                    [],
+                )
+            else:
+                related = getattr(entity, name)
+            if related is None:
+                entity_data[name] = None
+            elif relationships[name].uselist:
+                entity_data[name] = [item.to_dict() for item in related]
+            else:
+                entity_data[name] = related.to_dict()
+        entities_data.append(entity_data)
+    return entities_data
+
+
+# endregion
@@ -0,0 +1,357 @@
+import re
+
+from sqlalchemy import Float, String, cast, false, or_, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.inspection import inspect
+
+from infra.logging import logger
+
+
+# Each searchable entity declares the columns that are indexed for full-text
+# search through a `search_columns` class attribute on its model. Entities
+# without it keep using the per-column ILIKE scan.
+SEARCH_COLUMNS_ATTRIBUTE = "search_columns"
+# Column of the sqlite fts table holding the primary key of the entity row.
+SEARCH_KEY_COLUMN = "search_key"
+# Column of the `<table>_fts_keys` table holding the fts rowid of a primary
+# key. fts5 cannot index search_key, writes find the row through its rowid.
+SEARCH_ROWID_COLUMN = "fts_rowid"
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# (database url, table name) -> True once the index of the entity was found.
+# The indexes are created by database/migrations/0002_search_indexes.py, only
+# a positive lookup is cached so an index added by a later upgrade is picked up.
+_search_index_state = {}
+
+
+# region index management
+
+
+def get_search_columns(entity_class):
+    return list(getattr(entity_class, SEARCH_COLUMNS_ATTRIBUTE, None) or [])
+
+
+def get_search_table_name(entity_class):
+    return f"{entity_class.__tablename__}_fts"
+
+
+def get_search_key_table_name(entity_class):
+    return f"{entity_class.__tablename__}_fts_keys"
+
+
+def _get_id_column_name(entity_class):
+    return inspect(entity_class).primary_key[0].name
+
+
+def is_search_index_ready(db_session, entity_class):
+    """Check whether the full-text index of an entity exists.
+
+    sqlite needs the fts5 table `<table>_fts` with the searchable columns of
+    the model and its `<table>_fts_keys` table, mysql a FULLTEXT index on the
+    searchable columns. The lookup runs on the session's own connection and
+    never creates anything, the indexes come from the schema migrations.
+
+    Returns:
+        bool: True when full-text search can be used for the entity.
+    """
+    search_columns = get_search_columns(entity_class)
+    if not search_columns:
+        return False
+    bind = db_session.get_bind()
+    state_key = (str(bind.url), entity_class.__tablename__)
+    if _search_index_state.get(state_key):
+        return True
+    try:
+        if bind.dialect.name == "sqlite":
+            is_ready = _has_sqlite_search_index(db_session, entity_class, search_columns)
+        elif bind.dialect.name == "mysql":
+            is_ready = _has_mysql_search_index(db_session, entity_class)
+        else:
+            is_ready = False
+    except SQLAlchemyError as ex:
+        logger.warning(
+            f"Full-text search unavailable for {entity_class.__tablename__}: {ex}"
+        )
+        return False
+    if is_ready:
+        _search_index_state[state_key] = True
+    return is_ready
+
+
+def _has_sqlite_search_index(db_session, entity_class, search_columns):
+    # Look the tables up on the session's own connection: opening a second
+    # connection here would wait on the write lock a writer may hold.
+    existing_columns = [
+        row[1]
+        for row in db_session.execute(
+            text(f'PRAGMA table_info("{get_search_table_name(entity_class)}")')
+        )
+    ]
+    if existing_columns != [SEARCH_KEY_COLUMN, *search_columns]:
+        return False
+    has_key_table = db_session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": get_search_key_table_name(entity_class)},
+    ).first()
+    return has_key_table is not None
+
+
+def _has_mysql_search_index(db_session, entity_class):
+    index_count = db_session.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = :table_name "
+            "AND index_name = :index_name"
+        ),
+        {
+            "table_name": entity_class.__tablename__,
+            "index_name": f"ft_{entity_class.__tablename__}_search",
+        },
+    ).scalar()
+    return bool(index_count)
+
+
+def rebuild_search_index(connection, entity_class):
+    """Fill the sqlite fts table of an entity from the entity table, in one
+    INSERT ... SELECT. Much faster than indexing rows one at a time, used
+    after bulk loads.
+    """
+    search_columns = get_search_columns(entity_class)
+    search_table = get_search_table_name(entity_class)
+    key_table = get_search_key_table_name(entity_class)
+    id_column_name = _get_id_column_name(entity_class)
+    table_name = entity_class.__tablename__
+    indexed_columns = ", ".join(f'"{column}"' for column in search_columns)
+    source_columns = ", ".join(
+        f"""COALESCE(CAST(entity."{column}" AS TEXT), '')""" for column in search_columns
+    )
+    connection.execute(text(f'DELETE FROM "{search_table}"'))
+    connection.execute(
+        text(
+            f'INSERT OR IGNORE INTO "{key_table}" ({SEARCH_KEY_COLUMN}) '
+            f'SELECT "{id_column_name}" FROM "{table_name}"'
+        )
+    )
+    connection.execute(
+        text(
+            f'INSERT INTO "{search_table}" '
+            f"(rowid, {SEARCH_KEY_COLUMN}, {indexed_columns}) "
+            f"SELECT search_key.{SEARCH_ROWID_COLUMN}, "
+            f"search_key.{SEARCH_KEY_COLUMN}, {source_columns} "
+            f'FROM "{table_name}" AS entity JOIN "{key_table}" AS search_key '
+            f'ON search_key.{SEARCH_KEY_COLUMN} = entity."{id_column_name}"'
+        )
+    )
+
+
+def _ensure_mysql_search_index(bind, entity_class, search_columns):
+    index_name = f"ft_{entity_class.__tablename__}_search"
+    with bind.begin() as connection:
+        exists = connection.execute(
+            text(
+                "SELECT COUNT(*) FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = :table_name "
+                "AND index_name = :index_name"
+            ),
+            {"table_name": entity_class.__tablename__, "index_name": index_name},
+        ).scalar()
+        if exists:
+            return
+        indexed_columns = ", ".join(f"`{column}`" for column in search_columns)
+        connection.execute(
+            text(
+                f"ALTER TABLE `{entity_class.__tablename__}` "
+                f"ADD FULLTEXT INDEX `{index_name}` ({indexed_columns})"
+            )
+        )
+        logger.info(f"Created full-text index {index_name}")
+
+
+def index_search_entry(db_session, entity):
+    """Write the searchable columns of an entity to its sqlite fts table.
+
+    Runs inside the caller's transaction so the index commits or rolls back
+    together with the entity row. mysql FULLTEXT indexes are maintained by
+    the database itself.
+    """
+    entity_class = type(entity)
+    index_columns = [_get_id_column_name(entity_class), *get_search_columns(entity_class)]
+    index_search_entries(
+        db_session,
+        entity_class,
+        [{column: getattr(entity, column) for column in index_columns}],
+    )
+
+
+def index_search_entries(db_session, entity_class, rows):
+    """Bulk variant of `index_search_entry` for column mappings.
+
+    Every row must carry the primary key and the searchable columns. Each
+    statement runs as a single executemany and reaches the fts row by its
+    rowid, so a write costs the same whatever the size of the index.
+    """
+    if not rows or not _is_sqlite_index_ready(db_session, entity_class):
+        return
+    search_columns = get_search_columns(entity_class)
+    search_table = get_search_table_name(entity_class)
+    id_column_name = _get_id_column_name(entity_class)
+    search_rowid = _get_search_rowid_query(entity_class)
+    entity_ids = [{"entity_id": row[id_column_name]} for row in rows]
+    db_session.execute(
+        text(
+            f'INSERT OR IGNORE INTO "{get_search_key_table_name(entity_class)}" '
+            f"({SEARCH_KEY_COLUMN}) VALUES (:entity_id)"
+        ),
+        entity_ids,
+    )
+    db_session.execute(
+        text(f'DELETE FROM "{search_table}" WHERE rowid = {search_rowid}'),
+        entity_ids,
+    )
+    db_session.execute(
+        text(
+            f'INSERT INTO "{search_table}" (rowid, {SEARCH_KEY_COLUMN}, '
+            + ", ".join(f'"{column}"' for column in search_columns)
+            + f") VALUES ({search_rowid}, :entity_id, "
+            + ", ".join(f":column_{position}" for position in range(len(search_columns)))
+            + ")"
+        ),
+        [
+            {
+                "entity_id": row[id_column_name],
+                **{
+                    f"column_{position}": str(row.get(column) or "")
+                    for position, column in enumerate(search_columns)
+                },
+            }
+            for row in rows
+        ],
+    )
+
+
+def remove_search_entry(db_session, entity_class, entity_id):
+    if not _is_sqlite_index_ready(db_session, entity_class):
+        return
+    db_session.execute(
+        text(
+            f'DELETE FROM "{get_search_table_name(entity_class)}" '
+            f"WHERE rowid = {_get_search_rowid_query(entity_class)}"
+        ),
+        {"entity_id": entity_id},
+    )
+    db_session.execute(
+        text(
+            f'DELETE FROM "{get_search_key_table_name(entity_class)}" '
+            f"WHERE {SEARCH_KEY_COLUMN} = :entity_id"
+        ),
+        {"entity_id": entity_id},
+    )
+
+
+def _get_search_rowid_query(entity_class):
+    return (
+        f"(SELECT {SEARCH_ROWID_COLUMN} FROM "
+        f'"{get_search_key_table_name(entity_class)}" '
+        f"WHERE {SEARCH_KEY_COLUMN} = :entity_id)"
+    )
+
+
+def _is_sqlite_index_ready(db_session, entity_class):
+    if db_session.get_bind().dialect.name != "sqlite":
+        return False
+    return is_search_index_ready(db_session, entity_class)
+
+
+# endregion
+
+
+# region search queries
+
+
+def build_search_query(search_string, dialect_name):
+    """Turn free text into a prefix-matching full-text query.
+
+    Every word must match (AND) and every word matches as a prefix, so
+    "joh exa" finds "John" at "example.com".
+    """
+    tokens = SEARCH_TOKEN_PATTERN.findall(search_string)
+    if not tokens:
+        return ""
+    if dialect_name == "mysql":
+        return " ".join(f"+{token}*" for token in tokens)
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def apply_search_filter(entity_query, entity_class, params):
+    """Filter a listing query with the search params of the request.
+
+    * ``selected_column`` + ``search_string``: ILIKE on that single column.
+    * ``search_string`` only: ranked, prefix-matching full-text search when
+      the entity has an index, otherwise ILIKE over every column.
+
+    Returns:
+        tuple: (entity_query, rank_column). rank_column is None unless the
+        results are ranked, lower rank meaning a better match.
+    """
+    search_string = params.get("search_string", "")
+    selected_column = params.get("selected_column", "")
+    if not search_string:
+        return entity_query, None
+
+    if selected_column:
+        column = getattr(entity_class, selected_column, None)
+        if column is None:
+            return entity_query, None
+        entity_query = entity_query.filter(
+            cast(column, String).ilike(f"%{search_string}%")
+        )
+        return entity_query, None
+
+    bind = entity_query.session.get_bind()
+    if is_search_index_ready(entity_query.session, entity_class):
+        dialect_name = bind.dialect.name
+        search_query = build_search_query(search_string, dialect_name)
+        if not search_query:
+            return entity_query.filter(false()), None
+        if dialect_name == "sqlite":
+            return _apply_sqlite_search(entity_query, entity_class, search_query)
+        return _apply_mysql_search(entity_query, entity_class, search_query)
+
+    search_criteria = [
+        cast(column, String).ilike(f"%{search_string}%")
+        for column in inspect(entity_class).columns
+    ]
+    return entity_query.filter(or_(*search_criteria)), None
+
+
+def _apply_sqlite_search(entity_query, entity_class, search_query):
+    search_table = get_search_table_name(entity_class)
+    search_result = (
+        text(
+            f'SELECT {SEARCH_KEY_COLUMN}, bm25("{search_table}") AS search_rank '
+            f'FROM "{search_table}" WHERE "{search_table}" MATCH :search_query'
+        )
+        .bindparams(search_query=search_query)
+        .columns(**{SEARCH_KEY_COLUMN: String, "search_rank": Float})
+        .subquery("search_result")
+    )
+    id_column = getattr(entity_class, _get_id_column_name(entity_class))
+    entity_query = entity_query.join(
+        search_result, id_column == search_result.c[SEARCH_KEY_COLUMN]
+    )
+    return entity_query, search_result.c.search_rank
+
+
+def _apply_mysql_search(entity_query, entity_class, search_query):
+    search_columns = [
+        getattr(entity_class, column) for column in get_search_columns(entity_class)
+    ]
+    relevance = match(*search_columns, against=search_query).in_boolean_mode()
+    # MATCH returns higher scores for better matches, negate to keep
+    # "lower rank is better" in line with sqlite bm25.
+    entity_query = entity_query.filter(relevance > 0)
+    return entity_query, -relevance
+
+
+# endregion
@@ -0,0 +1,16 @@
+from collections import namedtuple
+
+from infra.cache import TTLCache
+from infra.environment import AUTH_USER_CACHE_SIZE, AUTH_USER_CACHE_TTL
+
+
+# Everything validate_jwt_token needs to know about the user of a token,
+# logged_out_time being epoch seconds like the iat claim and
+# logged_out_counter the token_version claim of tokens still valid.
+AuthUserState = namedtuple(
+    "AuthUserState", ["user_id", "is_active", "logged_out_time", "logged_out_counter"]
+)
+
+# user_id -> AuthUserState, dropped by User.after_write whenever the user row
+# is written. Other processes keep their entry until it expires.
+auth_user_cache = TTLCache(maxsize=AUTH_USER_CACHE_SIZE, ttl=AUTH_USER_CACHE_TTL)
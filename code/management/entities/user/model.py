@@ -1,13 +1,22 @@
 from infra.database import db
-from flask import jsonify
 from sqlalchemy.ext.mutable import MutableDict
 from utils.constants import DB_COLUMN_MAX_LENGTH
-from sqlalchemy.exc import SQLAlchemyError
+from management.entities.entity_base.model import (
+    EntityModel,
+    EntityProvider,
+    resolve_session,
+)
+from management.entities.entity_base.indexes import get_listing_indexes
+from management.entities.user.auth_state import AuthUserState, auth_user_cache
 from infra.logging import logger
+from utils.utility import to_timestamp
 
 
-class User(db.Model):
+class User(EntityModel, db.Model):
     __tablename__ = "user"
+    __table_args__ = get_listing_indexes("user", "user_id")
+    search_columns = ["username", "name", "email", "contact_number"]
+    hidden_columns = ["password"]
 
     user_id = db.Column(db.String(DB_COLUMN_MAX_LENGTH), primary_key=True)
     username = db.Column(db.String(DB_COLUMN_MAX_LENGTH), unique=True, nullable=True)
@@ -40,254 +49,55 @@ class User(db.Model):
     reviews = db.relationship("Review", backref="user", lazy="dynamic")
     audit_logs = db.relationship("AuditLog", backref="user", lazy="dynamic")
 
-    def to_dict(self):
-        return {
-            "user_id": self.user_id,
-            "username": self.username,
-            "name": self.name,
-            "email": self.email,
-            "contact_number": self.contact_number,
-            "is_active": self.is_active,
-            "attributes": self.attributes,
-            "created_at": self.created_at,
-            "created_by": self.created_by,
-            "modified_at": self.modified_at if self.modified_at else None,
-            "modified_by": self.modified_by,
-            "deleted_at": self.deleted_at if self.deleted_at else None,
-            "deleted_by": self.deleted_by,
-        }
-
-    def add(self, db_session):
-        try:
-            logger.debug(f"Adding user: {self} to user table")
-            return _add_user(self, db_session)
-        except Exception as e:
-            logger.exception(f"Error adding user: {e}")
-            return False, None
-
-    def update(self, db_session):
-        try:
-            logger.debug(f"Updating user: {self} to user table")
-            return _update_user(self, db_session)
-        except Exception as e:
-            logger.exception(f"Error updating user: {e}")
-            return False, None
-
-    def delete(user, db_session):
-        try:
-            logger.debug(f"Deleting user: {user} from user table")
-            return _delete_user(user, db_session)
-        except Exception as e:
-            logger.exception(f"Error deleting user: {e}")
-            return False, None
-
-    @staticmethod
-    def get(content, db_session):
-        try:
-            logger.debug(f"Fetching user: {content} from user table")
-            return _get_user(content, db_session)
-        except Exception as ex:
-            logger.exception(f"Error fetching user: {ex}")
-            return False, None
-
-    @staticmethod
-    def get_all(content, db_session):
-        try:
-            logger.debug(f"Fetching all users from user table")
-            return _get_all_users(content, db_session)
-        except Exception as ex:
-            logger.exception(f"Error fetching all users: {ex}")
-            return False, None
+    @classmethod
+    def after_write(cls, entity_ids):
+        super().after_write(entity_ids)
+        for user_id in entity_ids:
+            auth_user_cache.delete(user_id)
 
 
-class UserProvider(User):
-    @staticmethod
-    def get_by_attribute(attribute_name, content):
+class UserProvider(EntityProvider, User):
+    @classmethod
+    def get_auth_state(cls, user_id, db_session=None):
+        """Return the AuthUserState of an active, not deleted user.
 
+        Served from auth_user_cache, the database is only read on a miss and
+        then only for the three columns authentication looks at.
+        """
         try:
-            logger.debug(f"Fetching user by attribute {attribute_name}: {content}")
-            return _get_user_by_attribute(attribute_name, content)
+            auth_state = auth_user_cache.get(user_id)
+            if auth_state is not None:
+                return True, auth_state
+            return _get_auth_state(user_id, resolve_session(db_session))
         except Exception:
-            logger.exception(
-                f"Critical error in UserProvider.get_by_attribute - {content}"
-            )
+            logger.exception(f"Critical error in UserProvider.get_auth_state - {user_id}")
             return False, None
 
-    @staticmethod
-    def get_collective_data_by_attribute(attribute_name, content, require_object=False):
-        try:
-            logger.debug(
-                f"Fetching collective data by attribute {attribute_name}: {content}"
-            )
-            return _get_collective_user_by_attribute(
-                attribute_name, content, require_object
-            )
-        except Exception:
-            logger.exception(
-                f"Critical error in UserProvider.get_collective_data_by_attribute - {content}"
-            )
-            return False, None
-
-
-# region User Helper Functions
-
-
-def _get_user(content, db_session):
-    try:
-        logger.debug(f"Fetching user: {content}")
-        if content.get("user", ""):
-            content["user_id"] = content["user"].user_id
-        elif content.get("entity_id", ""):
-            content["user_id"] = content["entity_id"]
-        user = None
-        # user = User.query.filter_by(user_id=content["user_id"]).first()
-        user_query = db_session.query(User).filter_by(user_id=content["user_id"])
-        if not content.get("include_deleted"):
-            user_query = user_query.filter(User.deleted_by.is_(None))
-        user = user_query.first()
-        if not user:
-            logger.debug("User not found")
-            return False, None
-        user_dict = user.to_dict()
-        logger.success(f"User fetched: {user_dict}")
-        return True, user_dict
-    except Exception as ex:
-        logger.exception(f"Error fetching user: {ex}")
-        raise ex
-
-
-def _get_all_users(content, db_session):
-    try:
-        logger.debug(f"Fetching all users: {content}")
-        user = None
-        # user = User.query.all()
-        user_query = db_session.query(User)
-        if not content.get("include_deleted"):
-            user_query = user_query.filter(User.deleted_by.is_(None))
-        user = user_query.all()
-        if not user:
-            logger.debug("No users found")
-            return False, None
-        logger.success(f"Users fetched: {user}")
-        return True, user
-    except Exception as ex:
-        logger.exception(f"Error fetching all users: {ex}")
-        raise ex
-
-
-def _delete_user(user, db_session):
-    try:
-        logger.debug(f"Deleting user: {user}")
-        # User.query.filter_by(user_id=user.user_id).delete()
-        db_session.query(User).filter_by(user_id=user.user_id).delete()
-        db_session.commit()
-        logger.success(f"User deleted: {user}")
-        return True
-    except SQLAlchemyError as ex:
-        logger.exception(f"Error deleting user: {ex}")
-        db_session.rollback()
-        return ex
-
-
-def _add_user(user, db_session):
-    try:
-        logger.debug(f"Adding user: {user}")
-        db_session.add(user)
-        db_session.commit()
-        db_session.refresh(user)
-        user_dict = user.to_dict()
-        logger.success(f"User added: {user_dict}")
-        return True, user
-    except SQLAlchemyError as ex:
-        logger.exception(f"Error adding user: {ex}")
-        db.session.rollback()
-        raise ex
-
-
-def _update_user(user, db_session):
-    try:
-        logger.debug(f"Updating user: {user}")
-        updated_user = None
-        # User.query.filter_by(user_id=user.user_id).update(user.to_dict())
-        updated_user = db_session.merge(user)
-        db_session.commit()
-        if not updated_user:
-            logger.exception("User not updated")
-            return False, None
-        updated_user_dict = updated_user.to_dict()
-        logger.success(f"User updated: {updated_user_dict}")
-        return True, updated_user_dict
-    except Exception as ex:
-        logger.exception(f"Error updating user: {ex}")
-        db.session.rollback()
-        raise ex
-
-
-# endregion
-
 
 # region UserProvider Helper Functions
-def _get_user_by_attribute(attribute_name, content):
-    try:
-        logger.debug(f"Fetching user by attribute {attribute_name}: {content}")
-        user = None
-        user_query = (
-            content["db_session"]
-            .query(User)
-            .filter(
-                getattr(User, attribute_name) == content.get(f"{attribute_name}", "")
-            )
-        )
-        if not content.get("include_deleted", False):
-            user_query = user_query.filter(User.deleted_by.is_(None))
-        user = user_query.first()
-        if not user:
-            logger.debug(
-                f"No user found with {attribute_name} in {content.get(f'{attribute_name}', '')}"
-            )
-            return False, None
-        user_dict = user.to_dict()
-        logger.success(f"User fetched by attribute {attribute_name}: {user_dict}")
-        return True, user
-    except Exception as ex:
-        logger.exception(f"Error fetching user by attribute {attribute_name}: {ex}")
-        raise ex
 
 
-def _get_collective_user_by_attribute(attribute_name, content, require_object):
+def _get_auth_state(user_id, db_session):
     try:
-        logger.debug(
-            f"Fetching collective user data by attribute {attribute_name}: {content}"
+        user_row = (
+            db_session.query(User.user_id, User.is_active, User.attributes)
+            .filter(User.user_id == user_id, User.deleted_by.is_(None))
+            .first()
         )
-        users_dict = None
-        users = (
-            content["db_session"]
-            .query(User)
-            .filter(
-                getattr(User, attribute_name).in_(content.get(f"{attribute_name}", []))
-            )
-            .all()
-        )
-        if require_object:
-            users_dict = {
-                getattr(user_data, attribute_name): user_data for user_data in users
-            }
-        else:
-            users_dict = {
-                getattr(user_data, attribute_name): user_data.to_dict()
-                for user_data in users
-            }
-        if not users_dict:
-            logger.debug(
-                f"No users found with {attribute_name} in {content.get(f'{attribute_name}', '')}"
-            )
+        if not user_row:
+            logger.debug(f"No user found with user_id {user_id}")
             return False, None
-        logger.success(f"Users fetched by attribute {attribute_name}: {users_dict}")
-        return True, users_dict
-    except Exception as ex:
-        logger.exception(
-            f"Error fetching collective user data by attribute {attribute_name}: {ex}"
+        attributes = user_row.attributes or {}
+        auth_state = AuthUserState(
+            user_id=user_row.user_id,
+            is_active=user_row.is_active,
+            logged_out_time=to_timestamp(attributes.get("logged_out_time")),
+            logged_out_counter=int(attributes.get("logged_out_counter", 0)),
         )
+        auth_user_cache.set(user_id, auth_state)
+        return True, auth_state
+    except Exception as ex:
+        logger.exception(f"Error fetching auth state of user {user_id}: {ex}")
         raise ex
 
 
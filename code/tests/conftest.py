@@ -0,0 +1,94 @@
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from flask.testing import FlaskClient
+
+code_path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(code_path))
+
+# The app reads its configuration on import, so the database copy and the
+# environment are set up before any test module imports it.
+database_dir = tempfile.mkdtemp(prefix="flask_ecommerce_tests_")
+database_path = os.path.join(database_dir, "app.db")
+shutil.copyfile(code_path / "database" / "app.db", database_path)
+os.environ["SQLITE_DB_PATH"] = database_path
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+class HttpsClient(FlaskClient):
+    """Test client sending https requests, Talisman redirects plain http."""
+
+    def open(self, *args, **kwargs):
+        kwargs.setdefault("base_url", "https://localhost")
+        return super().open(*args, **kwargs)
+
+
+@pytest.fixture(scope="session")
+def app():
+    from app import app as flask_app
+    from infra.db_router import get_engine
+    from infra.migrations import upgrade
+
+    flask_app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    upgrade(get_engine("sqlite"))
+    yield flask_app
+    shutil.rmtree(database_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def client(app):
+    app.test_client_class = HttpsClient
+    return app.test_client()
+
+
+@pytest.fixture
+def engine(app):
+    from infra.db_router import get_engine
+
+    return get_engine("sqlite")
+
+
+@pytest.fixture
+def explain(engine):
+    """Query plan details of the statements run while the returned recorder
+    is active, as (statement, details) pairs."""
+    from sqlalchemy import event
+
+    class StatementRecorder:
+        def __init__(self, match):
+            self.match = match
+            self.statements = []
+
+        def __enter__(self):
+            event.listen(engine, "before_cursor_execute", self.record)
+            return self
+
+        def __exit__(self, *exc_info):
+            event.remove(engine, "before_cursor_execute", self.record)
+
+        def record(self, conn, cursor, statement, parameters, context, executemany):
+            if self.match(statement):
+                if executemany:
+                    parameters = parameters[0]
+                self.statements.append((statement, parameters))
+
+        def plans(self):
+            with engine.connect() as connection:
+                return [
+                    (
+                        statement,
+                        " ".join(
+                            row[-1]
+                            for row in connection.exec_driver_sql(
+                                f"EXPLAIN QUERY PLAN {statement}", parameters
+                            )
+                        ),
+                    )
+                    for statement, parameters in self.statements
+                ]
+
+    return StatementRecorder
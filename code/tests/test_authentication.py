@@ -0,0 +1,98 @@
+import uuid
+
+import jwt
+import pytest
+
+from infra.environment import SECRET_KEY
+from utils.constants import JWT_ACCESS_TOKEN_EXPIRES
+from utils.utility import get_current_timestamp
+
+PASSWORD = "Tester@123"
+
+
+@pytest.fixture
+def user(client):
+    run_id = uuid.uuid4().hex[:12]
+    response = client.post(
+        "/api/user/create/",
+        json={
+            "name": "Token Tester",
+            "email": f"tester_{run_id}@example.com",
+            "password": PASSWORD,
+            "created_by": "tester",
+        },
+    )
+    assert response.status_code == 200
+    return response.get_json()["user"]
+
+
+def login(client, user):
+    response = client.post(
+        "/authenticate/login", json={"email": user["email"], "password": PASSWORD}
+    )
+    assert response.status_code == 200
+    return response.get_json()["data"]["token"]
+
+
+def logout(client, token):
+    return client.get(
+        "/authenticate/logout", headers={"Authorization": f"Bearer {token}"}
+    ).get_json()
+
+
+def make_token(user, **claims):
+    return jwt.encode(
+        {"user_id": user["user_id"], **claims}, SECRET_KEY, algorithm="HS256"
+    )
+
+
+def test_login_issues_numeric_iat_and_exp(client, user):
+    claims = jwt.decode(login(client, user), SECRET_KEY, algorithms=["HS256"])
+
+    assert isinstance(claims["iat"], int)
+    assert claims["exp"] == claims["iat"] + JWT_ACCESS_TOKEN_EXPIRES
+    assert claims["token_version"] == 0
+
+
+def test_expired_token_is_rejected(client, user):
+    issued_at = get_current_timestamp() - JWT_ACCESS_TOKEN_EXPIRES - 10
+    token = make_token(user, iat=issued_at, exp=issued_at + JWT_ACCESS_TOKEN_EXPIRES)
+
+    assert logout(client, token)["msg"] == "Authentication Token is expired!"
+
+
+def test_token_without_iat_is_rejected(client, user):
+    token = make_token(user, exp=get_current_timestamp() + 60)
+
+    assert logout(client, token)["msg"] == "Invalid Authentication token!"
+
+
+def test_logout_revokes_token(client, user):
+    token = login(client, user)
+
+    assert logout(client, token)["status"] is True
+    assert logout(client, token)["msg"] == "Invalid Authentication token!"
+
+
+def test_login_in_the_second_of_a_logout_is_valid(client, user, monkeypatch):
+    issued_at = get_current_timestamp()
+    monkeypatch.setattr(
+        "web.apis.authentication_apis.get_current_timestamp", lambda: issued_at
+    )
+    old_token = login(client, user)
+    assert logout(client, old_token)["status"] is True
+
+    new_token = login(client, user)
+
+    assert logout(client, old_token)["msg"] == "Invalid Authentication token!"
+    assert logout(client, new_token)["status"] is True
+
+
+def test_legacy_token_is_revoked_by_later_logout(client, user):
+    issued_at = get_current_timestamp() - 60
+    legacy_token = make_token(
+        user, iat=issued_at, exp=issued_at + JWT_ACCESS_TOKEN_EXPIRES
+    )
+    assert logout(client, login(client, user))["status"] is True
+
+    assert logout(client, legacy_token)["msg"] == "Invalid Authentication token!"
@@ -0,0 +1,125 @@
+import uuid
+
+
+def bulk_write(client, operation_name, records, **options):
+    return client.post(
+        f"/api/brand/{operation_name}/", json={"records": records, **options}
+    )
+
+
+def test_bulk_create_retries_failed_chunk_row_by_row(client):
+    response = bulk_write(
+        client,
+        "bulk_create",
+        [
+            {"name": "Bulk brand one", "created_by": "tester"},
+            # Passes the schema, rejected by the NOT NULL constraint of name.
+            {"created_by": "tester"},
+            {"name": "Bulk brand three", "created_by": "tester"},
+        ],
+    )
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert (data["total_succeeded"], data["total_failed"]) == (2, 1)
+    records = data["records"]
+    assert [record["status"] for record in records] == [True, False, True]
+    assert "NOT NULL" in records[1]["msg"]
+    for record in (records[0], records[2]):
+        assert client.get(f"/api/brand/fetch/{record['brand_id']}/").status_code == 200
+
+
+def test_bulk_create_keeps_chunks_written_before_a_failure(client):
+    response = bulk_write(
+        client,
+        "bulk_create",
+        [
+            {"name": "Chunk brand one", "created_by": "tester"},
+            {"name": "Chunk brand two", "created_by": "tester"},
+            {"created_by": "tester"},
+        ],
+        chunk_size=2,
+    )
+
+    records = response.get_json()["records"]
+    assert [record["status"] for record in records] == [True, True, False]
+
+
+def test_bulk_create_reports_schema_rejections_with_written_rows(client):
+    response = client.post(
+        "/api/user/bulk_create/",
+        json={
+            "records": [
+                {
+                    "name": "Bulk User",
+                    "email": f"bulk_{uuid.uuid4().hex[:12]}@example.com",
+                    "password": "Tester@123",
+                    "created_by": "tester",
+                },
+                {"name": "No", "email": "not an email", "created_by": "tester"},
+            ]
+        },
+    )
+
+    data = response.get_json()
+    assert [record["index"] for record in data["records"]] == [0, 1]
+    assert [record["status"] for record in data["records"]] == [True, False]
+    assert data["records"][1]["msg"]
+
+
+def test_bulk_update_and_delete_report_missing_rows(client):
+    created = bulk_write(
+        client, "bulk_create", [{"name": "Updated brand", "created_by": "tester"}]
+    ).get_json()["records"][0]
+
+    response = bulk_write(
+        client,
+        "bulk_update",
+        [
+            {"brand_id": created["brand_id"], "name": "Updated brand renamed"},
+            {"brand_id": "missing-brand", "name": "Missing"},
+        ],
+    )
+    data = response.get_json()
+    assert [record["status"] for record in data["records"]] == [True, False]
+    brand = client.get(f"/api/brand/fetch/{created['brand_id']}/").get_json()["brand"]
+    assert brand["name"] == "Updated brand renamed"
+
+    response = bulk_write(
+        client,
+        "bulk_delete",
+        [{"brand_id": created["brand_id"], "deleted_by": "tester"}],
+    )
+    assert response.get_json()["total_succeeded"] == 1
+    assert client.get(f"/api/brand/fetch/{created['brand_id']}/").status_code == 404
+
+
+def test_bulk_write_without_any_success_is_not_acceptable(client):
+    response = bulk_write(client, "bulk_create", [{"created_by": "tester"}])
+
+    assert response.status_code == 406
+    assert response.get_json()["total_failed"] == 1
+
+
+def test_bulk_writes_index_each_chunk_by_rowid(client, explain):
+    records = [
+        {"name": f"Indexed bulk brand {index}", "created_by": "tester"}
+        for index in range(300)
+    ]
+    with explain(lambda statement: "brand_fts" in statement) as recorder:
+        response = bulk_write(client, "bulk_create", records, chunk_size=100)
+        brand_ids = [record["brand_id"] for record in response.get_json()["records"]]
+        bulk_write(
+            client,
+            "bulk_update",
+            [{"brand_id": brand_id, "name": "Renamed"} for brand_id in brand_ids],
+            chunk_size=100,
+        )
+
+    # Three executemany statements per chunk, never one per row.
+    assert len(recorder.statements) == 2 * 3 * 3
+    for statement, details in recorder.plans():
+        assert "VIRTUAL TABLE INDEX 0:" not in details or "INDEX 0:=" in details, (
+            statement
+        )
+        assert "SCAN brand_fts_keys" not in details, statement
@@ -0,0 +1,79 @@
+import uuid
+
+from infra.cache import TTLCache
+from infra.environment import ENTITY_CACHE_MEMORY_MAX_TTL
+from management.entities.entity_base.cache import EntityCache, create_entity_cache
+from management.entities.user.auth_state import auth_user_cache
+from management.entities.user.model import UserProvider
+
+
+def test_entity_cache_entries_are_not_shared_with_callers():
+    entity_cache = EntityCache(TTLCache(maxsize=10, ttl=60))
+    entity_data = {"brand_id": "b1", "attributes": {"tags": ["new"]}}
+    entity_cache.set("brand", "b1", entity_data)
+
+    entity_data["attributes"]["tags"].append("changed by the writer")
+    cached_data = entity_cache.get("brand", "b1")
+    cached_data["attributes"]["tags"].append("changed by a reader")
+
+    assert entity_cache.get("brand", "b1")["attributes"] == {"tags": ["new"]}
+
+
+def test_update_invalidates_cached_fetch(client):
+    response = client.post(
+        "/api/brand/create/",
+        json={"name": "Cached brand", "attributes": {"tier": 1}, "created_by": "tester"},
+    )
+    brand_id = response.get_json()["brand"]["brand_id"]
+    first_fetch = client.get(f"/api/brand/fetch/{brand_id}/").get_json()
+    first_fetch["brand"]["attributes"]["tier"] = 99
+    assert client.get(f"/api/brand/fetch/{brand_id}/").get_json()["brand"][
+        "attributes"
+    ] == {"tier": 1}
+
+    response = client.put(
+        f"/api/brand/update/{brand_id}/",
+        json={"name": "Renamed brand", "modified_by": "tester"},
+    )
+    assert response.status_code == 200
+
+    assert (
+        client.get(f"/api/brand/fetch/{brand_id}/").get_json()["brand"]["name"]
+        == "Renamed brand"
+    )
+
+
+def test_user_write_invalidates_auth_state(client):
+    response = client.post(
+        "/api/user/create/",
+        json={
+            "name": "Auth State",
+            "email": f"auth_{uuid.uuid4().hex[:12]}@example.com",
+            "password": "Tester@123",
+            "created_by": "tester",
+        },
+    )
+    user_id = response.get_json()["user"]["user_id"]
+    status, auth_state = UserProvider.get_auth_state(user_id)
+    assert status and auth_state.is_active is not False
+    assert auth_user_cache.get(user_id) == auth_state
+
+    response = client.put(
+        f"/api/user/update/{user_id}/", json={"is_active": False, "modified_by": "tester"}
+    )
+    assert response.status_code == 200
+
+    assert auth_user_cache.get(user_id) is None
+    status, auth_state = UserProvider.get_auth_state(user_id)
+    assert status and auth_state.is_active is False
+
+
+def test_memory_cache_ttl_is_capped_with_several_workers(monkeypatch):
+    monkeypatch.setenv("BRAND_CACHE_TTL", "600")
+
+    assert create_entity_cache("memory", workers=1).get_ttl("brand") == 600
+    assert (
+        create_entity_cache("memory", workers=4).get_ttl("brand")
+        == ENTITY_CACHE_MEMORY_MAX_TTL
+    )
+    assert create_entity_cache("local_redis", workers=4).get_ttl("brand") == 600
@@ -0,0 +1,54 @@
+import uuid
+
+
+def create_brand(client, name):
+    response = client.post(
+        "/api/brand/create/", json={"name": name, "created_by": "tester"}
+    )
+    return response.get_json()["brand"]["brand_id"]
+
+
+def test_fetch_answers_304_while_etag_matches(client):
+    brand_id = create_brand(client, "Conditional brand")
+    url = f"/api/brand/fetch/{brand_id}/"
+    response = client.get(url)
+    etag = response.headers["ETag"]
+    assert response.headers["Last-Modified"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.get_data() == b""
+
+    client.put(
+        f"/api/brand/update/{brand_id}/",
+        json={"name": "Conditional brand renamed", "modified_by": "tester"},
+    )
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_fetch_answers_304_when_not_modified_since(client):
+    brand_id = create_brand(client, "Dated brand")
+    url = f"/api/brand/fetch/{brand_id}/"
+    last_modified = client.get(url).headers["Last-Modified"]
+
+    response = client.get(url, headers={"If-Modified-Since": last_modified})
+
+    assert response.status_code == 304
+
+
+def test_listing_answers_304_until_a_record_changes(client):
+    name = f"Listed brand {uuid.uuid4().hex}"
+    brand_id = create_brand(client, name)
+    url = f"/api/brand/get_filtered_records/?selected_column=name&search_string={name}"
+    assert client.get(url).get_json()["records"][0]["brand_id"] == brand_id
+    etag = client.get(url).headers["ETag"]
+
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    client.put(
+        f"/api/brand/update/{brand_id}/",
+        json={"name": "Listed brand renamed", "modified_by": "tester"},
+    )
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
@@ -0,0 +1,32 @@
+import pytest
+
+
+def create_brand(client, name):
+    response = client.post(
+        "/api/brand/create/", json={"name": name, "created_by": "tester"}
+    )
+    assert response.status_code == 200
+    return response.get_json()["brand"]["brand_id"]
+
+
+def test_delete_requires_deleted_by_without_logged_in_user(client):
+    brand_id = create_brand(client, "Undeleted brand")
+
+    response = client.delete(f"/api/brand/delete/{brand_id}")
+
+    assert response.status_code == 400
+    assert client.get(f"/api/brand/fetch/{brand_id}/").status_code == 200
+
+
+@pytest.mark.parametrize(
+    "request_options",
+    [{"query_string": {"deleted_by": "tester"}}, {"json": {"deleted_by": "tester"}}],
+)
+def test_delete_takes_deleted_by_from_request(client, request_options):
+    brand_id = create_brand(client, "Deleted brand")
+
+    response = client.delete(f"/api/brand/delete/{brand_id}", **request_options)
+
+    assert response.status_code == 200
+    assert response.get_json()["brand"]["deleted_by"] == "tester"
+    assert client.get(f"/api/brand/fetch/{brand_id}/").status_code == 404
@@ -0,0 +1,104 @@
+import shutil
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from infra.migrations import (
+    MIGRATIONS_PATH,
+    Migrator,
+    create_migration,
+    downgrade,
+    get_pending_revisions,
+    upgrade,
+)
+
+DATABASE_PATH = Path(__file__).resolve().parent.parent / "database" / "app.db"
+
+COLUMN_MIGRATION = '''from sqlalchemy import Column, String
+
+description = "Brand country"
+
+
+def up(migrator):
+    migrator.add_column("brand", Column("country", String(64)))
+    migrator.create_index("brand", "ix_brand_country", ["country"])
+    migrator.backfill("brand", {"country": "IN"}, "country IS NULL")
+
+
+def down(migrator):
+    migrator.drop_index("brand", "ix_brand_country")
+    migrator.drop_column("brand", "country")
+'''
+
+
+@pytest.fixture
+def engine(tmp_path):
+    database_path = tmp_path / "app.db"
+    shutil.copyfile(DATABASE_PATH, database_path)
+    test_engine = create_engine(f"sqlite:///{database_path}")
+    yield test_engine
+    test_engine.dispose()
+
+
+@pytest.fixture
+def migrations_path(tmp_path):
+    path = tmp_path / "migrations"
+    shutil.copytree(MIGRATIONS_PATH, path, ignore=shutil.ignore_patterns("__pycache__"))
+    create_migration("brand_country", path).write_text(COLUMN_MIGRATION)
+    return path
+
+
+def get_schema(engine):
+    inspector = inspect(engine)
+    return {
+        table_name: (
+            sorted(column["name"] for column in inspector.get_columns(table_name)),
+            sorted(index["name"] for index in inspector.get_indexes(table_name)),
+        )
+        for table_name in inspector.get_table_names()
+        if table_name != "schema_migrations"
+    }
+
+
+def test_upgrade_downgrade_upgrade(engine, migrations_path):
+    initial_schema = get_schema(engine)
+    revisions = get_pending_revisions(engine, migrations_path)
+    assert len(revisions) == 3
+
+    assert upgrade(engine, path=migrations_path) == revisions
+    upgraded_schema = get_schema(engine)
+    assert "ix_brand_live_created_at" in upgraded_schema["brand"][1]
+    assert "country" in upgraded_schema["brand"][0]
+    assert {"brand_fts", "brand_fts_keys"} <= set(upgraded_schema)
+    with engine.connect() as connection:
+        countries = connection.exec_driver_sql("SELECT country FROM brand").scalars()
+        assert set(countries) == {"IN"}
+    assert get_pending_revisions(engine, migrations_path) == []
+
+    assert downgrade(engine, path=migrations_path) == [revisions[-1]]
+    assert "country" not in get_schema(engine)["brand"][0]
+    assert downgrade(engine, target=0, path=migrations_path) == revisions[-2::-1]
+    assert get_schema(engine) == initial_schema
+    assert get_pending_revisions(engine, migrations_path) == revisions
+
+    assert upgrade(engine, path=migrations_path) == revisions
+    assert get_schema(engine) == upgraded_schema
+
+
+def test_upgrade_to_target_stops_there(engine, migrations_path):
+    revisions = get_pending_revisions(engine, migrations_path)
+
+    assert upgrade(engine, target=revisions[0], path=migrations_path) == revisions[:1]
+    assert get_pending_revisions(engine, migrations_path) == revisions[1:]
+
+
+def test_backs_foreign_key(engine, migrations_path):
+    upgrade(engine, path=migrations_path)
+    migrator = Migrator(engine)
+
+    assert migrator.backs_foreign_key("product", "ix_product_brand_id")
+    assert not migrator.backs_foreign_key("product", "ix_product_live_created_at")
+
+    migrator.create_index("product", "ix_product_brand_id_name", ["brand_id", "name"])
+    assert not migrator.backs_foreign_key("product", "ix_product_brand_id")
@@ -0,0 +1,120 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, text
+
+from management.entities.brand.model import Brand
+
+
+@pytest.fixture
+def brand_ids(engine):
+    """Brands sharing created_at values, and a few without one."""
+    run_id = uuid.uuid4().hex[:8]
+    created_at = datetime(2020, 1, 1)
+    rows = [
+        {
+            "brand_id": f"{run_id}-{index:02d}",
+            "name": f"Paging brand {index}",
+            "created_at": None if index % 5 == 0 else created_at + timedelta(
+                days=index % 3
+            ),
+        }
+        for index in range(23)
+    ]
+    with engine.begin() as connection:
+        connection.execute(Brand.__table__.insert(), rows)
+    yield [row["brand_id"] for row in rows]
+    with engine.begin() as connection:
+        connection.execute(
+            Brand.__table__.delete().where(Brand.brand_id.like(f"{run_id}-%"))
+        )
+
+
+def get_listing_order(engine):
+    with engine.connect() as connection:
+        return [
+            row.brand_id
+            for row in connection.execute(
+                text(
+                    "SELECT brand_id FROM brand WHERE deleted_by IS NULL "
+                    "ORDER BY created_at DESC, brand_id DESC"
+                )
+            )
+        ]
+
+
+def walk_pages(client, url):
+    brand_ids, cursor, pages = [], None, 0
+    while True:
+        page_url = f"{url}&cursor={cursor}" if cursor else url
+        response = client.get(page_url)
+        assert response.status_code == 200
+        data = response.get_json()
+        brand_ids.extend(record["brand_id"] for record in data["records"])
+        cursor = data["next_cursor"]
+        pages += 1
+        if not cursor:
+            return brand_ids, pages
+
+
+@pytest.mark.parametrize("limit", [1, 4, 5, 50])
+def test_cursor_pages_follow_listing_order(client, engine, brand_ids, limit):
+    listed_ids, pages = walk_pages(
+        client, f"/api/brand/get_limited_records/?limit={limit}&fields=brand_id"
+    )
+    assert listed_ids == get_listing_order(engine)
+    assert pages == max(1, -(-len(listed_ids) // limit))
+
+
+def test_null_phase_follows_dated_records(client, engine, brand_ids):
+    listed_ids, _ = walk_pages(
+        client, "/api/brand/get_limited_records/?limit=3&fields=brand_id"
+    )
+    undated_ids = sorted(
+        (brand_id for index, brand_id in enumerate(brand_ids) if index % 5 == 0),
+        reverse=True,
+    )
+    assert listed_ids[-len(undated_ids):] == undated_ids
+
+
+def test_cursor_page_seeks_listing_index(client, engine, brand_ids):
+    response = client.get("/api/brand/get_limited_records/?limit=2&fields=brand_id")
+    cursor = response.get_json()["next_cursor"]
+    statements = []
+
+    def record_statement(conn, cursor_, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "LIMIT" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        response = client.get(
+            f"/api/brand/get_limited_records/?limit=2&fields=brand_id&cursor={cursor}"
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+    assert response.status_code == 200
+    assert statements
+
+    with engine.connect() as connection:
+        statement, parameters = statements[0]
+        plan = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).all()
+    details = " ".join(row[-1] for row in plan)
+    # A deep page seeks the index like the first one instead of scanning it.
+    assert "SEARCH" in details and "ix_brand_live_created_at" in details
+
+
+def test_estimated_count_is_exact_with_search_filter(client, brand_ids):
+    response = client.get(
+        "/api/brand/get_page/?limit=5&count=estimated"
+        "&selected_column=name&search_string=Paging brand"
+    )
+    data = response.get_json()
+    assert data["is_total_estimated"] is False
+    assert data["total_records"] == len(brand_ids)
+
+    response = client.get("/api/brand/get_page/?limit=5&count=estimated")
+    assert response.get_json()["is_total_estimated"] is True
@@ -0,0 +1,27 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from infra.query_stats import (
+    _request_query_stats,
+    instrument_engine,
+    start_request_query_stats,
+)
+
+
+def test_failed_statement_does_not_leave_its_start_time():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    start_request_query_stats()
+    try:
+        with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing_table"))
+            connection.execute(text("SELECT 1"))
+
+            assert connection.connection.info.get("query_started_at") == []
+        request_stats = _request_query_stats.get()
+        assert request_stats.statement_count == 2
+    finally:
+        _request_query_stats.set(None)
+        engine.dispose()
@@ -0,0 +1,54 @@
+import pytest
+
+from infra import db_router
+
+
+@pytest.fixture
+def replica_reads(monkeypatch):
+    """Give sqlite a replica, returns the list of reads sent to it."""
+    monkeypatch.setitem(db_router.replica_keys, "sqlite", ["sqlite"])
+    replica_reads = []
+
+    def select_replica(db_key):
+        replica_reads.append(db_key)
+        return db_key
+
+    monkeypatch.setattr(db_router, "select_replica", select_replica)
+    return replica_reads
+
+
+def read_brands(client):
+    response = client.get("/api/brand/get_filtered_records/?page_size=1")
+    assert response.status_code == 200
+
+
+def test_write_pins_reads_of_the_client_to_primary(app, client, replica_reads):
+    read_brands(client)
+    assert len(replica_reads) == 1
+
+    response = client.post(
+        "/api/brand/create/", json={"name": "Pinned brand", "created_by": "tester"}
+    )
+    assert response.status_code == 200
+    session_cookie = client.get_cookie(app.config["SESSION_COOKIE_NAME"])
+    assert session_cookie is not None
+
+    read_brands(client)
+    assert len(replica_reads) == 1
+
+    # The pin is in the cookie, not in the worker that served the write.
+    other_worker = app.test_client()
+    other_worker.set_cookie(session_cookie.key, session_cookie.value)
+    read_brands(other_worker)
+    assert len(replica_reads) == 1
+
+    read_brands(app.test_client())
+    assert len(replica_reads) == 2
+
+
+def test_pin_expires(client, replica_reads, monkeypatch):
+    client.post("/api/brand/create/", json={"name": "Expired pin", "created_by": "tester"})
+    monkeypatch.setattr(db_router, "DB_READ_YOUR_WRITES_SECONDS", 0)
+
+    read_brands(client)
+    assert len(replica_reads) == 1
@@ -0,0 +1,97 @@
+import uuid
+
+import pytest
+from sqlalchemy import bindparam, text
+
+
+@pytest.fixture
+def word():
+    """A word no other brand contains, letters only so it is one token."""
+    return "".join(chr(ord("a") + int(digit, 16) % 26) for digit in uuid.uuid4().hex)
+
+
+def get_indexed_names(engine, brand_ids):
+    statement = text(
+        "SELECT search_key, name FROM brand_fts WHERE search_key IN :brand_ids"
+    ).bindparams(bindparam("brand_ids", expanding=True))
+    with engine.connect() as connection:
+        return {
+            row.search_key: row.name
+            for row in connection.execute(statement, {"brand_ids": brand_ids})
+        }
+
+
+def search_names(client, search_string):
+    response = client.get(
+        f"/api/brand/get_filtered_records/?search_string={search_string}"
+    )
+    assert response.status_code == 200
+    return sorted(record["name"] for record in response.get_json()["records"])
+
+
+def test_create_and_update_sync_search_index(client, engine, word):
+    response = client.post(
+        "/api/brand/create/", json={"name": f"Created {word}", "created_by": "tester"}
+    )
+    brand_id = response.get_json()["brand"]["brand_id"]
+    assert get_indexed_names(engine, [brand_id]) == {brand_id: f"Created {word}"}
+    assert search_names(client, word) == [f"Created {word}"]
+
+    response = client.put(
+        f"/api/brand/update/{brand_id}/",
+        json={"name": f"Renamed {word}x", "modified_by": "tester"},
+    )
+    assert response.status_code == 200
+
+    assert get_indexed_names(engine, [brand_id]) == {brand_id: f"Renamed {word}x"}
+    assert search_names(client, f"{word}x") == [f"Renamed {word}x"]
+    assert search_names(client, f"Created {word}") == []
+
+
+def test_bulk_writes_sync_search_index(client, engine, word):
+    response = client.post(
+        "/api/brand/bulk_create/",
+        json={
+            "records": [
+                {"name": f"First {word}", "created_by": "tester"},
+                {"name": f"Second {word}", "created_by": "tester"},
+            ]
+        },
+    )
+    brand_ids = [record["brand_id"] for record in response.get_json()["records"]]
+    assert sorted(get_indexed_names(engine, brand_ids).values()) == [
+        f"First {word}",
+        f"Second {word}",
+    ]
+    assert search_names(client, word) == [f"First {word}", f"Second {word}"]
+
+    response = client.post(
+        "/api/brand/bulk_update/",
+        json={"records": [{"brand_id": brand_ids[0], "name": f"Third {word}"}]},
+    )
+    assert response.get_json()["total_succeeded"] == 1
+
+    assert get_indexed_names(engine, brand_ids)[brand_ids[0]] == f"Third {word}"
+    assert search_names(client, word) == [f"Second {word}", f"Third {word}"]
+
+
+def test_search_index_writes_reach_rows_by_rowid(client, explain, word):
+    with explain(lambda statement: "brand_fts" in statement) as recorder:
+        response = client.post(
+            "/api/brand/create/", json={"name": f"Planned {word}", "created_by": "tester"}
+        )
+        brand_id = response.get_json()["brand"]["brand_id"]
+        client.put(
+            f"/api/brand/update/{brand_id}/",
+            json={"name": f"Replanned {word}", "modified_by": "tester"},
+        )
+        client.delete(f"/api/brand/delete/{brand_id}?deleted_by=tester")
+
+    plans = recorder.plans()
+    assert any(statement.startswith("DELETE") for statement, _ in plans)
+    for statement, details in plans:
+        # A full scan of the fts table shows as "VIRTUAL TABLE INDEX 0:".
+        assert "VIRTUAL TABLE INDEX 0:" not in details or "INDEX 0:=" in details, (
+            statement
+        )
+        assert "SCAN brand_fts_keys" not in details, statement
@@ -0,0 +1,63 @@
+import importlib
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from test_search import get_indexed_names, word  # noqa: F401
+
+SCRIPTS_PATH = str(Path(__file__).resolve().parents[2] / "research" / "scripts")
+
+
+@pytest.fixture(scope="module")
+def seed_data(app):
+    if SCRIPTS_PATH not in sys.path:
+        sys.path.append(SCRIPTS_PATH)
+    return importlib.import_module("seed_data")
+
+
+@pytest.fixture(scope="module")
+def generate_data(seed_data):
+    return importlib.import_module("generate_data")
+
+
+def test_load_indexes_stored_rows_once(client, engine, explain, seed_data, word):
+    response = client.post(
+        "/api/brand/create/", json={"name": f"Kept {word}", "created_by": "tester"}
+    )
+    existing_id = response.get_json()["brand"]["brand_id"]
+    loaded_ids = [str(uuid.uuid4()) for _ in range(3)]
+    rows = [{"brand_id": existing_id, "name": f"Replaced {word}"}] + [
+        {"brand_id": brand_id, "name": f"Loaded {word}"} for brand_id in loaded_ids
+    ]
+
+    with explain(lambda statement: "brand_fts" in statement) as recorder:
+        seed_data.load_tables([("brand", rows)], batch_size=2, ignore_existing=True)
+
+    # No per batch fts writes, one rebuild of the table at the end.
+    assert len([s for s, _ in recorder.statements if s.startswith("DELETE")]) == 1
+    assert get_indexed_names(engine, [existing_id, *loaded_ids]) == {
+        existing_id: f"Kept {word}",
+        **{brand_id: f"Loaded {word}" for brand_id in loaded_ids},
+    }
+
+
+def test_generated_load_builds_search_index_at_the_end(engine, explain, generate_data):
+    with explain(lambda statement: "_fts" in statement) as recorder:
+        generate_data.main(["--scale", "0.05", "--tables", "brand,coupon"])
+
+    # The fts tables are only written by the final rebuild, one per table.
+    fts_writes = [
+        s for s, _ in recorder.statements if s.startswith(("INSERT", "DELETE"))
+    ]
+    assert len(fts_writes) == 2 * 3
+    with engine.connect() as connection:
+        brands = dict(
+            connection.execute(
+                text("SELECT brand_id, name FROM brand WHERE created_by = 'synthetic'")
+            ).all()
+        )
+    assert len(brands) == 10
+    assert get_indexed_names(engine, list(brands)) == brands
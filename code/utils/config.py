@@ -1,17 +1,25 @@
-from infra.logging import logger
-from flask import request
+import time
+from infra.logging import logger, summarize
+from flask import request, session
 from functools import wraps
-from utils.utility import generate_bad_request_response, get_current_time, compare_dates
+from utils.utility import generate_bad_request_response
 import jwt
-from infra.environment import SECRET_KEY
+from infra.environment import DB_READ_YOUR_WRITES_SECONDS, SECRET_KEY
 from management.entities.user.model import UserProvider
-from infra.db_router import set_current_db, get_session
+from infra.db_router import set_current_db, get_session, has_replicas
+from utils.constants import READ_ONLY_OPERATIONS
+
+# Session key holding time.time() of the last write of the client.
+WRITTEN_AT_SESSION_KEY = "db_written_at"
 
 
 def validate_jwt_token(func):
     @wraps(func)
     def validate_token(**kwargs):
-        logger.debug(f"Validating JWT token: {kwargs}")
+        logger.opt(lazy=True).debug(
+            "Validating JWT token: {}",
+            lambda: summarize(kwargs),
+        )
         token = False
         if "Authorization" in request.headers:
             token = request.headers["Authorization"].split(" ")[1]
@@ -25,37 +33,41 @@ def validate_jwt_token(func):
             )
         try:
             # kwargs["token"] = token
-            data = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-            if compare_dates(get_current_time(), data["expiration"]) != "lesser":
-                return generate_bad_request_response(
-                    error_msg="Authentication Token is expired!"
-                )
+            # exp and iat are numeric claims checked by the decoder itself.
+            data = jwt.decode(
+                token,
+                SECRET_KEY,
+                algorithms=["HS256"],
+                options={"require": ["exp", "iat"]},
+            )
 
-            current_user = None
-            payload = {
-                "user_id": data["user_id"],
-                # "db_session": kwargs["db_session"],
-                # "include_deleted": False,
-            }
-            _, current_user = UserProvider.get_by_attribute("user_id", payload)
-            if current_user is None or (
-                current_user.attributes
-                and "logged_out_time" in current_user.attributes
-                and current_user.attributes["logged_out_time"]
-                and compare_dates(
-                    current_user.attributes["logged_out_time"], data["created_at"]
-                )
-                == "greater"
+            status, current_user = UserProvider.get_auth_state(data["user_id"])
+            if (
+                not status
+                or current_user.is_active is False
+                or _is_token_revoked(data, current_user)
             ):
                 return generate_bad_request_response(
                     error_msg="Invalid Authentication token!"
                 )
+        except jwt.ExpiredSignatureError:
+            return generate_bad_request_response(
+                error_msg="Authentication Token is expired!"
+            )
+        except jwt.InvalidTokenError as ex:
+            logger.debug(f"Invalid token in validate_token: {ex}")
+            return generate_bad_request_response(
+                error_msg="Invalid Authentication token!"
+            )
         except Exception as ex:
             logger.exception(f"Error in validate_token: {ex}")
             response = generate_bad_request_response(str(ex))
             return response
         kwargs["current_user"] = current_user
-        logger.debug(f"Validated JWT token: {kwargs}")
+        logger.opt(lazy=True).debug(
+            "Validated JWT token: {}",
+            lambda: summarize(kwargs),
+        )
         response = func(**kwargs)
         return response
 
@@ -66,17 +78,43 @@ def create_session(func):
     @wraps(func)
     def create_default_session(**kwargs):
         try:
-            logger.debug(f"Creating session: {kwargs}")
+            logger.opt(lazy=True).debug(
+                "Creating session: {}",
+                lambda: summarize(kwargs),
+            )
             db = "sqlite"
             kwargs["db"] = "sqlite"
-            set_current_db("sqlite")
+            read_only = (
+                request.method == "GET"
+                and kwargs.get("operation_name") in READ_ONLY_OPERATIONS
+            )
+            set_current_db(
+                "sqlite",
+                read_only=read_only,
+                written_at=session.get(WRITTEN_AT_SESSION_KEY),
+            )
             kwargs["db_session"] = get_session()
         except Exception as ex:
             logger.exception(f"Error in create_default_session: {ex}")
             response = generate_bad_request_response(str(ex))
             return response
-        logger.debug(f"Created session: {kwargs}")
+        logger.opt(lazy=True).debug("Created session: {}", lambda: summarize(kwargs))
         response = func(**kwargs)
+        if not read_only and DB_READ_YOUR_WRITES_SECONDS > 0 and has_replicas(db):
+            # Read your writes: the signed session cookie carries the write
+            # time, every worker then keeps this client on the primary.
+            session[WRITTEN_AT_SESSION_KEY] = time.time()
         return response
 
     return create_default_session
+
+
+def _is_token_revoked(token_data, auth_state):
+    if "token_version" in token_data:
+        return token_data["token_version"] != auth_state.logged_out_counter
+    # Tokens issued before token_version, revoked by any logout in or after
+    # the second they were issued in.
+    return (
+        auth_state.logged_out_time is not None
+        and auth_state.logged_out_time >= token_data["iat"]
+    )
@@ -29,4 +29,19 @@ INPUT_NOT_ACCEPTABLE_RESPONSE = (
 DB_COLUMN_MAX_LENGTH = 255
 
 # jwt
-JWT_ACCESS_TOKEN_EXPIRES = 86400  # 24 hour
\ No newline at end of file
+JWT_ACCESS_TOKEN_EXPIRES = 86400  # 24 hour
+
+# bulk writes
+BULK_WRITE_CHUNK_SIZE = 500  # rows written per transaction
+EXPORT_BATCH_SIZE = 1000  # rows fetched and written per chunk of an export
+
+# entity operations served by read replicas when requested with GET
+READ_ONLY_OPERATIONS = (
+    "fetch",
+    "fetch_all",
+    "total",
+    "get_limited_records",
+    "get_filtered_records",
+    "get_page",
+    "export",
+)
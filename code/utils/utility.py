@@ -99,108 +99,6 @@ def extract_query_params(content):
     return result
 
 
-# endregion
-
-# region redis cache functions
-
-
-# def create_entity_cache(entity_dict, entity_id, CACHE_ENTITY_KEYWORD):
-#     """Create cache for an entity in Redis.
-
-#     Args:
-#         entity_dict (dict): Dictionary representing the entity data.
-#         entity_id (str): Unique identifier for the entity.
-#         CACHE_ENTITY_KEYWORD (str): Cache keyword for the entity.
-#     """
-#     try:
-#         logger.debug(
-#             f"Creating entity cache for: {CACHE_ENTITY_KEYWORD} having id: {entity_id} with data: {entity_dict}"
-#         )
-#         if entity_dict:
-#             set_redis_hash_map(
-#                 CACHE_ENTITY_KEYWORD,
-#                 entity_id,
-#                 json.dumps(entity_dict, cls=CustomJSONEncoder),
-#             )
-#             set_redis_expiry(CACHE_ENTITY_KEYWORD, CACHE_EXPIRE_TIME)
-#     except Exception as ex:
-#         logger.exception(f"Error occurred in create_entity_cache: {str(ex)}")
-
-
-# def delete_entity_cache(entity_id, CACHE_ENTITY_KEYWORD):
-#     """Delete cache for an entity from Redis.
-
-#     Args:
-#         entity_id (str): Unique identifier for the entity.
-#         CACHE_ENTITY_KEYWORD (str): Cache keyword for the entity.
-#     """
-#     try:
-#         logger.debug(
-#             f"Deleting entity cache for: {CACHE_ENTITY_KEYWORD} having id: {entity_id}"
-#         )
-#         data = get_redis_hash_map(CACHE_ENTITY_KEYWORD, entity_id)
-#         if data:
-#             delete_redis_hash_map(CACHE_ENTITY_KEYWORD, entity_id)
-#     except Exception as ex:
-#         logger.exception(f"Error occurred in delete_entity_cache: {str(ex)}")
-
-
-# def fetch_entity_cache(**kwargs):
-#     """Fetch entity data from the cache in Redis.
-
-#     Args:
-#         **kwargs: Additional keyword arguments including 'entity_name', 'entity_id', 'db_tenant_engine'.
-
-#     Returns:
-#         dict: Response dictionary containing the fetched entity data or error response.
-#     """
-#     try:
-#         logger.debug(f"Fetching entity cache from redis having arguments: {kwargs}")
-#         entity_name = kwargs["entity_name"].upper()
-#         CACHE_ENTITY_KEYWORD = globals()[f"CACHE_{entity_name}_KEYWORD"]
-#         entity_data = get_redis_hash_map(CACHE_ENTITY_KEYWORD, kwargs["entity_id"])
-#         if not entity_data:
-#             return generate_entity_not_found_response(f"{kwargs['entity_name']}")
-#         response = generate_success_response(
-#             f"We have fetched {kwargs['entity_name']} details successfully."
-#         )
-#         response[kwargs["entity_name"]] = json.loads(entity_data)
-#         logger.debug(f"We have fetched {kwargs['entity_name']} details successfully.")
-#     except Exception as ex:
-#         response = generate_internal_server_error_response(str(ex))
-#     return response
-
-
-# endregion
-
-
-# region serialize datetime class
-
-
-# class CustomJSONEncoder(json.JSONEncoder):
-#     """Custom JSON encoder to handle datetime objects.
-
-#     This encoder extends json.JSONEncoder and provides custom serialization
-#     for datetime objects by converting them to ISO format strings.
-
-#     Attributes:
-#         default: Overrides the default method to handle datetime serialization.
-#     """
-
-#     def default(self, o):
-#         """Serialize datetime objects to ISO format strings.
-
-#         Args:
-#             obj: The object to serialize.
-
-#         Returns:
-#             str: Serialized representation of the object, or passed to the parent class for default handling.
-#         """
-#         if isinstance(o, datetime):
-#             return o.isoformat()
-#         return super().default(o)
-
-
 # endregion
 
 # region otp function
@@ -233,6 +131,29 @@ def get_current_time(with_seconds=True):
     return _date
 
 
+def get_current_timestamp():
+    # Seconds since epoch, the unit of the jwt iat/exp claims.
+    return int(datetime.now(timezone.utc).timestamp())
+
+
+def to_timestamp(value):
+    """Epoch seconds of an int timestamp or a legacy "%Y-%m-%d %H:%M:%S.%f"
+    UTC string, None when value is empty or cannot be read."""
+    try:
+        if value is None or value == "":
+            return None
+        if isinstance(value, (int, float)):
+            return int(value)
+        return int(
+            datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")
+            .replace(tzinfo=timezone.utc)
+            .timestamp()
+        )
+    except (TypeError, ValueError) as ex:
+        logger.warning(f"Unreadable timestamp {value}: {ex}")
+        return None
+
+
 def transform_datetime_ist(date_time):
     return date_time + timedelta(hours=5, minutes=30)
 
@@ -1,15 +1,22 @@
+from pydantic import ValidationError
+
 from utils.constants import DEFAULT_API_RESPONSE_OBJ
 from web.blueprints.api_routes import ENTITY_API_ROUTES
 from utils.utility import (
     generate_bad_request_response,
 )
-from infra.logging import logger
+from infra.logging import logger, summarize
 from web.blueprints.api_routes import AUTHENTICATION_API_ROUTES
 
 def entity_operation(entity_name, operation_name, payload):
     response = DEFAULT_API_RESPONSE_OBJ.copy()
     try:
-        logger.debug(f"Entity: {entity_name}, Operation: {operation_name}, Payload: {payload}")
+        logger.opt(lazy=True).debug(
+            "Entity: {}, Operation: {}, Payload: {}",
+            lambda: entity_name,
+            lambda: operation_name,
+            lambda: summarize(payload),
+        )
         if entity_name not in ENTITY_API_ROUTES:
             return ValueError(f"Entity {entity_name} not found.")
         if operation_name not in ENTITY_API_ROUTES[entity_name]:
@@ -18,7 +25,16 @@ def entity_operation(entity_name, operation_name, payload):
             )
         route = ENTITY_API_ROUTES[entity_name][operation_name]
         entity_data = {}
-        if route["schema"]:
+        if route.get("bulk"):
+            status, entity_data = _create_bulk_entity_data(entity_name, route, payload)
+            if not status:
+                response = generate_bad_request_response(
+                    "A non empty list of records is required for bulk operations."
+                )
+                return response
+            entity_data.update(payload)
+            response = route["api"](entity_data)
+        elif route["schema"]:
             entity_data[f"{entity_name}"] = _create_entity_data(route, payload)
             if not entity_data[f"{entity_name}"]:
                 response = generate_bad_request_response()
@@ -32,11 +48,30 @@ def entity_operation(entity_name, operation_name, payload):
         logger.exception(f"Error in entity_operation {entity_operation} in entity_name {entity_name}: {ex}")
     return response
 
+def entity_version(entity_name, operation_name, payload):
+    """Version probe of the entity a read operation returns.
+
+    Returns:
+        tuple: (status, modified_at), (False, None) when the operation has
+        no probe or the entity does not exist.
+    """
+    try:
+        route = ENTITY_API_ROUTES.get(entity_name, {}).get(operation_name, {})
+        if "version" not in route:
+            return False, None
+        return route["version"](payload)
+    except Exception as ex:
+        logger.exception(f"Error in entity_version of entity_name {entity_name}: {ex}")
+        return False, None
+
+
 def authentication_api_operation(payload, **kwargs):
     response = DEFAULT_API_RESPONSE_OBJ.copy()
     try:
-        logger.debug(
-            f"{kwargs['api_endpoint']} operation initiated having payload {payload}"
+        logger.opt(lazy=True).debug(
+            "{} operation initiated having payload {}",
+            lambda: kwargs["api_endpoint"],
+            lambda: summarize(payload),
         )
         if kwargs["api_endpoint"] not in AUTHENTICATION_API_ROUTES:
             response = generate_bad_request_response()
@@ -48,9 +83,52 @@ def authentication_api_operation(payload, **kwargs):
     return response
 
 
+def _create_bulk_entity_data(entity_name, route, payload):
+    """Validate every record of a bulk request against the route schema.
+
+    Returns:
+        tuple: (status, entity_data). entity_data holds the valid records as
+        (index, schema object) pairs under the entity name and the per-row
+        validation failures under ``rejected_records``.
+    """
+    records = payload.get("records")
+    if not isinstance(records, list) or not records:
+        return False, None
+    entity_data = {entity_name: [], "rejected_records": []}
+    for index, record in enumerate(records):
+        try:
+            if not isinstance(record, dict):
+                raise ValueError("record must be an object")
+            entity_data[entity_name].append((index, route["schema"](**record)))
+        except ValidationError as ex:
+            entity_data["rejected_records"].append(
+                {"index": index, "status": False, "msg": _format_validation_error(ex)}
+            )
+        except ValueError as ex:
+            entity_data["rejected_records"].append(
+                {"index": index, "status": False, "msg": str(ex)}
+            )
+    logger.debug(
+        f"Bulk {entity_name} records validated: {len(entity_data[entity_name])} valid, "
+        f"{len(entity_data['rejected_records'])} rejected"
+    )
+    return True, entity_data
+
+
+def _format_validation_error(ex):
+    return "; ".join(
+        f"{'.'.join(str(location) for location in error['loc'])}: {error['msg']}"
+        for error in ex.errors()
+    )
+
+
 def _create_entity_data(route, payload):
     try:
-        logger.debug(f"Creating entity_data object for route: {route}, payload: {payload}")
+        logger.opt(lazy=True).debug(
+            "Creating entity_data object for route: {}, payload: {}",
+            lambda: route,
+            lambda: summarize(payload),
+        )
         entity_data = None
         entity_data = route["schema"](**payload)
     except Exception as ex:
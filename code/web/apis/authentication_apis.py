@@ -1,10 +1,9 @@
 import jwt
 import bcrypt
-from datetime import timedelta
 
 
 from infra.environment import SECRET_KEY
-from infra.logging import logger
+from infra.logging import logger, summarize
 from utils.constants import DEFAULT_API_RESPONSE_OBJ, JWT_ACCESS_TOKEN_EXPIRES
 from utils.utility import (
     generate_internal_server_error_response,
@@ -12,14 +11,17 @@ from utils.utility import (
     generate_success_response,
     generate_entity_not_found_response,
 )
-from utils.utility import get_current_time, string_to_base64
+from utils.utility import get_current_time, get_current_timestamp, string_to_base64
 from management.entities.user.model import UserProvider
 
 
 def user_login(content):
     response = DEFAULT_API_RESPONSE_OBJ.copy()
     try:
-        logger.debug(f"Logging in user with content: {content}")
+        logger.opt(lazy=True).debug(
+            "Logging in user with content: {}",
+            lambda: summarize(content),
+        )
         user = None
         if content.get("email", ""):
             _, user = UserProvider.get_by_attribute("email", content)
@@ -38,12 +40,15 @@ def user_login(content):
                 response = generate_bad_request_response("Invalid password.")
                 return response
             response = generate_success_response("user logged in successfully.")
+            issued_at = get_current_timestamp()
             token = jwt.encode(
                 {
                     "user_id": user.user_id,
-                    "created_at": str(get_current_time()),
-                    "expiration": str(
-                        get_current_time() + timedelta(seconds=JWT_ACCESS_TOKEN_EXPIRES)
+                    "iat": issued_at,
+                    "exp": issued_at + JWT_ACCESS_TOKEN_EXPIRES,
+                    # Every logout bumps the counter and so revokes the token.
+                    "token_version": int(
+                        (user.attributes or {}).get("logged_out_counter", 0)
                     ),
                 },
                 SECRET_KEY,
@@ -65,22 +70,31 @@ def user_login(content):
 def user_logout(content):
     response = DEFAULT_API_RESPONSE_OBJ.copy()
     try:
-        logger.debug(f"Logging out user with content: {content}")
+        logger.opt(lazy=True).debug(
+            "Logging out user with content: {}",
+            lambda: summarize(content),
+        )
         if not content.get("current_user", ""):
             response = generate_entity_not_found_response("user")
             return response
+        _, user = UserProvider.get_by_attribute(
+            "user_id", {"user_id": content["current_user"].user_id}
+        )
+        if not user:
+            response = generate_entity_not_found_response("user")
+            return response
         current_time = get_current_time()
-        content["current_user"].attributes["logged_out_time"] = str(current_time)
-        # content["current_user"].attributes["logged_in_mac_address"] = get_mac_address()
-        content["current_user"].attributes["logged_out_counter"] = (
-            int(content["current_user"].attributes["logged_out_counter"]) + 1
-            if "logged_out_counter" in content["current_user"].attributes
+        user.attributes["logged_out_time"] = get_current_timestamp()
+        # user.attributes["logged_in_mac_address"] = get_mac_address()
+        user.attributes["logged_out_counter"] = (
+            int(user.attributes["logged_out_counter"]) + 1
+            if "logged_out_counter" in user.attributes
             else 1
         )
-        content["current_user"].modified_at = current_time
-        content["current_user"].modified_by = content["current_user"].user_id
+        user.modified_at = current_time
+        user.modified_by = user.user_id
         status = False
-        status, _ = UserProvider.update(content["current_user"])
+        status, _ = user.update()
         if not status:
             response = generate_internal_server_error_response("User update failed.")
             return response
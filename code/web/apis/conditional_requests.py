@@ -0,0 +1,128 @@
+import hashlib
+from datetime import timezone
+
+from flask import jsonify, request
+from werkzeug.http import http_date
+
+from utils.constants import RESPONSE_CODE_KWD
+
+
+def get_validators(versions, next_cursor=None, total_records=None):
+    """Strong ETag and Last-Modified of a representation.
+
+    Args:
+        versions (list): (entity id, modified_at) of the returned records.
+        next_cursor (str): cursor of the next page of a listing.
+        total_records (int): total of a paged listing.
+
+    Returns:
+        tuple: (etag, last_modified), last_modified being the latest
+        modified_at or None.
+    """
+    # The headers changing the representation of the same url.
+    representation_headers = (
+        request.headers.get("Include-Deleted"),
+        request.headers.get("Resolve-Relationships"),
+    )
+    etag = hashlib.sha1(
+        repr(
+            (
+                request.full_path,
+                representation_headers,
+                versions,
+                next_cursor,
+                total_records,
+            )
+        ).encode("utf-8")
+    ).hexdigest()
+    last_modified = max(
+        (modified_at for _, modified_at in versions if modified_at is not None),
+        default=None,
+    )
+    return etag, last_modified
+
+
+def get_validator_headers(etag, last_modified):
+    headers = {"ETag": f'"{etag}"'}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified.replace(tzinfo=timezone.utc))
+    return headers
+
+
+def is_not_modified(etag, last_modified, use_last_modified=True):
+    """Whether the client copy is current. If-None-Match wins over
+    If-Modified-Since, which listings ignore: a removed record does not
+    move their Last-Modified.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if use_last_modified and last_modified is not None and request.if_modified_since:
+        return (
+            last_modified.replace(tzinfo=timezone.utc, microsecond=0)
+            <= request.if_modified_since
+        )
+    return False
+
+
+def get_record_versions(response, entity_name):
+    """(id, modified_at) of the records of a fetch or listing response, and of
+    the related records expanded in them, None when the response carries no
+    records."""
+    records = response.get("records", response.get(entity_name))
+    if isinstance(records, dict):
+        records = [records]
+    if not isinstance(records, list):
+        return None
+    # A projection (fields=) without modified_at cannot be validated.
+    if any(
+        isinstance(record, dict) and "modified_at" not in record for record in records
+    ):
+        return None
+    id_column_name = f"{entity_name}_id"
+    versions = []
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        versions.append(
+            (
+                record.get(id_column_name),
+                record.get("modified_at") or record.get("created_at"),
+            )
+        )
+        versions.extend(_get_related_versions(record))
+    return versions
+
+
+def _get_related_versions(record):
+    # Expanded relationships are nested dicts or lists of dicts, keyed by
+    # their id column first.
+    versions = []
+    for name, value in record.items():
+        related_records = value if isinstance(value, list) else [value]
+        for related_record in related_records:
+            if isinstance(related_record, dict) and "created_at" in related_record:
+                versions.append(
+                    (
+                        f"{name}:{next(iter(related_record.values()))}",
+                        related_record.get("modified_at")
+                        or related_record.get("created_at"),
+                    )
+                )
+    return versions
+
+
+def make_conditional_response(response, entity_name, use_last_modified=True):
+    """Serialize a read response with ETag and Last-Modified headers, or
+    answer 304 without serializing it when the client copy is current."""
+    headers = {}
+    versions = None
+    if response[RESPONSE_CODE_KWD] == 200:
+        versions = get_record_versions(response, entity_name)
+    if versions is not None:
+        etag, last_modified = get_validators(
+            versions, response.get("next_cursor"), response.get("total_records")
+        )
+        headers = get_validator_headers(etag, last_modified)
+        if is_not_modified(etag, last_modified, use_last_modified):
+            return "", 304, headers
+    return jsonify(response), response[RESPONSE_CODE_KWD], headers
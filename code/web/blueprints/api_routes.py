@@ -1,53 +1,164 @@
-
-from management.entities.user.apis import (
-    create_user,
-    get_user,
-    get_all_users,
-    update_user,
-    delete_user,
-    get_total_users,
-    get_limited_users,
-    get_filtered_users,
-)
-from management.entities.user.schema import UserCreate, UserUpdate
+from management.entities.user.apis import user_api
+from management.entities.user.schema import (
+    UserCreate,
+    UserDelete,
+    UserUpdate,
+)
+from management.entities.address_book.apis import address_book_api
+from management.entities.address_book.schema import (
+    AddressBookCreate,
+    AddressBookDelete,
+    AddressBookUpdate,
+)
+from management.entities.cart.apis import cart_api
+from management.entities.cart.schema import (
+    CartCreate,
+    CartDelete,
+    CartUpdate,
+)
+from management.entities.cart_item.apis import cart_item_api
+from management.entities.cart_item.schema import (
+    CartItemCreate,
+    CartItemDelete,
+    CartItemUpdate,
+)
+from management.entities.order.apis import order_api
+from management.entities.order.schema import (
+    OrderCreate,
+    OrderDelete,
+    OrderUpdate,
+)
+from management.entities.order_item.apis import order_item_api
+from management.entities.order_item.schema import (
+    OrderItemCreate,
+    OrderItemDelete,
+    OrderItemUpdate,
+)
+from management.entities.payment.apis import payment_api
+from management.entities.payment.schema import (
+    PaymentCreate,
+    PaymentDelete,
+    PaymentUpdate,
+)
+from management.entities.shipping.apis import shipping_api
+from management.entities.shipping.schema import (
+    ShippingCreate,
+    ShippingDelete,
+    ShippingUpdate,
+)
+from management.entities.coupon.apis import coupon_api
+from management.entities.coupon.schema import (
+    CouponCreate,
+    CouponDelete,
+    CouponUpdate,
+)
+from management.entities.review.apis import review_api
+from management.entities.review.schema import (
+    ReviewCreate,
+    ReviewDelete,
+    ReviewUpdate,
+)
+from management.entities.audit_log.apis import audit_log_api
+from management.entities.audit_log.schema import (
+    AuditLogCreate,
+    AuditLogDelete,
+    AuditLogUpdate,
+)
+from management.entities.product.apis import product_api
+from management.entities.product.schema import (
+    ProductCreate,
+    ProductDelete,
+    ProductUpdate,
+)
+from management.entities.product_inventory.apis import product_inventory_api
+from management.entities.product_inventory.schema import (
+    ProductInventoryCreate,
+    ProductInventoryDelete,
+    ProductInventoryUpdate,
+)
+from management.entities.product_image.apis import product_image_api
+from management.entities.product_image.schema import (
+    ProductImageCreate,
+    ProductImageDelete,
+    ProductImageUpdate,
+)
+from management.entities.category.apis import category_api
+from management.entities.category.schema import (
+    CategoryCreate,
+    CategoryDelete,
+    CategoryUpdate,
+)
+from management.entities.brand.apis import brand_api
+from management.entities.brand.schema import (
+    BrandCreate,
+    BrandDelete,
+    BrandUpdate,
+)
 from web.apis.authentication_apis import user_login, user_logout
 
 
-
-
+def _entity_routes(entity_api, create_schema, update_schema, delete_schema):
+    return {
+        "create": {"schema": create_schema, "api": entity_api.create},
+        "fetch": {
+            "schema": "", "api": entity_api.get, "version": entity_api.get_version
+        },
+        "fetch_all": {"schema": "", "api": entity_api.get_all},
+        "update": {"schema": update_schema, "api": entity_api.update},
+        "delete": {"schema": "", "api": entity_api.delete},
+        "total": {"schema": "", "api": entity_api.get_total},
+        "get_limited_records": {"schema": "", "api": entity_api.get_limited},
+        "get_filtered_records": {"schema": "", "api": entity_api.get_filtered},
+        "get_page": {"schema": "", "api": entity_api.get_paged},
+        "export": {"schema": "", "api": entity_api.export},
+        "bulk_create": {
+            "schema": create_schema, "api": entity_api.bulk_create, "bulk": True
+        },
+        "bulk_update": {
+            "schema": update_schema, "api": entity_api.bulk_update, "bulk": True
+        },
+        "bulk_delete": {
+            "schema": delete_schema, "api": entity_api.bulk_delete, "bulk": True
+        },
+    }
 
 
 ENTITY_API_ROUTES = {
-    "user": {
-        "create": {"schema": UserCreate, "api": create_user},
-        "fetch": {"schema": "", "api": get_user},
-        "fetch_all": {"schema": "", "api": get_all_users},
-        "update": {"schema": UserUpdate, "api": update_user},
-        "delete": {"schema": "", "api": delete_user},
-        "total": {"schema": "", "api": get_total_users},
-        "get_limited_records": {"schema": "", "api": get_limited_users},
-        "get_filtered_records": {"schema": "", "api": get_filtered_users},
-
-
-        # "create": {"schema": UserCreate, "api": create_user},
-        # "fetch": {"schema": "", "api": get_user},
-        # "fetch_all": {"schema": "", "api": get_all_users},
-        # "update": {"schema": UserUpdate, "api": update_user},
-        # "delete": {"schema": UserDelete, "api": delete_user},
-        # "total": {"schema": "", "api": get_total_users},
-        # "get_limited_records": {"schema": "", "api": get_limited_users},
-        # "get_filtered_records": {"schema": "", "api": get_filtered_users},
-    },
-    "product": {
-        # "create": {"schema": UserCreate, "api": create_user},
-        # "fetch": {"schema": "", "api": get_user},
-        # "fetch_all": {"schema": "", "api": get_all_users},
-        # "update": {"schema": UserUpdate, "api": update_user},
-        # "delete": {"schema": UserDelete, "api": delete_user},
-        # "total": {"schema": "", "api": get_total_users},
-        # "get_limited_records": {"schema": "", "api": get_limited_users},
-        # "get_filtered_records": {"schema": "", "api": get_filtered_users},
-    },
+    "user": _entity_routes(user_api, UserCreate, UserUpdate, UserDelete),
+    "address_book": _entity_routes(
+        address_book_api, AddressBookCreate, AddressBookUpdate, AddressBookDelete
+    ),
+    "cart": _entity_routes(cart_api, CartCreate, CartUpdate, CartDelete),
+    "cart_item": _entity_routes(
+        cart_item_api, CartItemCreate, CartItemUpdate, CartItemDelete
+    ),
+    "order": _entity_routes(order_api, OrderCreate, OrderUpdate, OrderDelete),
+    "order_item": _entity_routes(
+        order_item_api, OrderItemCreate, OrderItemUpdate, OrderItemDelete
+    ),
+    "payment": _entity_routes(payment_api, PaymentCreate, PaymentUpdate, PaymentDelete),
+    "shipping": _entity_routes(
+        shipping_api, ShippingCreate, ShippingUpdate, ShippingDelete
+    ),
+    "coupon": _entity_routes(coupon_api, CouponCreate, CouponUpdate, CouponDelete),
+    "review": _entity_routes(review_api, ReviewCreate, ReviewUpdate, ReviewDelete),
+    "audit_log": _entity_routes(
+        audit_log_api, AuditLogCreate, AuditLogUpdate, AuditLogDelete
+    ),
+    "product": _entity_routes(product_api, ProductCreate, ProductUpdate, ProductDelete),
+    "product_inventory": _entity_routes(
+        product_inventory_api,
+        ProductInventoryCreate,
+        ProductInventoryUpdate,
+        ProductInventoryDelete,
+    ),
+    "product_image": _entity_routes(
+        product_image_api, ProductImageCreate, ProductImageUpdate, ProductImageDelete
+    ),
+    "category": _entity_routes(
+        category_api, CategoryCreate, CategoryUpdate, CategoryDelete
+    ),
+    "brand": _entity_routes(brand_api, BrandCreate, BrandUpdate, BrandDelete),
 }
 
 AUTHENTICATION_API_ROUTES = {
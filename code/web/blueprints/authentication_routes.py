@@ -4,7 +4,7 @@ from flask import Blueprint, jsonify, request
 from web.apis.api_handler import authentication_api_operation
 from utils.utility import get_request_paramenters, generate_internal_server_error_response, generate_success_response
 from utils.constants import DEFAULT_API_RESPONSE_OBJ, RESPONSE_CODE_KWD
-from infra.logging import logger
+from infra.logging import logger, summarize
 from utils.config import validate_jwt_token, create_session
 
 
@@ -26,7 +26,10 @@ def status():
 @create_session
 def user_login_operation(**kwargs):
     try:
-        logger.debug(f"Authentication Login API called : {kwargs}")
+        logger.opt(lazy=True).debug(
+            "Authentication Login API called : {}",
+            lambda: summarize(kwargs),
+        )
         payload = request.json
         # kwargs.update(get_request_paramenters(request.headers))
         kwargs["api_endpoint"] = "login"
@@ -41,7 +44,10 @@ def user_login_operation(**kwargs):
 @validate_jwt_token
 def authentication_get_operation(**kwargs):
     try:
-        logger.debug(f"Authentication GET API called : {kwargs}")
+        logger.opt(lazy=True).debug(
+            "Authentication GET API called : {}",
+            lambda: summarize(kwargs),
+        )
         payload = {}
         # kwargs.update(get_request_paramenters(request.headers))
         response = authentication_api_operation(payload, **kwargs)        
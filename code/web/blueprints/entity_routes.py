@@ -1,12 +1,18 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from utils.constants import DEFAULT_API_RESPONSE_OBJ, RESPONSE_CODE_KWD
-from web.apis.api_handler import entity_operation
+from web.apis.api_handler import entity_operation, entity_version
+from web.apis.conditional_requests import (
+    get_validator_headers,
+    get_validators,
+    is_not_modified,
+    make_conditional_response,
+)
 from utils.utility import (
     get_request_paramenters,
     generate_internal_server_error_response,
     generate_success_response,
 )
-from infra.logging import logger
+from infra.logging import logger, summarize
 from utils.config import create_session, validate_jwt_token
 
 
@@ -32,23 +38,31 @@ def entity_get_all_operation_route(**kwargs):
 
     response = DEFAULT_API_RESPONSE_OBJ.copy()
     try:
-        logger.debug(f"Get all operation route called with kwargs: {kwargs}")
-        payload= {}
+        logger.opt(lazy=True).debug(
+            "Get all operation route called with kwargs: {}",
+            lambda: summarize(kwargs),
+        )
+        payload = {}
         payload.update(get_request_paramenters(request.headers))
-        payload = {
+        payload.update({
             "query_params": request.args.to_dict(flat=False),
             "entity_name": kwargs["entity_name"],
-            "db" : kwargs["db"],
+            "db": kwargs["db"],
             "db_session": kwargs["db_session"],
             "operation_name": kwargs["operation_name"],
-        }
+        })
         response = entity_operation(
             kwargs["entity_name"], kwargs["operation_name"], payload
         )
     except Exception as ex:
         logger.exception(f"Error in get_all_operation_route: {ex}")
         response = generate_internal_server_error_response(str(ex))
-    return jsonify(response), response[RESPONSE_CODE_KWD]
+        return jsonify(response), response[RESPONSE_CODE_KWD]
+    if "stream" in response:
+        return _make_stream_response(response)
+    return make_conditional_response(
+        response, kwargs["entity_name"], use_last_modified=False
+    )
 
 
 @entity_route.route("/<entity_name>/<operation_name>/<entity_id>/", methods=["GET"])
@@ -56,24 +70,36 @@ def entity_get_all_operation_route(**kwargs):
 # @validate_jwt_token
 def entity_get_operation_route(**kwargs):
     try:
-        logger.debug(f"Get operation route called with kwargs: {kwargs}")
-        payload= {}
+        logger.opt(lazy=True).debug(
+            "Get operation route called with kwargs: {}",
+            lambda: summarize(kwargs),
+        )
+        payload = {}
         payload.update(get_request_paramenters(request.headers))
-        payload = {
+        payload.update({
             f"{kwargs['entity_name']}_id": kwargs["entity_id"],
             "query_params": request.args.to_dict(flat=False),
             "entity_name": kwargs["entity_name"],
-            "db" : kwargs["db"],
+            "db": kwargs["db"],
             "db_session": kwargs["db_session"],
             "operation_name": kwargs["operation_name"],
-        }
+        })
+        # Answer 304 from the version probe, before the row is loaded.
+        status, modified_at = entity_version(
+            kwargs["entity_name"], kwargs["operation_name"], payload
+        )
+        if status:
+            etag, last_modified = get_validators([(kwargs["entity_id"], modified_at)])
+            if is_not_modified(etag, last_modified):
+                return "", 304, get_validator_headers(etag, last_modified)
         response = entity_operation(
             kwargs["entity_name"], kwargs["operation_name"], payload
         )
     except Exception as ex:
         logger.exception(f"Error in get_operation_route: {ex}")
         response = generate_internal_server_error_response(str(ex))
-    return jsonify(response), response[RESPONSE_CODE_KWD]
+        return jsonify(response), response[RESPONSE_CODE_KWD]
+    return make_conditional_response(response, kwargs["entity_name"])
 
 
 @entity_route.route("/<entity_name>/<operation_name>/<entity_id>", methods=["DELETE"])
@@ -82,12 +108,17 @@ def entity_get_operation_route(**kwargs):
 def entity_delete_operation_route(**kwargs):
     response = DEFAULT_API_RESPONSE_OBJ.copy()
     try:
-        logger.debug(f"Delete operation route called with kwargs: {kwargs}")
+        logger.opt(lazy=True).debug(
+            "Delete operation route called with kwargs: {}",
+            lambda: summarize(kwargs),
+        )
         payload = {}
         payload.update(get_request_paramenters(request.headers))
+        payload.update(request.get_json(silent=True) or {})
         payload.update({
             f"{kwargs['entity_name']}_id": kwargs["entity_id"],
             "entity_name": kwargs["entity_name"],
+            "query_params": request.args.to_dict(flat=False),
             "db": kwargs["db"],
             "db_session": kwargs["db_session"],
             "operation_name": kwargs["operation_name"],
@@ -107,7 +138,10 @@ def entity_delete_operation_route(**kwargs):
 def entity_post_operation_route(**kwargs):
     response = DEFAULT_API_RESPONSE_OBJ.copy()
     try:
-        logger.debug(f"Post operation route called with kwargs: {kwargs}")
+        logger.opt(lazy=True).debug(
+            "Post operation route called with kwargs: {}",
+            lambda: summarize(kwargs),
+        )
         payload = {}
         payload.update(get_request_paramenters(request.headers))
         payload.update(request.get_json())
@@ -132,7 +166,10 @@ def entity_post_operation_route(**kwargs):
 def entity_put_operation_route(**kwargs):
     response = DEFAULT_API_RESPONSE_OBJ.copy()
     try:
-        logger.debug(f"Put operation route called with kwargs: {kwargs}")
+        logger.opt(lazy=True).debug(
+            "Put operation route called with kwargs: {}",
+            lambda: summarize(kwargs),
+        )
         payload = {}
         payload.update(get_request_paramenters(request.headers))
         payload.update(request.get_json())
@@ -150,3 +187,15 @@ def entity_put_operation_route(**kwargs):
         logger.exception(f"Error in put_operation_route: {ex}")
         response = generate_internal_server_error_response(str(ex))
     return jsonify(response), response[RESPONSE_CODE_KWD]
+
+
+def _make_stream_response(response):
+    # stream_with_context keeps the request, and its db session, open until
+    # the last chunk is sent.
+    return Response(
+        stream_with_context(response["stream"]),
+        mimetype=response["mimetype"],
+        headers={
+            "Content-Disposition": f'attachment; filename="{response["filename"]}"'
+        },
+    )
@@ -0,0 +1,129 @@
+from flask import Blueprint, Response, g, jsonify, request
+
+from infra.db_router import get_pool_metrics
+from infra.logging import get_log_sink_metrics, logger
+from infra.metrics import (
+    finish_request_metrics,
+    request_metrics,
+    start_request_metrics,
+)
+from management.entities.entity_base.cache import entity_cache
+from web.blueprints.api_routes import AUTHENTICATION_API_ROUTES, ENTITY_API_ROUTES
+from utils.constants import DEFAULT_API_RESPONSE_OBJ, RESPONSE_CODE_KWD
+from utils.utility import (
+    generate_internal_server_error_response,
+    generate_success_response,
+)
+
+
+monitoring_route = Blueprint("monitoring_route", __name__)
+
+# Label values taken from the request are limited to known ones, so a client
+# cannot create new series.
+METRIC_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
+
+
+@monitoring_route.route("/db-pools/", methods=["GET"])
+def db_pool_status():
+    response = DEFAULT_API_RESPONSE_OBJ.copy()
+    try:
+        logger.debug("DB pool status route called")
+        response = generate_success_response("DB pool metrics fetched successfully")
+        response["pools"] = get_pool_metrics()
+    except Exception as ex:
+        logger.exception(f"Error in db_pool_status: {ex}")
+        response = generate_internal_server_error_response(str(ex))
+    return jsonify(response), response[RESPONSE_CODE_KWD]
+
+
+@monitoring_route.route("/log-sinks/", methods=["GET"])
+def log_sink_status():
+    response = DEFAULT_API_RESPONSE_OBJ.copy()
+    try:
+        logger.debug("Log sink status route called")
+        response = generate_success_response("Log sink metrics fetched successfully")
+        response["log_sinks"] = get_log_sink_metrics()
+    except Exception as ex:
+        logger.exception(f"Error in log_sink_status: {ex}")
+        response = generate_internal_server_error_response(str(ex))
+    return jsonify(response), response[RESPONSE_CODE_KWD]
+
+
+@monitoring_route.route("/entity-cache/", methods=["GET"])
+def entity_cache_status():
+    response = DEFAULT_API_RESPONSE_OBJ.copy()
+    try:
+        logger.debug("Entity cache status route called")
+        response = generate_success_response("Entity cache metrics fetched successfully")
+        response["entity_cache"] = entity_cache.stats()
+    except Exception as ex:
+        logger.exception(f"Error in entity_cache_status: {ex}")
+        response = generate_internal_server_error_response(str(ex))
+    return jsonify(response), response[RESPONSE_CODE_KWD]
+
+
+@monitoring_route.route("/metrics/", methods=["GET"])
+def metrics():
+    try:
+        if request_metrics is None:
+            return Response("# Request metrics are disabled\n", mimetype="text/plain")
+        return Response(
+            request_metrics.render(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+    except Exception as ex:
+        logger.exception(f"Error in metrics: {ex}")
+        response = generate_internal_server_error_response(str(ex))
+        return jsonify(response), response[RESPONSE_CODE_KWD]
+
+
+def get_metric_labels():
+    """Labels of the current request in the request metrics: entity and
+    operation for the entity routes, endpoint for the others."""
+    method = request.method if request.method in METRIC_METHODS else "OTHER"
+    view_args = request.view_args or {}
+    if request.blueprint == "entity_route" and "entity_name" in view_args:
+        entity_name = view_args["entity_name"]
+        operation_name = view_args.get("operation_name")
+        if entity_name not in ENTITY_API_ROUTES:
+            entity_name, operation_name = "unknown", "unknown"
+        elif operation_name not in ENTITY_API_ROUTES[entity_name]:
+            operation_name = "unknown"
+        return (
+            ("blueprint", "entity_route"),
+            ("entity", entity_name),
+            ("operation", operation_name),
+            ("method", method),
+        )
+    endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+    if request.blueprint == "auth_route":
+        # /authenticate/login and /authenticate/<api_endpoint> both as "login".
+        endpoint = view_args.get("api_endpoint", endpoint.strip("/").split("/")[-1])
+        if "api_endpoint" in view_args and endpoint not in AUTHENTICATION_API_ROUTES:
+            endpoint = "unknown"
+    return (
+        ("blueprint", request.blueprint or "app"),
+        ("endpoint", endpoint),
+        ("method", method),
+    )
+
+
+@monitoring_route.before_app_request
+def start_metrics():
+    g.metric_labels = get_metric_labels()
+    g.metrics_started_at = start_request_metrics(g.metric_labels)
+
+
+@monitoring_route.after_app_request
+def record_metrics_status(response):
+    g.metrics_status = response.status_code
+    return response
+
+
+@monitoring_route.teardown_app_request
+def finish_metrics(exception=None):
+    # Teardown runs even when the request failed before a response was made.
+    if "metric_labels" in g:
+        finish_request_metrics(
+            g.metric_labels, g.get("metrics_status", 500), g.metrics_started_at
+        )
@@ -0,0 +1,616 @@
+"""Throughput and latency of the entity API operations and of the login.
+
+Usage (from the repository root):
+    python research/scripts/benchmark_api.py [--scales 0.1,1]
+        [--entities user,product,order] [--requests 200] [--concurrency 1]
+        [--seed 42] [--compare research/results/benchmark_api_<...>.json]
+
+For each scale a SQLite database is generated with generate_data.py, kept in
+--data-dir for the next runs of the same seed and scale. A worker process
+then serves the app on a copy of it through the Flask test client and, per
+entity, times --requests requests of every operation (fetch, fetch_all,
+total, get_limited_records, get_filtered_records, create, update, delete)
+and of /authenticate/login with the synthetic users. Reads run first; update
+and delete work on the rows created by the benchmark, so every run sees the
+same data.
+
+Results (requests/s, mean, p50, p95, p99 and max latency in ms, status codes
+and the table sizes) are written to research/results/benchmark_api_<UTC
+time>.json. --compare prints the change against an earlier results file and
+flags the operations whose p95 or throughput got worse by more than
+--threshold percent.
+
+The test client skips the network and the WSGI server, so the numbers are
+those of the application layer. CSRF protection is off for the write
+requests, as for API clients, and deletes pass ?deleted_by= as no user is
+logged in. Any response outside 2xx marks its operation as failed: failed
+operations are left out of the comparison and make the run exit with 1.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+scripts_path = Path(__file__).resolve().parent
+code_path = scripts_path.parent.parent / "code"
+
+RESULTS_PATH = scripts_path.parent / "results"
+DEFAULT_DATA_DIR = Path(tempfile.gettempdir()) / "flask_ecommerce_benchmark"
+DEFAULT_SCALES = "0.1,1"
+DEFAULT_ENTITIES = "user,product,order"
+DEFAULT_REQUESTS = 200
+WARMUP_REQUESTS = 10
+# fetch_all returns the whole table, fewer requests keep large scales short.
+FETCH_ALL_REQUESTS = 10
+PAGE_SIZE = 20
+# Existing ids fetched, round robin.
+FETCH_ID_POOL = 1000
+# Index of the first row created by the benchmark, far above the generated ones.
+CREATED_INDEX_OFFSET = 10 ** 9
+READ_OPERATIONS = [
+    "fetch",
+    "fetch_all",
+    "total",
+    "get_limited_records",
+    "get_filtered_records",
+]
+# Words of the generated data matching rows of the searchable columns.
+SEARCH_TERMS = {
+    "user": "Sharma",
+    "product": "Phone",
+    "brand": "goods",
+    "category": "Smart",
+    "coupon": "SAVE000001",
+    "order": "delivered",
+    "payment": "upi",
+    "shipping": "DHL",
+    "review": "Rated",
+    "audit_log": "update",
+    "address_book": "Street",
+    "product_image": "image",
+    "product_inventory": "Mumbai",
+}
+# Columns the create requests leave to the API.
+SERVER_COLUMNS = {"created_at", "modified_at", "deleted_at", "deleted_by", "updated_at"}
+BASE_URL = "https://localhost"
+
+
+# region statistics
+
+
+def percentile(sorted_values, rank):
+    """Nearest-rank percentile of sorted values."""
+    if not sorted_values:
+        return None
+    position = max(0, math.ceil(rank / 100 * len(sorted_values)) - 1)
+    return sorted_values[min(position, len(sorted_values) - 1)]
+
+
+def summarize_latencies(latencies, elapsed):
+    latencies = sorted(latencies)
+    milliseconds = lambda value: round(value * 1000, 3)  # noqa: E731
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "latency_ms": {
+            "mean": milliseconds(sum(latencies) / len(latencies)),
+            "p50": milliseconds(percentile(latencies, 50)),
+            "p95": milliseconds(percentile(latencies, 95)),
+            "p99": milliseconds(percentile(latencies, 99)),
+            "max": milliseconds(latencies[-1]),
+        },
+    }
+
+
+# endregion
+
+
+# region worker
+
+
+def _to_json_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class OperationRunner:
+    """Times the requests of one operation, from `concurrency` threads
+    each with its own test client."""
+
+    def __init__(self, app, concurrency):
+        self.app = app
+        self.concurrency = concurrency
+
+    def run(self, make_request, requests, on_response=None, warmup=WARMUP_REQUESTS):
+        """make_request(index) gives (method, url, json body or None), called
+        with the warmup indexes first, from requests on, then with 0 to
+        requests - 1. on_response, when given, gets every response."""
+        client = self.app.test_client()
+        for index in range(requests, requests + warmup):
+            response = self._send(client, make_request(index))
+            if on_response is not None:
+                on_response(response)
+
+        latencies = []
+        status_codes = Counter()
+        lock = threading.Lock()
+
+        def work(indexes):
+            thread_client = self.app.test_client()
+            thread_latencies = []
+            thread_status_codes = Counter()
+            for index in indexes:
+                started_at = time.perf_counter()
+                response = self._send(thread_client, make_request(index))
+                thread_latencies.append(time.perf_counter() - started_at)
+                thread_status_codes[response.status_code] += 1
+                if on_response is not None:
+                    on_response(response)
+            with lock:
+                latencies.extend(thread_latencies)
+                status_codes.update(thread_status_codes)
+
+        threads = [
+            threading.Thread(target=work, args=(range(thread, requests, self.concurrency),))
+            for thread in range(self.concurrency)
+        ]
+        started_at = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        result = summarize_latencies(latencies, time.perf_counter() - started_at)
+        result["status_codes"] = {
+            str(status_code): count for status_code, count in sorted(status_codes.items())
+        }
+        # Latencies of error responses are not those of the operation.
+        result["failed_requests"] = sum(
+            count
+            for status_code, count in status_codes.items()
+            if not 200 <= status_code < 300
+        )
+        result["failed"] = result["failed_requests"] > 0
+        return result
+
+    @staticmethod
+    def _send(client, request):
+        method, url, body = request
+        response = client.open(url, method=method, json=body, base_url=BASE_URL)
+        # Read the body, streamed responses run their queries here.
+        response.get_data()
+        return response
+
+
+def get_table_rows(database_path):
+    with sqlite3.connect(database_path) as connection:
+        table_names = [
+            name
+            for (name,) in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE '%_fts%' "
+                "AND name != 'schema_migrations' ORDER BY name"
+            )
+        ]
+        return {
+            table_name: connection.execute(
+                f'SELECT COUNT(*) FROM "{table_name}"'
+            ).fetchone()[0]
+            for table_name in table_names
+        }
+
+
+def get_live_ids(database_path, table_name, id_column_name, limit=FETCH_ID_POOL):
+    with sqlite3.connect(database_path) as connection:
+        return [
+            entity_id
+            for (entity_id,) in connection.execute(
+                f'SELECT "{id_column_name}" FROM "{table_name}" '
+                f"WHERE deleted_by IS NULL ORDER BY rowid LIMIT ?",
+                (limit,),
+            )
+        ]
+
+
+def run_worker(args):
+    """Benchmark the app on the database of SQLITE_DB_PATH, results are
+    written as JSON to args.worker_output."""
+    sys.path.append(str(code_path))
+    os.chdir(code_path)
+    # Imported here: the app reads SQLITE_DB_PATH when imported.
+    import app as app_module
+    from infra.database import db
+    from generate_data import SYNTHETIC_PASSWORD, SyntheticData
+    from web.blueprints.api_routes import ENTITY_API_ROUTES
+
+    app = app_module.app
+    app.config["WTF_CSRF_ENABLED"] = False
+    database_path = os.environ["SQLITE_DB_PATH"]
+    runner = OperationRunner(app, args.concurrency)
+    data = SyntheticData(seed=args.seed, scale=args.scale)
+    results = []
+
+    def record(entity_name, operation_name, result):
+        result.update({"entity": entity_name, "operation": operation_name})
+        results.append(result)
+        print(
+            f"  {entity_name:<18} {operation_name:<21} "
+            f"{result['throughput_rps']:>9} req/s  "
+            f"p50 {result['latency_ms']['p50']:>8} ms  "
+            f"p95 {result['latency_ms']['p95']:>8} ms  "
+            f"p99 {result['latency_ms']['p99']:>8} ms  {result['status_codes']}"
+            + ("  FAILED" if result["failed"] else ""),
+            flush=True,
+        )
+
+    for entity_name in args.entities:
+        if entity_name not in ENTITY_API_ROUTES:
+            print(f"  Skipping {entity_name}: no such entity.")
+            continue
+        id_column_name = f"{entity_name}_id"
+        live_ids = get_live_ids(database_path, entity_name, id_column_name)
+        url = f"/api/{entity_name}"
+        search_term = SEARCH_TERMS.get(entity_name)
+        read_requests = {
+            "fetch": lambda index: (
+                "GET", f"{url}/fetch/{live_ids[index % len(live_ids)]}/", None
+            ),
+            "fetch_all": lambda index: ("GET", f"{url}/fetch_all/", None),
+            "total": lambda index: ("GET", f"{url}/total/", None),
+            "get_limited_records": lambda index: (
+                "GET", f"{url}/get_limited_records/?limit={PAGE_SIZE}", None
+            ),
+            "get_filtered_records": lambda index: (
+                "GET",
+                f"{url}/get_filtered_records/?limit={PAGE_SIZE}"
+                + (f"&search_string={search_term}" if search_term else ""),
+                None,
+            ),
+        }
+        for operation_name in READ_OPERATIONS:
+            if operation_name == "fetch" and not live_ids:
+                continue
+            requests = args.requests
+            if operation_name == "fetch_all":
+                requests = min(requests, FETCH_ALL_REQUESTS)
+            record(
+                entity_name,
+                operation_name,
+                runner.run(read_requests[operation_name], requests),
+            )
+
+        # Rows to create: copies of a generated row, so their foreign keys
+        # point to existing rows.
+        _, template_rows = next(data.iter_tables({entity_name}))
+        row_template = next(template_rows)
+        unique_columns = [
+            column.name
+            for column in db.metadata.tables[entity_name].columns
+            if column.unique
+        ]
+        created_ids = []
+
+        def create_request(index):
+            return (
+                "POST",
+                f"{url}/create/",
+                _make_create_body(row_template, id_column_name, unique_columns, index),
+            )
+
+        def on_create_response(response):
+            if response.status_code == 200:
+                created_ids.append(response.get_json()[entity_name][id_column_name])
+
+        requests = args.requests
+        record(
+            entity_name,
+            "create",
+            runner.run(create_request, requests, on_response=on_create_response),
+        )
+        if not created_ids:
+            print(f"  No {entity_name} created, skipping update and delete.")
+            continue
+        # The warmup rows were created too, update and delete them all.
+        record(
+            entity_name,
+            "update",
+            runner.run(
+                lambda index: (
+                    "PUT",
+                    f"{url}/update/{created_ids[index % len(created_ids)]}/",
+                    {"attributes": {"benchmark": index}},
+                ),
+                requests,
+            ),
+        )
+        record(
+            entity_name,
+            "delete",
+            runner.run(
+                lambda index: (
+                    "DELETE",
+                    f"{url}/delete/{created_ids[index % len(created_ids)]}"
+                    "?deleted_by=benchmark",
+                    None,
+                ),
+                requests,
+            ),
+        )
+
+    user_count = data.user_count
+    record(
+        "authentication",
+        "login",
+        runner.run(
+            lambda index: (
+                "POST",
+                "/authenticate/login",
+                {"email": f"user{index % user_count}@example.com", "password": SYNTHETIC_PASSWORD},
+            ),
+            args.requests,
+        ),
+    )
+    with open(args.worker_output, "w", encoding="utf-8") as f:
+        json.dump(results, f)
+
+
+def _make_create_body(row_template, id_column_name, unique_columns, index):
+    """Create request of a copy of the template row, unique columns made
+    unique with the benchmark index. The API generates the id."""
+    suffix = CREATED_INDEX_OFFSET + index
+    body = {
+        column: _to_json_value(value)
+        for column, value in row_template.items()
+        if column not in SERVER_COLUMNS and column != id_column_name
+    }
+    for column in unique_columns:
+        if column == "email":
+            body[column] = f"benchmark{suffix}@example.com"
+        elif body.get(column) is not None:
+            body[column] = f"{body[column]}-{suffix}"
+    return body
+
+
+# endregion
+
+
+# region runner
+
+
+def get_database(data_dir, seed, scale, regenerate=False):
+    """Path of the generated database of (seed, scale), generated when
+    missing."""
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    database_path = data_dir / f"synthetic_seed{seed}_scale{scale:g}.db"
+    if database_path.exists() and not regenerate:
+        return database_path
+    partial_path = database_path.with_suffix(".partial.db")
+    for path in data_dir.glob(f"{partial_path.name}*"):
+        path.unlink()
+    print(f"Generating scale {scale:g} into {database_path}", flush=True)
+    subprocess.run(
+        [
+            sys.executable,
+            str(scripts_path / "generate_data.py"),
+            "--seed", str(seed),
+            "--scale", str(scale),
+        ],
+        env={**os.environ, "SQLITE_DB_PATH": str(partial_path), "LOG_LEVEL": "WARNING"},
+        check=True,
+    )
+    partial_path.replace(database_path)
+    return database_path
+
+
+def run_scale(args, scale):
+    database_path = get_database(args.data_dir, args.seed, scale, args.regenerate)
+    with tempfile.TemporaryDirectory() as work_dir:
+        # The benchmark writes rows, keep the generated database untouched.
+        work_database_path = Path(work_dir) / "benchmark.db"
+        shutil.copyfile(database_path, work_database_path)
+        worker_output = Path(work_dir) / "results.json"
+        print(f"Scale {scale:g}", flush=True)
+        subprocess.run(
+            [
+                sys.executable,
+                str(Path(__file__).resolve()),
+                "--worker",
+                "--worker-output", str(worker_output),
+                "--seed", str(args.seed),
+                "--scale", str(scale),
+                "--entities", ",".join(args.entities),
+                "--requests", str(args.requests),
+                "--concurrency", str(args.concurrency),
+            ],
+            env={
+                **os.environ,
+                "SQLITE_DB_PATH": str(work_database_path),
+                "LOG_LEVEL": args.log_level,
+            },
+            check=True,
+        )
+        table_rows = get_table_rows(database_path)
+        with open(worker_output, encoding="utf-8") as f:
+            results = json.load(f)
+    for result in results:
+        result["scale"] = scale
+    return {"scale": scale, "table_rows": table_rows}, results
+
+
+def get_git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=scripts_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(previous_path, config, results, threshold):
+    """Print the change of every operation against an earlier results file,
+    returns the regressed (scale, entity, operation) keys. Failed operations
+    are not compared, a failure new in this run counts as a regression."""
+    with open(previous_path, encoding="utf-8") as f:
+        previous_run = json.load(f)
+    previous_results = {
+        (result["scale"], result["entity"], result["operation"]): result
+        for result in previous_run["results"]
+    }
+    regressions = []
+    print(f"\nCompared with {previous_path} (threshold {threshold:g}%)")
+    if previous_run["config"] != config:
+        print(f"Configurations differ: {previous_run['config']} then {config}")
+    print(f"{'scale':<7}{'entity':<18}{'operation':<22}{'p95 ms':<29}{'req/s'}")
+    for result in results:
+        key = (result["scale"], result["entity"], result["operation"])
+        previous = previous_results.get(key)
+        if previous is None:
+            continue
+        if _is_failed(result) or _is_failed(previous):
+            regressed = _is_failed(result) and not _is_failed(previous)
+            if regressed:
+                regressions.append(key)
+            print(
+                f"{result['scale']:<7g}{result['entity']:<18}{result['operation']:<22}"
+                f"failed {_get_failed_label(previous)} -> {_get_failed_label(result)}"
+                + ("  REGRESSION" if regressed else "")
+            )
+            continue
+        p95_change = _get_change(previous["latency_ms"]["p95"], result["latency_ms"]["p95"])
+        throughput_change = _get_change(previous["throughput_rps"], result["throughput_rps"])
+        regressed = p95_change > threshold or throughput_change < -threshold
+        if regressed:
+            regressions.append(key)
+        print(
+            f"{result['scale']:<7g}{result['entity']:<18}{result['operation']:<22}"
+            f"{previous['latency_ms']['p95']:>9} -> {result['latency_ms']['p95']:<9}"
+            f"{p95_change:>+5.0f}%  "
+            f"{previous['throughput_rps']:>9} -> {result['throughput_rps']:<9}"
+            f"{throughput_change:>+5.0f}%"
+            + ("  REGRESSION" if regressed else "")
+        )
+    return regressions
+
+
+def _is_failed(result):
+    # Results files written before "failed" existed only have status codes.
+    return result.get("failed", any(
+        not status_code.startswith("2") for status_code in result["status_codes"]
+    ))
+
+
+def _get_failed_label(result):
+    failed_requests = result.get("failed_requests", sum(
+        count
+        for status_code, count in result["status_codes"].items()
+        if not status_code.startswith("2")
+    ))
+    return f"{failed_requests}/{result['requests']}"
+
+
+def _get_change(previous, current):
+    if not previous or current is None:
+        return 0.0
+    return (current - previous) / previous * 100
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help="generate_data.py scales")
+    parser.add_argument("--entities", default=DEFAULT_ENTITIES, help="comma separated, or all")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--data-dir", default=str(DEFAULT_DATA_DIR))
+    parser.add_argument("--regenerate", action="store_true", help="generate the databases again")
+    parser.add_argument("--output", help="results file, default research/results/")
+    parser.add_argument("--compare", help="earlier results file to compare with")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent")
+    parser.add_argument("--log-level", default="WARNING", help="LOG_LEVEL of the app")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--worker-output", help=argparse.SUPPRESS)
+    parser.add_argument("--scale", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.entities == "all":
+        sys.path.append(str(code_path))
+        import management.entities as entities
+
+        args.entities = [
+            getattr(entities, entity).__tablename__ for entity in entities.__all__
+        ]
+    else:
+        args.entities = [entity for entity in args.entities.split(",") if entity]
+
+    if args.worker:
+        run_worker(args)
+        return
+
+    started_at = datetime.now(timezone.utc)
+    datasets = []
+    results = []
+    for scale in (float(scale) for scale in args.scales.split(",") if scale.strip()):
+        dataset, scale_results = run_scale(args, scale)
+        datasets.append(dataset)
+        results += scale_results
+
+    output_path = Path(
+        args.output
+        or RESULTS_PATH / f"benchmark_api_{started_at.strftime('%Y%m%dT%H%M%SZ')}.json"
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    config = {
+        "seed": args.seed,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "entities": args.entities,
+        "log_level": args.log_level,
+    }
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "started_at": started_at.isoformat(),
+                "git_commit": get_git_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "config": config,
+                "datasets": datasets,
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"\nResults written to {output_path}")
+    failed_results = [result for result in results if result["failed"]]
+    for result in failed_results:
+        print(
+            f"Failed: scale {result['scale']:g} {result['entity']} "
+            f"{result['operation']} {result['status_codes']}"
+        )
+    regressions = []
+    if args.compare:
+        regressions = compare_results(args.compare, config, results, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} operations regressed.")
+    if failed_results or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Encoding time of a get_limited_users response, per JSON provider.
+
+Usage (from the repository root):
+    python research/scripts/benchmark_json.py [--iterations 200]
+
+Builds the response of /api/user/get_limited_records/ for 10, 100 and 1000
+users, as EntityApi.get_limited returns it (to_dict rows with datetimes and
+the attributes JSON), and times jsonify through Flask's default provider
+and through FastJSONProvider (orjson, HTTP and ISO dates).
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+code_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "code"))
+sys.path.append(code_path)
+
+from flask import Flask  # noqa: E402
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+
+import infra.json_provider as json_provider  # noqa: E402
+from infra.json_provider import FastJSONProvider  # noqa: E402
+
+ROW_COUNTS = (10, 100, 1000)
+USER_COLUMNS = [
+    "user_id", "username", "name", "email", "contact_number", "is_active",
+    "is_verified", "attributes", "created_at", "created_by", "modified_at",
+    "modified_by", "deleted_at", "deleted_by",
+]
+
+
+def build_response(rows):
+    created_at = datetime(2025, 9, 3, 3, 50, 37)
+    records = [
+        {
+            "user_id": str(uuid.uuid4()),
+            "username": f"user{index}",
+            "name": f"Benchmark User {index}",
+            "email": f"user{index}@example.com",
+            "contact_number": f"98765{index:05d}",
+            "is_active": True,
+            "is_verified": index % 2 == 0,
+            "attributes": {"theme": "dark", "language": "en", "logins": index},
+            "created_at": created_at + timedelta(minutes=index),
+            "created_by": "seed",
+            "modified_at": created_at + timedelta(minutes=index, seconds=30),
+            "modified_by": None,
+            "deleted_at": None,
+            "deleted_by": None,
+        }
+        for index in range(rows)
+    ]
+    return {
+        "code": 200,
+        "status": True,
+        "msg": "Limited users fetched successfully",
+        "records": records,
+        "columns_list": USER_COLUMNS,
+        "next_cursor": None,
+    }
+
+
+def time_encoding(app, response, iterations):
+    with app.app_context():
+        app.json.response(response)
+        started_at = time.perf_counter()
+        for _ in range(iterations):
+            app.json.response(response)
+        return (time.perf_counter() - started_at) / iterations * 1000
+
+
+def main(iterations):
+    default_app = Flask("default_provider")
+    default_app.json = DefaultJSONProvider(default_app)
+    fast_app = Flask("fast_provider")
+    fast_app.json = FastJSONProvider(fast_app)
+    if json_provider.orjson is None:
+        print("orjson is not installed, FastJSONProvider falls back to stdlib json")
+
+    print("Rows    default ms   orjson ms   orjson iso ms   speedup")
+    for rows in ROW_COUNTS:
+        response = build_response(rows)
+        default_ms = time_encoding(default_app, response, iterations)
+        fast_ms = time_encoding(fast_app, response, iterations)
+        iso_ms = fast_ms
+        if json_provider.orjson is not None:
+            http_options = json_provider.ORJSON_OPTIONS
+            json_provider.ORJSON_OPTIONS = (
+                http_options
+                & ~json_provider.orjson.OPT_PASSTHROUGH_DATETIME
+                | json_provider.orjson.OPT_NAIVE_UTC
+            )
+            iso_ms = time_encoding(fast_app, response, iterations)
+            json_provider.ORJSON_OPTIONS = http_options
+        print(
+            f"{rows:<7} {default_ms:10.3f} {fast_ms:11.3f} {iso_ms:15.3f}"
+            f" {default_ms / fast_ms:8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    main(parser.parse_args().iterations)
@@ -0,0 +1,103 @@
+"""Per-request logging overhead, eager f-strings against lazy summaries.
+
+Usage (from the repository root):
+    python research/scripts/benchmark_logging.py [--rows 1000] [--requests 200]
+
+1. Message construction: the old `logger.debug(f"... {payload}")` call over a
+   listing payload against `logger.opt(lazy=True).debug(..., summarize)`, with
+   the handler at WARNING (message dropped) and at DEBUG (message written).
+2. End to end: GET /api/user/get_limited_records/ through the Flask test client
+   at both levels.
+
+Log output goes to a sink that discards it, so only building the messages is
+measured, not disk or terminal speed.
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+
+code_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "code"))
+sys.path.append(code_path)
+os.chdir(code_path)
+
+from infra.logging import logger, summarize  # noqa: E402
+from utils.constants import LOG_DEBUG, LOG_WARNING  # noqa: E402
+
+
+def use_null_sink(level):
+    logger.remove()
+    logger.add(lambda message: None, level=level)
+
+
+def build_payload(rows):
+    users = [
+        {
+            "user_id": str(uuid.uuid4()),
+            "first_name": "Benchmark",
+            "last_name": f"User {index}",
+            "email": f"benchmark.user.{index}@example.com",
+            "attributes": {"theme": "dark", "language": "en"},
+        }
+        for index in range(rows)
+    ]
+    return {"query_params": {"limit": [str(rows)]}, "db_session": object(), "users": users}
+
+
+def eager_log(payload):
+    logger.debug(f"Entity: user, Operation: get_limited_records, Payload: {payload}")
+    logger.success(f"Users fetched: {payload['users']}")
+
+
+def lazy_log(payload):
+    logger.opt(lazy=True).debug(
+        "Entity: {}, Operation: {}, Payload: {}",
+        lambda: "user",
+        lambda: "get_limited_records",
+        lambda: summarize(payload),
+    )
+    logger.opt(lazy=True).success(
+        "Users fetched: {}", lambda: summarize(payload["users"])
+    )
+
+
+def time_calls(function, iterations):
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - started_at) / iterations * 1000
+
+
+def benchmark_messages(rows, iterations):
+    payload = build_payload(rows)
+    print(f"Message construction, {rows} rows, ms per request:")
+    for level in (LOG_WARNING, LOG_DEBUG):
+        use_null_sink(level)
+        eager_ms = time_calls(lambda: eager_log(payload), iterations)
+        lazy_ms = time_calls(lambda: lazy_log(payload), iterations)
+        print(f"  {level:<8} eager {eager_ms:8.3f}   lazy {lazy_ms:8.3f}")
+
+
+def benchmark_requests(rows, iterations):
+    import app as app_module
+
+    client = app_module.app.test_client()
+    url = f"/api/user/get_limited_records/?limit={rows}"
+    print(f"GET {url}, ms per request:")
+    for level in (LOG_WARNING, LOG_DEBUG):
+        use_null_sink(level)
+        client.get(url, base_url="https://localhost")
+        request_ms = time_calls(
+            lambda: client.get(url, base_url="https://localhost"), iterations
+        )
+        print(f"  {level:<8} {request_ms:8.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200)
+    arguments = parser.parse_args()
+    benchmark_messages(arguments.rows, arguments.requests)
+    benchmark_requests(arguments.rows, arguments.requests)
@@ -0,0 +1,634 @@
+"""Synthetic data of every table, at a configurable scale, for load tests.
+
+Usage (from the repository root):
+    python research/scripts/generate_data.py [--seed 42] [--scale 1]
+        [--orders-per-user 3] [--product-skew 1.1] [--user-skew 0.8]
+        [--output DIR] [--rebuild-indexes]
+
+A scale of 1 is 10k users, 5k products, 30k orders and ~320k rows overall;
+rows grow linearly with it (--scale 10 gives ~3.2M rows). The same seed and
+options always give the same rows.
+
+Data is consistent across tables: addresses, a cart and orders per user,
+order totals adding up their items, shipping fee and discount, one payment
+per order, shipping of the shipped orders, reviews of delivered items by
+their buyer, audit logs of the order changes and a three level category
+tree. Products ordered and users ordering follow a Zipf law (--product-skew,
+--user-skew, 0 is uniform) so there are hot products and power users.
+
+Rows are loaded through the bulk path of seed_data.py, or written as
+<table>.ndjson files to --output for seed_data.py to load later. Either way
+the base tables load first and their sqlite full-text indexes are built once,
+after the last table, by `seed_data.rebuild_search_indexes`.
+"""
+import argparse
+import bisect
+import itertools
+import json
+import math
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from seed_data import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_COMMIT_ROWS,
+    load_tables,
+)
+
+DEFAULT_SEED = 42
+# Rows at scale 1.
+BASE_USERS = 10000
+BASE_PRODUCTS = 5000
+BASE_BRANDS = 200
+BASE_COUPONS = 100
+# Categories per level of the tree: roots, children per root, grandchildren
+# per child. Products belong to the leaves.
+CATEGORY_FANOUT = (10, 5, 4)
+# Upper bounds of the child rows per parent, also used to derive their ids.
+MAX_ADDRESSES = 3
+MAX_IMAGES = 4
+MAX_CART_ITEMS = 5
+MAX_ORDER_ITEMS = 5
+AUDIT_LOGS_PER_ORDER = 2
+
+# Password of every synthetic user, to log in with during load tests.
+SYNTHETIC_PASSWORD = "Synthetic@123"
+CREATED_BY = "synthetic"
+
+# Tables in load order (parents first), their position is part of the ids.
+TABLE_NAMES = [
+    "user",
+    "brand",
+    "category",
+    "coupon",
+    "address_book",
+    "cart",
+    "product",
+    "product_inventory",
+    "product_image",
+    "cart_item",
+    "order",
+    "order_item",
+    "payment",
+    "shipping",
+    "review",
+    "audit_log",
+]
+TABLE_CODES = {table_name: code for code, table_name in enumerate(TABLE_NAMES, 1)}
+
+ORDER_STATUSES = ["delivered", "shipped", "processing", "pending", "cancelled"]
+ORDER_STATUS_WEIGHTS = [60, 15, 10, 10, 5]
+PAYMENT_METHODS = ["credit_card", "debit_card", "upi", "net_banking", "wallet"]
+COURIERS = ["BlueDart", "Delhivery", "DHL", "FedEx", "Ekart"]
+WAREHOUSES = ["Mumbai", "Delhi", "Bengaluru", "Chennai", "Kolkata"]
+RATING_WEIGHTS = [5, 7, 13, 30, 45]  # ratings 1 to 5
+FIRST_NAMES = [
+    "Aarav", "Ananya", "Arjun", "Diya", "Ishaan", "Kavya", "Meera", "Neha",
+    "Priya", "Rahul", "Rohan", "Sanya", "Tara", "Vikram", "Zoya", "John",
+]
+LAST_NAMES = [
+    "Sharma", "Verma", "Gupta", "Iyer", "Khan", "Mehta", "Nair", "Patel",
+    "Reddy", "Singh", "Das", "Kapoor", "Joshi", "Rao", "Doe", "Smith",
+]
+CITIES = [
+    ("Mumbai", "MH"), ("Delhi", "DL"), ("Bengaluru", "KA"), ("Chennai", "TN"),
+    ("Kolkata", "WB"), ("Pune", "MH"), ("Hyderabad", "TS"), ("Jaipur", "RJ"),
+]
+ADJECTIVES = [
+    "Classic", "Smart", "Portable", "Wireless", "Premium", "Compact", "Ultra",
+    "Eco", "Pro", "Lite", "Deluxe", "Rugged",
+]
+NOUNS = [
+    "Phone", "Laptop", "Headphones", "Watch", "Camera", "Speaker", "Backpack",
+    "Shoes", "Jacket", "Blender", "Lamp", "Chair", "Bottle", "Keyboard",
+]
+
+
+class ZipfSampler:
+    """Draws indexes in range(size) with the weight of rank r being
+    1 / r ** exponent. Ranks are shuffled, so the hot indexes are spread out
+    rather than the first ones."""
+
+    def __init__(self, size, exponent, rng):
+        self.indexes = list(range(size))
+        rng.shuffle(self.indexes)
+        self.cumulative_weights = list(
+            itertools.accumulate(1 / (rank ** exponent) for rank in range(1, size + 1))
+        )
+        self.total_weight = self.cumulative_weights[-1]
+
+    def sample(self, rng):
+        rank = bisect.bisect(self.cumulative_weights, rng.random() * self.total_weight)
+        return self.indexes[min(rank, len(self.indexes) - 1)]
+
+
+class SyntheticData:
+    """Deterministic rows of every table.
+
+    Each row derives from (seed, table, index) only: ids are built from the
+    table code and the index, and the random choices of an entity come from
+    its own Random, so every table is generated in one streaming pass and
+    still agrees with the others (e.g. the order items of an order are
+    drawn again, identically, when the order total is computed).
+
+    Args:
+        seed (int): seed of every random choice.
+        scale (float): multiplier of the BASE_* cardinalities.
+        orders_per_user (float): average orders per user.
+        product_skew (float): Zipf exponent of the products ordered and put
+            in carts.
+        user_skew (float): Zipf exponent of the users placing orders.
+        review_rate (float): share of the delivered items reviewed.
+        deleted_rate (float): share of the products and reviews soft deleted.
+        end_date (datetime): latest creation date, rows spread over the days
+            before it.
+        days (int): days covered by the data.
+    """
+
+    def __init__(
+        self,
+        seed=DEFAULT_SEED,
+        scale=1.0,
+        orders_per_user=3.0,
+        product_skew=1.1,
+        user_skew=0.8,
+        review_rate=0.2,
+        deleted_rate=0.01,
+        end_date=datetime(2025, 1, 1),
+        days=365,
+    ):
+        self.seed = seed
+        self.user_count = max(1, round(BASE_USERS * scale))
+        self.product_count = max(1, round(BASE_PRODUCTS * scale))
+        self.brand_count = max(1, round(BASE_BRANDS * scale))
+        self.coupon_count = max(1, round(BASE_COUPONS * scale))
+        self.order_count = round(self.user_count * orders_per_user)
+        self.review_rate = review_rate
+        self.deleted_rate = deleted_rate
+        self.start_date = end_date - timedelta(days=days)
+        self.seconds = days * 86400
+
+        roots, children, grandchildren = CATEGORY_FANOUT
+        self.category_count = roots + roots * children + roots * children * grandchildren
+        self.leaf_categories = range(roots + roots * children, self.category_count)
+
+        rng = random.Random(seed)
+        self.user_sampler = ZipfSampler(self.user_count, user_skew, rng)
+        self.product_sampler = ZipfSampler(self.product_count, product_skew, rng)
+        self.brand_sampler = ZipfSampler(self.brand_count, 1.0, rng)
+        # Order items need the product prices, draw them once.
+        self.prices = [
+            max(1.0, round(math.exp(rng.gauss(3.5, 1.0)), 2))
+            for _ in range(self.product_count)
+        ]
+
+    # region helpers
+
+    def make_id(self, table_name, index):
+        return str(uuid.UUID(int=(TABLE_CODES[table_name] << 96) | index))
+
+    def get_rng(self, table_name, index):
+        return random.Random(hash((self.seed, TABLE_CODES[table_name], index)))
+
+    def get_date(self, rng, after=None):
+        if after is None:
+            return self.start_date + timedelta(seconds=rng.randrange(self.seconds))
+        return after + timedelta(seconds=rng.randrange(60, 3 * 86400))
+
+    def base_columns(self, created_at, rng=None):
+        columns = {
+            "created_at": created_at,
+            "created_by": CREATED_BY,
+            "modified_at": created_at,
+            "attributes": {},
+        }
+        if rng is not None and rng.random() < self.deleted_rate:
+            columns["deleted_at"] = created_at + timedelta(days=1)
+            columns["deleted_by"] = CREATED_BY
+        return columns
+
+    def get_order_plan(self, order_index):
+        """(user index, created_at, status, [(product index, quantity)],
+        shipping fee, discount) of an order."""
+        rng = self.get_rng("order", order_index)
+        user_index = self.user_sampler.sample(rng)
+        created_at = self.get_date(rng)
+        status = rng.choices(ORDER_STATUSES, ORDER_STATUS_WEIGHTS)[0]
+        items = {}
+        for _ in range(rng.randint(1, MAX_ORDER_ITEMS)):
+            items.setdefault(self.product_sampler.sample(rng), rng.randint(1, 3))
+        subtotal = sum(self.prices[product] * quantity for product, quantity in items.items())
+        shipping_fee = 0.0 if subtotal >= 50 else 4.99
+        discount = round(subtotal * 0.1, 2) if rng.random() < 0.1 else 0.0
+        return user_index, created_at, status, list(items.items()), shipping_fee, discount
+
+    # endregion
+
+    # region tables
+
+    def iter_users(self):
+        for index in range(self.user_count):
+            rng = self.get_rng("user", index)
+            first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            yield {
+                "user_id": self.make_id("user", index),
+                "username": f"user{index}",
+                "password": SYNTHETIC_PASSWORD,
+                "name": f"{first_name} {last_name}",
+                "email": f"user{index}@example.com",
+                "contact_number": f"9{index:09d}",
+                "is_active": rng.random() < 0.98,
+                "is_verified": rng.random() < 0.8,
+                **self.base_columns(self.get_date(rng)),
+            }
+
+    def iter_brands(self):
+        for index in range(self.brand_count):
+            rng = self.get_rng("brand", index)
+            yield {
+                "brand_id": self.make_id("brand", index),
+                "name": f"Brand {index}",
+                "description": f"{rng.choice(ADJECTIVES)} goods by brand {index}",
+                **self.base_columns(self.get_date(rng)),
+            }
+
+    def iter_categories(self):
+        roots, children, grandchildren = CATEGORY_FANOUT
+        for index in range(self.category_count):
+            rng = self.get_rng("category", index)
+            if index < roots:
+                parent_index = None
+            elif index < roots + roots * children:
+                parent_index = (index - roots) // children
+            else:
+                parent_index = roots + (index - roots - roots * children) // grandchildren
+            yield {
+                "category_id": self.make_id("category", index),
+                "name": f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}s {index}",
+                "slug": f"category-{index}",
+                "parent_category_id": (
+                    None if parent_index is None else self.make_id("category", parent_index)
+                ),
+                "description": f"Category {index}",
+                **self.base_columns(self.start_date),
+            }
+
+    def iter_coupons(self):
+        for index in range(self.coupon_count):
+            rng = self.get_rng("coupon", index)
+            valid_from = self.get_date(rng)
+            usage_limit = rng.choice([None, 100, 1000])
+            yield {
+                "coupon_id": self.make_id("coupon", index),
+                "code": f"SAVE{index:06d}",
+                "discount_value": float(rng.choice([5, 10, 15, 20, 25])),
+                "min_order_value": float(rng.choice([0, 25, 50, 100])),
+                "max_discount": float(rng.choice([10, 25, 50])),
+                "valid_from": valid_from,
+                "valid_to": valid_from + timedelta(days=rng.choice([7, 30, 90])),
+                "is_active": rng.random() < 0.7,
+                "usage_limit": usage_limit,
+                "usage_count": rng.randint(0, usage_limit or 500),
+                **self.base_columns(valid_from),
+            }
+
+    def iter_address_books(self):
+        for user_index in range(self.user_count):
+            rng = self.get_rng("address_book", user_index)
+            created_at = self.get_date(rng)
+            for position in range(rng.randint(1, MAX_ADDRESSES)):
+                city, state = rng.choice(CITIES)
+                yield {
+                    "address_book_id": self.get_address_id(user_index, position),
+                    "user_id": self.make_id("user", user_index),
+                    "address_line1": f"{rng.randint(1, 999)} {rng.choice(LAST_NAMES)} Street",
+                    "address_line2": rng.choice([None, f"Flat {rng.randint(1, 99)}"]),
+                    "city": city,
+                    "state": state,
+                    "country": "India",
+                    "zip_code": f"{rng.randint(100000, 999999)}",
+                    "is_default": position == 0,
+                    **self.base_columns(created_at),
+                }
+
+    def get_address_id(self, user_index, position):
+        # Every user has the default address, position 0.
+        return self.make_id("address_book", user_index * MAX_ADDRESSES + position)
+
+    def iter_carts(self):
+        for user_index in range(self.user_count):
+            yield {
+                "cart_id": self.make_id("cart", user_index),
+                "user_id": self.make_id("user", user_index),
+                **self.base_columns(self.get_date(self.get_rng("cart", user_index))),
+            }
+
+    def iter_products(self):
+        for index in range(self.product_count):
+            rng = self.get_rng("product", index)
+            name = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {index}"
+            price = self.prices[index]
+            yield {
+                "product_id": self.make_id("product", index),
+                "name": name,
+                "slug": f"product-{index}",
+                "description": f"{name} from the synthetic catalogue",
+                "brand_id": self.make_id("brand", self.brand_sampler.sample(rng)),
+                "category_id": self.make_id("category", rng.choice(self.leaf_categories)),
+                "price": price,
+                "discount_price": round(price * 0.9, 2) if rng.random() < 0.2 else None,
+                "sku": f"SKU-{index:09d}",
+                "is_active": rng.random() < 0.95,
+                **self.base_columns(self.get_date(rng), rng),
+            }
+
+    def iter_product_inventories(self):
+        for index in range(self.product_count):
+            rng = self.get_rng("product_inventory", index)
+            created_at = self.get_date(rng)
+            yield {
+                "product_inventory_id": self.make_id("product_inventory", index),
+                "product_id": self.make_id("product", index),
+                "stock_quantity": rng.randint(0, 500),
+                "reserved_quantity": rng.randint(0, 20),
+                "warehouse_location": rng.choice(WAREHOUSES),
+                "updated_at": created_at,
+                **self.base_columns(created_at),
+            }
+
+    def iter_product_images(self):
+        for product_index in range(self.product_count):
+            rng = self.get_rng("product_image", product_index)
+            created_at = self.get_date(rng)
+            product_id = self.make_id("product", product_index)
+            for position in range(rng.randint(1, MAX_IMAGES)):
+                yield {
+                    "product_image_id": self.make_id(
+                        "product_image", product_index * MAX_IMAGES + position
+                    ),
+                    "product_id": product_id,
+                    "image_url": f"https://cdn.example.com/products/{product_index}/{position}.jpg",
+                    "alt_text": f"Product {product_index} image {position}",
+                    "is_main": position == 0,
+                    **self.base_columns(created_at),
+                }
+
+    def iter_cart_items(self):
+        for user_index in range(self.user_count):
+            rng = self.get_rng("cart_item", user_index)
+            products = {self.product_sampler.sample(rng) for _ in range(rng.randint(0, MAX_CART_ITEMS))}
+            for position, product_index in enumerate(sorted(products)):
+                added_at = self.get_date(rng)
+                yield {
+                    "cart_item_id": self.make_id(
+                        "cart_item", user_index * MAX_CART_ITEMS + position
+                    ),
+                    "cart_id": self.make_id("cart", user_index),
+                    "product_id": self.make_id("product", product_index),
+                    "quantity": rng.randint(1, 3),
+                    "added_at": added_at,
+                    **self.base_columns(added_at),
+                }
+
+    def iter_orders(self):
+        for index in range(self.order_count):
+            user_index, created_at, status, items, shipping_fee, discount = (
+                self.get_order_plan(index)
+            )
+            subtotal = sum(self.prices[product] * quantity for product, quantity in items)
+            yield {
+                "order_id": self.make_id("order", index),
+                "user_id": self.make_id("user", user_index),
+                "order_number": f"ORD{index:010d}",
+                "total_amount": round(subtotal + shipping_fee - discount, 2),
+                "shipping_fee": shipping_fee,
+                "discount_amount": discount,
+                "payment_status": _get_payment_status(status),
+                "order_status": status,
+                "shipping_address_id": self.get_address_id(user_index, 0),
+                "billing_address_id": self.get_address_id(user_index, 0),
+                **self.base_columns(created_at),
+            }
+
+    def iter_order_items(self):
+        for order_index in range(self.order_count):
+            _, created_at, _, items, _, _ = self.get_order_plan(order_index)
+            order_id = self.make_id("order", order_index)
+            for position, (product_index, quantity) in enumerate(items):
+                unit_price = self.prices[product_index]
+                yield {
+                    "order_item_id": self.make_id(
+                        "order_item", order_index * MAX_ORDER_ITEMS + position
+                    ),
+                    "order_id": order_id,
+                    "product_id": self.make_id("product", product_index),
+                    "quantity": quantity,
+                    "unit_price": unit_price,
+                    "total_price": round(unit_price * quantity, 2),
+                    **self.base_columns(created_at),
+                }
+
+    def iter_payments(self):
+        for order_index in range(self.order_count):
+            rng = self.get_rng("payment", order_index)
+            _, created_at, status, items, shipping_fee, discount = self.get_order_plan(
+                order_index
+            )
+            payment_status = _get_payment_status(status)
+            subtotal = sum(self.prices[product] * quantity for product, quantity in items)
+            yield {
+                "payment_id": self.make_id("payment", order_index),
+                "order_id": self.make_id("order", order_index),
+                "payment_method": rng.choice(PAYMENT_METHODS),
+                "payment_reference": f"PAY{order_index:012d}",
+                "amount": round(subtotal + shipping_fee - discount, 2),
+                "status": {"paid": "success", "refunded": "refunded"}.get(
+                    payment_status, "pending"
+                ),
+                "paid_at": (
+                    None if payment_status == "pending"
+                    else created_at + timedelta(seconds=rng.randint(1, 600))
+                ),
+                **self.base_columns(created_at),
+            }
+
+    def iter_shippings(self):
+        for order_index in range(self.order_count):
+            _, created_at, status, _, _, _ = self.get_order_plan(order_index)
+            if status not in ("shipped", "delivered"):
+                continue
+            rng = self.get_rng("shipping", order_index)
+            shipped_at = self.get_date(rng, after=created_at)
+            yield {
+                "shipping_id": self.make_id("shipping", order_index),
+                "order_id": self.make_id("order", order_index),
+                "courier_name": rng.choice(COURIERS),
+                "tracking_number": f"TRK{order_index:012d}",
+                "status": status,
+                "shipped_at": shipped_at,
+                "delivered_at": (
+                    self.get_date(rng, after=shipped_at) if status == "delivered" else None
+                ),
+                **self.base_columns(created_at),
+            }
+
+    def iter_reviews(self):
+        for order_index in range(self.order_count):
+            user_index, created_at, status, items, _, _ = self.get_order_plan(order_index)
+            if status != "delivered":
+                continue
+            rng = self.get_rng("review", order_index)
+            for position, (product_index, _) in enumerate(items):
+                if rng.random() >= self.review_rate:
+                    continue
+                rating = rng.choices(range(1, 6), RATING_WEIGHTS)[0]
+                yield {
+                    "review_id": self.make_id(
+                        "review", order_index * MAX_ORDER_ITEMS + position
+                    ),
+                    "user_id": self.make_id("user", user_index),
+                    "product_id": self.make_id("product", product_index),
+                    "rating": rating,
+                    "comment": f"Rated {rating} out of 5",
+                    **self.base_columns(self.get_date(rng, after=created_at), rng),
+                }
+
+    def iter_audit_logs(self):
+        for order_index in range(self.order_count):
+            user_index, created_at, status, items, shipping_fee, discount = (
+                self.get_order_plan(order_index)
+            )
+            user_id = self.make_id("user", user_index)
+            order_id = self.make_id("order", order_index)
+            yield {
+                "audit_log_id": self.make_id("audit_log", order_index * AUDIT_LOGS_PER_ORDER),
+                "entity_type": "order",
+                "entity_id": order_id,
+                "action": "create",
+                "user_id": user_id,
+                "old_data": None,
+                "new_data": {"order_status": "pending", "items": len(items)},
+                **self.base_columns(created_at),
+            }
+            if status != "pending":
+                yield {
+                    "audit_log_id": self.make_id(
+                        "audit_log", order_index * AUDIT_LOGS_PER_ORDER + 1
+                    ),
+                    "entity_type": "order",
+                    "entity_id": order_id,
+                    "action": "update",
+                    "user_id": user_id,
+                    "old_data": {"order_status": "pending"},
+                    "new_data": {"order_status": status},
+                    **self.base_columns(created_at + timedelta(hours=1)),
+                }
+
+    def iter_tables(self, table_names=None):
+        """(table name, row iterator) of every table, parents first."""
+        table_rows = {
+            "user": self.iter_users,
+            "brand": self.iter_brands,
+            "category": self.iter_categories,
+            "coupon": self.iter_coupons,
+            "address_book": self.iter_address_books,
+            "cart": self.iter_carts,
+            "product": self.iter_products,
+            "product_inventory": self.iter_product_inventories,
+            "product_image": self.iter_product_images,
+            "cart_item": self.iter_cart_items,
+            "order": self.iter_orders,
+            "order_item": self.iter_order_items,
+            "payment": self.iter_payments,
+            "shipping": self.iter_shippings,
+            "review": self.iter_reviews,
+            "audit_log": self.iter_audit_logs,
+        }
+        for table_name in TABLE_NAMES:
+            if not table_names or table_name in table_names:
+                yield table_name, table_rows[table_name]()
+
+    # endregion
+
+
+def _get_payment_status(order_status):
+    if order_status == "pending":
+        return "pending"
+    if order_status == "cancelled":
+        return "refunded"
+    return "paid"
+
+
+def write_tables(table_rows, output_path):
+    """Write every table as <table>.ndjson in output_path, returns the rows
+    written."""
+    output_path = Path(output_path)
+    output_path.mkdir(parents=True, exist_ok=True)
+    total_rows = 0
+    for table_name, rows in table_rows:
+        started_at = time.perf_counter()
+        written_rows = 0
+        with open(output_path / f"{table_name}.ndjson", "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, default=str))
+                f.write("\n")
+                written_rows += 1
+        total_rows += written_rows
+        print(
+            f"{table_name}: {written_rows} rows written in "
+            f"{time.perf_counter() - started_at:.2f}s"
+        )
+    return total_rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic data.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--orders-per-user", type=float, default=3.0)
+    parser.add_argument("--product-skew", type=float, default=1.1)
+    parser.add_argument("--user-skew", type=float, default=0.8)
+    parser.add_argument("--review-rate", type=float, default=0.2)
+    parser.add_argument("--deleted-rate", type=float, default=0.01)
+    parser.add_argument(
+        "--end-date",
+        type=datetime.fromisoformat,
+        default=datetime(2025, 1, 1),
+        help="latest creation date (ISO 8601)",
+    )
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--tables", help="comma separated tables to generate, default all")
+    parser.add_argument("--output", help="write NDJSON files here instead of loading")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--commit-rows", type=int, default=DEFAULT_COMMIT_ROWS)
+    parser.add_argument("--rebuild-indexes", action="store_true")
+    args = parser.parse_args(argv)
+
+    data = SyntheticData(
+        seed=args.seed,
+        scale=args.scale,
+        orders_per_user=args.orders_per_user,
+        product_skew=args.product_skew,
+        user_skew=args.user_skew,
+        review_rate=args.review_rate,
+        deleted_rate=args.deleted_rate,
+        end_date=args.end_date,
+        days=args.days,
+    )
+    table_rows = data.iter_tables(set(args.tables.split(",")) if args.tables else None)
+    if args.output:
+        write_tables(table_rows, args.output)
+    else:
+        load_tables(
+            table_rows,
+            batch_size=args.batch_size,
+            commit_rows=args.commit_rows,
+            rebuild_indexes=args.rebuild_indexes,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,55 @@
-import os
+"""Bulk loader of the seed data.
+
+Usage (from the repository root):
+    python research/scripts/seed_data.py [path] [--batch-size 5000]
+        [--commit-rows 100000] [--tables user,product] [--rebuild-indexes]
+        [--ignore-existing]
+
+path is research/data/seed_data_2.json by default and can be:
+    - a JSON object of table name -> list of rows, like seed_data_2.json,
+    - a <table>.json (list of rows), <table>.ndjson / <table>.jsonl (one row
+      per line) or <table>.csv file,
+    - a directory of such per-table files.
+
+Input is streamed, never read whole: rows are converted and inserted
+batch_size at a time with one executemany, and committed every commit_rows.
+Tables load parent first (foreign key order); tables of a JSON object that
+arrive before their parents are spooled to a temporary NDJSON file until the
+parents are in. --rebuild-indexes drops the secondary indexes of the loaded
+tables and creates them again after the load, which is faster than keeping
+them up to date row by row on large loads. The sqlite full-text tables of the
+loaded tables are always filled once at the end, from the table contents.
+"""
+import argparse
+import csv
 import json
-import uuid
+import os
 import sys
-import bcrypt
+import tempfile
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 
 from flask import Flask
 from dotenv import load_dotenv
+from sqlalchemy import Boolean, DateTime, Float, Integer, JSON, Numeric, inspect
+from sqlalchemy.orm import Session
 
 # Setup code path
 code_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "code"))
 sys.path.append(code_path)
 
 # Import shared db and models
-from infra.database import db
-from infra.environment import SQLALCHEMY_DATABASE_URI, SQLALCHEMY_TRACK_MODIFICATIONS
-from management.entities.user.model import User
-from management.entities.product.model import Product
-from management.entities.order.model import Order
-from management.entities.order_item.model import OrderItem
-from management.entities.address_book.model import AddressBook
-from management.entities.category.model import Category
-from management.entities.brand.model import Brand
-from management.entities.product_inventory.model import ProductInventory
-from management.entities.product_image.model import ProductImage
-from management.entities.cart.model import Cart
-from management.entities.cart_item.model import CartItem
-from management.entities.payment.model import Payment
-from management.entities.shipping.model import Shipping
-from management.entities.coupon.model import Coupon
-from management.entities.review.model import Review
-from management.entities.audit_log.model import AuditLog
-
-from utils.utility import get_current_time, string_to_base64
+from infra.database import db  # noqa: E402
+from infra.environment import SQLALCHEMY_DATABASE_URI, SQLALCHEMY_TRACK_MODIFICATIONS  # noqa: E402
+from infra.migrations import upgrade  # noqa: E402
+import management.entities as entities  # noqa: E402
+from management.entities.entity_base.search import (  # noqa: E402
+    is_search_index_ready,
+    rebuild_search_index,
+)
+
+from utils.utility import get_current_time, string_to_base64  # noqa: E402
 
 load_dotenv()
 
@@ -47,342 +64,499 @@ app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = SQLALCHEMY_TRACK_MODIFICATIONS
 
 db.init_app(app)
 
-# Load JSON data
 DATA_FILE = Path(__file__).parent.parent / "data" / "seed_data_2.json"
-
-
-# def seed_users(users_data):
-#     for entry in users_data:
-#         if User.query.filter_by(email=entry["email"]).first():
-#             print(f"User {entry['email']} exists. Skipping.")
-#             continue
-#         user = User(
-#             user_id=str(uuid.uuid4()),
-#             username=entry["username"],
-#             name=entry["name"],
-#             email=entry["email"],
-#             password=entry["password"],
-#             contact_number=entry.get("contact_number"),
-#             address=entry.get("address"),
-#             attributes=entry.get("attributes", {}),
-#             created_at=get_current_time(),
-#             created_by=entry["created_by"],
-#             modified_by=entry["created_by"],
-#         )
-#         db.session.add(user)
-#     print("✅ Users seeded.")
-
-
-# def seed_products(products_data):
-#     for entry in products_data:
-#         if Product.query.filter_by(name=entry["name"], brand=entry["brand"]).first():
-#             print(f"Product {entry['name']} by {entry['brand']} exists. Skipping.")
-#             continue
-#         product = Product(
-#             product_id=str(uuid.uuid4()),
-#             name=entry["name"],
-#             description=entry.get("description"),
-#             price=entry["price"],
-#             brand=entry["brand"],
-#             category=entry["category"],
-#             attributes=entry.get("attributes", {}),
-#             stock_quantity=entry.get("stock_quantity", 0),
-#             created_by=entry["created_by"],
-#             modified_by=entry["created_by"],
-#         )
-#         db.session.add(product)
-#     print("✅ Products seeded.")
-
-
-# def seed_all():
-#     with app.app_context():
-#         db.create_all()
-#         with open(DATA_FILE, "r") as f:
-#             data = json.load(f)
-#         if "users" in data:
-#             seed_users(data["users"])
-#         if "products" in data:
-#             seed_products(data["products"])
-#         db.session.commit()
-#         print("🎉 Seeding complete.")
-
-
-def seed_all():
-    with app.app_context():
-        db.create_all()
-        with open(DATA_FILE, "r") as f:
-            data = json.load(f)
-
-        # # Seed users first
-        # user_ids = seed_users(data.get("users", []))
-        # # Seed products
-        # product_ids = seed_products(data.get("products", []))
-        # # Seed orders
-        # order_ids = seed_orders(data.get("orders", []), user_ids)
-        # # Seed order items
-        # seed_order_items(data.get("order_items", []), order_ids, product_ids)
-
-        # user_ids = seed_users(data.get("users", []))
-        # product_ids = seed_products(data.get("products", []))
-
-        # address_book_ids = seed_address_books(data.get("address_books", []))
-        # category_ids = seed_categories(data.get("categories", []))
-        # product_inventory_ids = seed_product_inventories(data.get("product_inventories", []))
-        # product_image_ids = seed_product_images(data.get("product_images", []))
-        # cart_ids = seed_carts(data.get("carts", []))
-        # cart_item_ids = seed_cart_items(data.get("cart_items", []))
-        # order_ids = seed_orders(data.get("orders", []))
-        # order_item_ids = seed_order_items(data.get("order_items", []))
-        # payment_ids = seed_payments(data.get("payments", []))
-        # shipping_ids = seed_shippings(data.get("shippings", []))
-        # coupon_ids = seed_coupons(data.get("coupons", []))
-        # review_ids = seed_reviews(data.get("reviews", []))
-        # audit_log_ids = seed_audit_logs(data.get("audit_logs", []))
-        # brand_ids = seed_brands(data.get("brands", []))
-
-        table_name_list = {
-            "user": [
-                "user_id",
-                "username",
-                "password",
-                "name",
-                "email",
-                "contact_number",
-                "is_active",
-                "is_verified",
-                "attributes",
-                "created_by",
-                "created_at",
-            ],
-            "address_book": [
-                "address_book_id",
-                "user_id",
-                "address_line1",
-                "address_line2",
-                "city",
-                "state",
-                "country",
-                "zip_code",
-                "is_default",
-                "attributes",
-                # "created_at",
-                "created_by",
-            ],
-            "category": [
-                "category_id",
-                "name",
-                "slug",
-                "parent_category_id",
-                "description",
-                "attributes",
-                # "created_at",
-                "created_by",
-            ],
-            "brand": ["brand_id", "name", "description", "attributes", "created_by"],
-            "product": [
-                "product_id",
-                "name",
-                "slug",
-                "description",
-                "brand_id",
-                "category_id",
-                "price",
-                "discount_price",
-                "sku",
-                "is_active",
-                "attributes",
-                "created_by",
-            ],
-            "product_inventory": [
-                "product_inventory_id",
-                "product_id",
-                "stock_quantity",
-                "reserved_quantity",
-                "warehouse_location",
-                "attributes",
-                "created_by",
-            ],
-            "product_image": [
-                "product_image_id",
-                "product_id",
-                "image_url",
-                "alt_text",
-                "is_main",
-                "attributes",
-                "created_by",
-            ],
-            "cart": ["cart_id", "user_id", "attributes", "created_by"],
-            "cart_item": [
-                "cart_item_id",
-                "cart_id",
-                "product_id",
-                "quantity",
-                "attributes",
-                "created_by",
-            ],
-            "order": [
-                "order_id",
-                "user_id",
-                "order_number",
-                "total_amount",
-                "shipping_fee",
-                "discount_amount",
-                "payment_status",
-                "order_status",
-                "shipping_address_id",
-                "attributes",
-                "created_by",
-            ],
-            "order_item": [
-                "order_item_id",
-                "order_id",
-                "product_id",
-                "quantity",
-                "unit_price",
-                "total_price",
-                "attributes",
-                "created_by",
-            ],
-            "payment": [
-                "payment_id",
-                "order_id",
-                "payment_method",
-                "payment_reference",
-                "amount",
-                "status",
-                "paid_at",
-                "attributes",
-                "created_by",
-            ],
-            "shipping": [
-                "shipping_id",
-                "order_id",
-                "courier_name",
-                "tracking_number",
-                "status",
-                "shipped_at",
-                "delivered_at",
-                "attributes",
-                "created_by",
-            ],
-            "coupon": [
-                "coupon_id",
-                "code",
-                "discount_value",
-                "min_order_value",
-                "max_discount",
-                "valid_from",
-                "valid_to",
-                "is_active",
-                "usage_limit",
-                "usage_count",
-                "attributes",
-                "created_by",
-            ],
-            "review": [
-                "review_id",
-                "user_id",
-                "product_id",
-                "rating",
-                "comment",
-                "attributes",
-                "created_by",
-            ],
-            "audit_log": [
-                "audit_log_id",
-                "entity_type",
-                "entity_id",
-                "action",
-                "user_id",
-                "old_data",
-                "new_data",
-                "attributes",
-                "created_by",
-            ],
+ROW_FILE_SUFFIXES = (".ndjson", ".jsonl", ".csv", ".json")
+DEFAULT_BATCH_SIZE = 5000
+DEFAULT_COMMIT_ROWS = 100000
+# Characters read from a JSON file at a time.
+JSON_CHUNK_SIZE = 1 << 16
+TRUE_STRINGS = ("1", "true", "t", "yes", "y")
+
+ENTITY_CLASSES = {
+    entity_class.__tablename__: entity_class
+    for entity_class in (getattr(entities, entity) for entity in entities.__all__)
+}
+
+
+# region input readers
+
+
+class JsonStream:
+    """Incremental reader of a JSON document of rows.
+
+    Only one row is decoded at a time (json raw_decode over a sliding
+    buffer), so memory does not grow with the file.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.buffer = ""
+        self.position = 0
+        self.decoder = json.JSONDecoder()
+
+    def _read(self):
+        chunk = self.file.read(JSON_CHUNK_SIZE)
+        if not chunk:
+            return False
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def peek(self):
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position].isspace():
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._read():
+                return ""
+
+    def expect(self, characters):
+        character = self.peek()
+        if not character or character not in characters:
+            raise ValueError(
+                f"Expected one of {characters!r} at {self.position}, got {character!r}"
+            )
+        self.position += 1
+        return character
+
+    def decode(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                # The value runs past the buffer, read on.
+                if not self._read():
+                    raise
+                continue
+            self.position = end
+            return value
+
+    def iter_array(self):
+        self.expect("[")
+        if self.peek() == "]":
+            self.position += 1
+            return
+        while True:
+            yield self.decode()
+            if self.expect(",]") == "]":
+                return
+
+    def iter_object_arrays(self):
+        """(key, row iterator) of an object of arrays, each iterator must be
+        consumed before the next one is taken."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.position += 1
+            return
+        while True:
+            key = self.decode()
+            self.expect(":")
+            if self.peek() == "n":
+                self.decode()  # "table": null
+                yield key, iter(())
+            else:
+                rows = self.iter_array()
+                yield key, rows
+                for _ in rows:
+                    pass
+            if self.expect(",}") == "}":
+                return
+
+
+def iter_file_rows(path):
+    path = Path(path)
+    if path.suffix == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    elif path.suffix in (".ndjson", ".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, encoding="utf-8") as f:
+            yield from JsonStream(f).iter_array()
+
+
+def iter_tables(path):
+    """(table name, row iterator) of every table of the input path."""
+    path = Path(path)
+    if path.is_dir():
+        row_files = {
+            row_file.stem: row_file
+            for row_file in sorted(path.iterdir())
+            if row_file.suffix in ROW_FILE_SUFFIXES
         }
-
-        no_params_tables = ["user", "category", "coupon", "brand", "product"]
-        single_params_tables = [
-            "address_book",
-            "order",
-            "cart",
-            "audit_log",
-            "payment",
-            "shipping",
-            "product_inventory",
-            "product_image",
+        # Directories are read parent first, no spooling needed.
+        for table in db.metadata.sorted_tables:
+            if table.name in row_files:
+                yield table.name, iter_file_rows(row_files.pop(table.name))
+        for table_name, row_file in row_files.items():
+            yield table_name, iter_file_rows(row_file)
+        return
+    if path.suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            stream = JsonStream(f)
+            if stream.peek() == "{":
+                yield from stream.iter_object_arrays()
+                return
+    yield path.stem, iter_file_rows(path)
+
+
+# endregion
+
+
+# region row conversion
+
+
+def _parse_datetime(value):
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _get_column_converter(column):
+    """Function turning an input value of the column into its database
+    value, None when the value is taken as is."""
+    if column.name == "password":
+        # Stored base64 encoded, as the login compares it.
+        return lambda value: string_to_base64(value or "")
+    column_type = column.type
+    if isinstance(column_type, DateTime):
+        return lambda value: _parse_datetime(value) if isinstance(value, str) else value
+    if isinstance(column_type, Boolean):
+        return (
+            lambda value: value.strip().lower() in TRUE_STRINGS
+            if isinstance(value, str) else value
+        )
+    if isinstance(column_type, Integer):
+        return lambda value: int(value) if isinstance(value, str) else value
+    if isinstance(column_type, (Float, Numeric)):
+        return lambda value: float(value) if isinstance(value, str) else value
+    if isinstance(column_type, JSON):
+        # CSV cells carry the JSON text.
+        return lambda value: json.loads(value) if isinstance(value, str) else value
+    return None
+
+
+def _get_column_default(column):
+    """Function giving the value of a column missing from an input row.
+
+    executemany needs the same columns in every row, so the model defaults
+    are applied here instead of by the insert.
+    """
+    default = column.default
+    if default is not None and default.is_scalar:
+        value = default.arg
+        return (lambda: dict(value)) if isinstance(value, dict) else (lambda: value)
+    if default is not None and default.is_callable:
+        return lambda: default.arg(None)
+    if isinstance(column.type, DateTime) and (
+        not column.nullable or default is not None
+    ):
+        # created_at and the current_timestamp() defaults.
+        return get_current_time
+    return lambda: None
+
+
+class RowConverter:
+    """Turns input rows of a table into insert parameters holding every
+    column of the table. Keys that are not columns are dropped."""
+
+    def __init__(self, table):
+        self.columns = [
+            (
+                column.name,
+                _get_column_converter(column),
+                _get_column_default(column),
+            )
+            for column in table.columns
         ]
-        double_params_tables = ["cart_item", "order_item", "review"]
-
-        for table_name, table_columns_list in table_name_list.items():
-            if table_name in no_params_tables:
-                seed_all_data(
-                    table_name,
-                    table_columns_list,
-                    data.get(table_name),
-                    to_pascal_case(table_name),
-                )
-
-        for table_name, table_columns_list in table_name_list.items():
-            if table_name in single_params_tables:
-                seed_all_data(
-                    table_name,
-                    table_columns_list,
-                    data.get(table_name),
-                    to_pascal_case(table_name),
-                )
 
-        for table_name, table_columns_list in table_name_list.items():
-            if table_name in double_params_tables:
-                seed_all_data(
-                    table_name,
-                    table_columns_list,
-                    data.get(table_name),
-                    to_pascal_case(table_name),
+    def convert(self, rows):
+        converted_rows = []
+        for row in rows:
+            converted_row = {}
+            for name, converter, default in self.columns:
+                value = row.get(name)
+                if value is None:
+                    converted_row[name] = default()
+                elif converter is None:
+                    converted_row[name] = value
+                elif value == "":
+                    # Empty CSV cell of a typed column.
+                    converted_row[name] = default()
+                else:
+                    converted_row[name] = converter(value)
+            converted_rows.append(converted_row)
+        return converted_rows
+
+
+# endregion
+
+
+# region loading
+
+
+def iter_batches(rows, batch_size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def get_parent_tables(table):
+    return {
+        foreign_key.column.table.name
+        for foreign_key in table.foreign_keys
+        if foreign_key.column.table is not table
+    }
+
+
+def drop_secondary_indexes(session, table):
+    """Drop the non unique indexes of a table, returns them to be created
+    again by `create_indexes`."""
+    connection = session.connection()
+    existing_indexes = {
+        index["name"] for index in inspect(connection).get_indexes(table.name)
+    }
+    foreign_key_columns = {foreign_key.parent.name for foreign_key in table.foreign_keys}
+    dropped_indexes = []
+    for index in table.indexes:
+        if index.unique or index.name not in existing_indexes:
+            continue
+        if (
+            connection.dialect.name == "mysql"
+            and index.expressions[0].name in foreign_key_columns
+        ):
+            # InnoDB refuses to drop the index backing a foreign key.
+            continue
+        index.drop(connection)
+        dropped_indexes.append(index)
+    session.commit()
+    return dropped_indexes
+
+
+def create_indexes(session, indexes):
+    connection = session.connection()
+    for index in indexes:
+        index.create(connection)
+    session.commit()
+
+
+def load_table(
+    session,
+    table,
+    rows,
+    batch_size=DEFAULT_BATCH_SIZE,
+    commit_rows=DEFAULT_COMMIT_ROWS,
+    ignore_existing=False,
+):
+    """Insert rows into a table with one executemany per batch.
+
+    Rows go through `RowConverter`: they may leave out the columns with a
+    default and hold either strings or Python values.
+
+    Returns:
+        int: rows inserted.
+    """
+    converter = RowConverter(table)
+    insert_statement = table.insert()
+    if ignore_existing:
+        insert_statement = insert_statement.prefix_with(
+            "OR IGNORE", dialect="sqlite"
+        ).prefix_with("IGNORE", dialect="mysql")
+
+    inserted_rows = 0
+    uncommitted_rows = 0
+    for batch in iter_batches(rows, batch_size):
+        converted_rows = converter.convert(batch)
+        session.execute(insert_statement, converted_rows)
+        inserted_rows += len(converted_rows)
+        uncommitted_rows += len(converted_rows)
+        if uncommitted_rows >= commit_rows:
+            session.commit()
+            uncommitted_rows = 0
+    session.commit()
+    return inserted_rows
+
+
+def rebuild_search_indexes(session, table_names):
+    """Fill the sqlite fts tables of the loaded tables from their rows, one
+    INSERT ... SELECT per table. Rows skipped by --ignore-existing keep the
+    index of what is actually stored. mysql FULLTEXT indexes need nothing."""
+    if session.get_bind().dialect.name != "sqlite":
+        return
+    for table_name in table_names:
+        entity_class = ENTITY_CLASSES.get(table_name)
+        if entity_class is None or not is_search_index_ready(session, entity_class):
+            continue
+        index_started_at = time.perf_counter()
+        rebuild_search_index(session.connection(), entity_class)
+        session.commit()
+        print(
+            f"{table_name}: search index rebuilt in "
+            f"{time.perf_counter() - index_started_at:.2f}s"
+        )
+
+
+def _spool_rows(rows):
+    spool_file = tempfile.NamedTemporaryFile(
+        "w", suffix=".ndjson", encoding="utf-8", delete=False
+    )
+    with spool_file:
+        for row in rows:
+            spool_file.write(json.dumps(row, default=str))
+            spool_file.write("\n")
+    return Path(spool_file.name)
+
+
+def load_tables(
+    table_rows,
+    batch_size=DEFAULT_BATCH_SIZE,
+    commit_rows=DEFAULT_COMMIT_ROWS,
+    table_names=None,
+    rebuild_indexes=False,
+    ignore_existing=False,
+):
+    """Bulk load (table name, row iterator) pairs, e.g. `iter_tables` of an
+    input path or a data generator.
+
+    Returns:
+        int: rows inserted.
+    """
+    with app.app_context():
+        # create_all only creates missing tables, migrations change existing ones.
+        db.create_all()
+        upgrade(db.engine)
+
+        tables = db.metadata.tables
+        loaded_tables = set()
+        # Tables written to, including one whose load failed part way.
+        written_tables = []
+        spooled_tables = {}
+        dropped_indexes = {}
+        started_at = time.perf_counter()
+        total_rows = 0
+
+        with Session(db.engine) as session:
+
+            def load(table_name, rows):
+                nonlocal total_rows
+                table = tables[table_name]
+                if rebuild_indexes:
+                    dropped_indexes[table_name] = drop_secondary_indexes(session, table)
+                table_started_at = time.perf_counter()
+                written_tables.append(table_name)
+                try:
+                    inserted_rows = load_table(
+                        session, table, rows, batch_size, commit_rows, ignore_existing
+                    )
+                except Exception:
+                    session.rollback()
+                    raise
+                elapsed = time.perf_counter() - table_started_at
+                total_rows += inserted_rows
+                loaded_tables.add(table_name)
+                print(
+                    f"{table_name}: {inserted_rows} rows in {elapsed:.2f}s "
+                    f"({inserted_rows / max(elapsed, 1e-9):,.0f} rows/s)"
                 )
 
-        db.session.commit()
-        print("🎉 Seeding complete.")
-
-
-def to_pascal_case(snake_str):
-    parts = snake_str.strip("_").split("_")
-    return "".join(word.capitalize() for word in parts if word)
-
-
-def seed_all_data(table_name, table_column_list, data_rows, table_class_name):
-    table_class = globals().get(table_class_name)
-    if table_class is None:
-        raise ValueError(f"Class '{table_class_name}' not found in globals()")
-
-    for row in data_rows:  # Loop through each record (dict)
-        payload = {}
-        payload["created_at"] = get_current_time()
-        print(f"===============================================   {table_column_list}")
-        for column in table_column_list:
-            if column == "attributes":
-                payload["attributes"] = row.get("attributes", {})
-            if column == "password":
-                payload["password"] = string_to_base64(row.get("password", ""))
-                # payload["password"] = bcrypt.hashpw(row.get("password", ""), bcrypt.gensalt())
-            elif column in [
-                "paid_at",
-                "shipped_at",
-                "valid_from",
-                "valid_to",
-                "delivered_at",
-                "created_at",
-            ]:
-                payload[column] = get_current_time()
-            else:
-                payload[column] = row.get(column)
-
-        print(f"Seeding: {payload}")
-        obj = table_class(**payload)
-        db.session.add(obj)
-
-    db.session.commit()
+            def is_ready(table_name):
+                return get_parent_tables(tables[table_name]) <= loaded_tables
+
+            def load_spooled(ready_only=True):
+                for table_name in [table.name for table in db.metadata.sorted_tables]:
+                    if table_name in spooled_tables and (
+                        not ready_only or is_ready(table_name)
+                    ):
+                        spool_path = spooled_tables.pop(table_name)
+                        try:
+                            load(table_name, iter_file_rows(spool_path))
+                        finally:
+                            spool_path.unlink()
+
+            try:
+                for table_name, rows in table_rows:
+                    if table_name not in tables:
+                        print(f"Skipping {table_name}: no such table.")
+                        continue
+                    if table_names and table_name not in table_names:
+                        continue
+                    if is_ready(table_name):
+                        load(table_name, rows)
+                        load_spooled()
+                    else:
+                        spooled_tables[table_name] = _spool_rows(rows)
+                # Parents missing from the input: load the rest in order.
+                load_spooled(ready_only=False)
+            finally:
+                for spool_path in spooled_tables.values():
+                    spool_path.unlink()
+                for table_name, indexes in dropped_indexes.items():
+                    index_started_at = time.perf_counter()
+                    create_indexes(session, indexes)
+                    if indexes:
+                        print(
+                            f"{table_name}: {len(indexes)} indexes rebuilt in "
+                            f"{time.perf_counter() - index_started_at:.2f}s"
+                        )
+                rebuild_search_indexes(session, written_tables)
+
+        elapsed = time.perf_counter() - started_at
+        print(
+            f"🎉 Seeding complete: {total_rows} rows in {elapsed:.2f}s "
+            f"({total_rows / max(elapsed, 1e-9):,.0f} rows/s)."
+        )
+        return total_rows
+
+
+def seed_all(path=DATA_FILE, **load_options):
+    return load_tables(iter_tables(path), **load_options)
+
+
+# endregion
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk load seed data.")
+    parser.add_argument("path", nargs="?", default=str(DATA_FILE))
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--commit-rows",
+        type=int,
+        default=DEFAULT_COMMIT_ROWS,
+        help="rows inserted per transaction",
+    )
+    parser.add_argument("--tables", help="comma separated tables to load, default all")
+    parser.add_argument(
+        "--rebuild-indexes",
+        action="store_true",
+        help="drop the secondary indexes during the load and create them after",
+    )
+    parser.add_argument(
+        "--ignore-existing",
+        action="store_true",
+        help="skip rows whose primary or unique keys already exist",
+    )
+    args = parser.parse_args(argv)
+    seed_all(
+        args.path,
+        batch_size=args.batch_size,
+        commit_rows=args.commit_rows,
+        table_names=set(args.tables.split(",")) if args.tables else None,
+        rebuild_indexes=args.rebuild_indexes,
+        ignore_existing=args.ignore_existing,
+    )
 
 
 if __name__ == "__main__":
-    seed_all()
+    main()